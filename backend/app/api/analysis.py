@@ -1,11 +1,14 @@
-from fastapi import APIRouter, UploadFile, File, HTTPException, Depends, Form
-from fastapi.responses import JSONResponse
-from typing import Dict, Any, List
+from fastapi import APIRouter, UploadFile, File, HTTPException, Depends, Form, Request
+from fastapi.responses import JSONResponse, StreamingResponse
+from typing import Dict, Any, AsyncIterator, Awaitable, List, Optional, Tuple
+import asyncio
+import orjson
 import uuid
 from datetime import datetime
 
 from ..models.schemas import User
-from ..services.analysis_agent import CSVAnalysisAgent
+from ..services.upload import spool_upload, ANALYSIS_UPLOAD_MAX_BYTES
+from ..services.state import get_state
 from .auth import get_current_user
 
 router = APIRouter(prefix="/api/analysis", tags=["analysis"])
@@ -17,11 +20,16 @@ def get_analysis_agent():
     """분석 에이전트 인스턴스를 lazy loading으로 가져오기"""
     global analysis_agent
     if analysis_agent is None:
+        # pandas/plotly/langchain 로드 비용을 서버 시작이 아닌 첫 분석 요청에서 부담
+        from ..services.analysis_agent import CSVAnalysisAgent
         analysis_agent = CSVAnalysisAgent()
     return analysis_agent
 
-# 사용자별 세션 매핑 (사용자 ID -> 세션 ID)
-user_sessions: Dict[str, str] = {}
+# 사용자별 세션 매핑 (사용자명 -> 세션 ID, 여러 워커가 공유하는 상태 저장소에 보관)
+SESSIONS_NAMESPACE = "analysis_sessions"
+
+def get_user_session(username: str) -> Optional[str]:
+    return get_state().get(SESSIONS_NAMESPACE, username)
 
 @router.post("/upload")
 async def upload_csv_for_analysis(
@@ -34,23 +42,21 @@ async def upload_csv_for_analysis(
     if not file.filename.endswith('.csv'):
         raise HTTPException(status_code=400, detail="CSV 파일만 업로드 가능합니다.")
     
-    # 파일 크기 검증 (50MB 제한)
-    content = await file.read()
-    if len(content) > 50 * 1024 * 1024:  # 50MB
-        raise HTTPException(status_code=400, detail="파일 크기는 50MB를 초과할 수 없습니다.")
+    # 파일 크기 검증 (기본 50MB 제한, 청크 단위로 검사)
+    source, content_hash = await spool_upload(file, ANALYSIS_UPLOAD_MAX_BYTES)
     
     try:
         # 기존 세션이 있으면 데이터 삭제
-        if current_user.username in user_sessions:
-            old_session_id = user_sessions[current_user.username]
+        old_session_id = get_user_session(current_user.username)
+        if old_session_id is not None:
             get_analysis_agent().clear_session_data(old_session_id)
         
         # 새 세션 ID 생성
         session_id = f"{current_user.username}_{uuid.uuid4().hex[:8]}"
-        user_sessions[current_user.username] = session_id
         
-        # CSV 데이터 로드
-        result = get_analysis_agent().load_csv_data(session_id, content)
+        # CSV 데이터 로드 후 세션 등록 (다른 워커가 데이터를 찾을 수 있도록 저장이 먼저)
+        result = get_analysis_agent().load_csv_data(session_id, source, content_hash)
+        get_state().set(SESSIONS_NAMESPACE, current_user.username, session_id)
         
         if result["success"]:
             # 추천 질문 생성
@@ -65,25 +71,70 @@ async def upload_csv_for_analysis(
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"파일 처리 중 오류가 발생했습니다: {str(e)}")
 
+async def _run_until_disconnected(request: Request, awaitable: Awaitable, poll_interval: float = 0.5):
+    """클라이언트 연결이 끊어지면 실행 중인 분석을 취소"""
+    task = asyncio.ensure_future(awaitable)
+    try:
+        while True:
+            done, _ = await asyncio.wait({task}, timeout=poll_interval)
+            if done:
+                return task.result()
+            if await request.is_disconnected():
+                raise HTTPException(status_code=499, detail="클라이언트 연결이 끊어져 분석을 취소했습니다.")
+    finally:
+        if not task.done():
+            task.cancel()
+
+async def _sse_events(
+    request: Request,
+    events: AsyncIterator[Tuple[str, Dict[str, Any]]],
+    query: str
+) -> AsyncIterator[bytes]:
+    """분석 이벤트를 Server-Sent Events 형식으로 변환 (연결이 끊어지면 분석 취소)"""
+    try:
+        async for event, data in events:
+            if await request.is_disconnected():
+                break
+            if event == "result" and data["success"]:
+                data["query"] = query
+                data["timestamp"] = datetime.now().isoformat()
+            yield b"event: " + event.encode() + b"\ndata: " + orjson.dumps(data, default=str) + b"\n\n"
+    finally:
+        # 에이전트 실행을 중단하고 LLM 세마포어를 바로 반환
+        await events.aclose()
+
 @router.post("/query")
 async def analyze_data_query(
+    request: Request,
     query: str = Form(...),
     current_user: User = Depends(get_current_user)
-) -> Dict[str, Any]:
-    """자연어 질문으로 데이터 분석"""
+):
+    """자연어 질문으로 데이터 분석
+
+    Accept: text/event-stream 요청이면 토큰/중간 단계/최종 결과를 SSE로 스트리밍한다.
+    """
     
     # 사용자의 세션 확인
-    if current_user.username not in user_sessions:
+    session_id = get_user_session(current_user.username)
+    if session_id is None:
         raise HTTPException(status_code=400, detail="업로드된 데이터가 없습니다. 먼저 CSV 파일을 업로드해주세요.")
     
-    session_id = user_sessions[current_user.username]
-    
     if not query.strip():
         raise HTTPException(status_code=400, detail="질문을 입력해주세요.")
     
+    agent = get_analysis_agent()
+    
+    if "text/event-stream" in request.headers.get("accept", ""):
+        # 클라이언트 연결이 끊어지면 스트림이 취소되면서 에이전트 실행도 중단됨
+        return StreamingResponse(
+            _sse_events(request, agent.astream_query(session_id, query.strip(), username=current_user.username), query),
+            media_type="text/event-stream",
+            headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+        )
+    
     try:
-        # 분석 실행
-        result = get_analysis_agent().analyze_query(session_id, query.strip())
+        # 분석 실행 (이벤트 루프를 막지 않음)
+        result = await _run_until_disconnected(request, agent.aanalyze_query(session_id, query.strip(), username=current_user.username))
         
         if result["success"]:
             result["query"] = query
@@ -91,19 +142,36 @@ async def analyze_data_query(
         
         return result
         
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"분석 중 오류가 발생했습니다: {str(e)}")
 
+@router.get("/usage")
+async def get_analysis_usage(
+    current_user: User = Depends(get_current_user)
+) -> Dict[str, Any]:
+    """현재 사용자의 누적 분석 사용량 (질문 수, 토큰, 비용)과 현재 데이터셋의 누적 사용량 (모든 사용자 합계)"""
+    from ..services.llm_usage import get_user_usage, get_dataset_usage
+    from ..services.analysis_agent import DATASET_HASH_NAMESPACE
+    
+    result = {"username": current_user.username, "usage": get_user_usage(current_user.username)}
+    session_id = get_user_session(current_user.username)
+    dataset_hash = get_state().get(DATASET_HASH_NAMESPACE, session_id) if session_id else None
+    if dataset_hash:
+        result["dataset"] = {"hash": dataset_hash, "usage": get_dataset_usage(dataset_hash)}
+    return result
+
 @router.get("/suggestions")
 async def get_query_suggestions(
     current_user: User = Depends(get_current_user)
 ) -> Dict[str, Any]:
     """데이터 기반 추천 질문 조회"""
     
-    if current_user.username not in user_sessions:
+    session_id = get_user_session(current_user.username)
+    if session_id is None:
         return {"suggestions": []}
     
-    session_id = user_sessions[current_user.username]
     suggestions = get_analysis_agent().get_suggested_queries(session_id)
     
     return {"suggestions": suggestions}
@@ -114,10 +182,10 @@ async def get_current_data_info(
 ) -> Dict[str, Any]:
     """현재 업로드된 데이터 정보 조회"""
     
-    if current_user.username not in user_sessions:
+    session_id = get_user_session(current_user.username)
+    if session_id is None:
         raise HTTPException(status_code=404, detail="업로드된 데이터가 없습니다.")
     
-    session_id = user_sessions[current_user.username]
     data_info = get_analysis_agent().get_data_info(session_id)
     
     if not data_info:
@@ -131,10 +199,10 @@ async def clear_analysis_data(
 ) -> Dict[str, Any]:
     """현재 사용자의 분석 데이터 삭제"""
     
-    if current_user.username in user_sessions:
-        session_id = user_sessions[current_user.username]
+    session_id = get_user_session(current_user.username)
+    if session_id is not None:
         get_analysis_agent().clear_session_data(session_id)
-        del user_sessions[current_user.username]
+        get_state().delete(SESSIONS_NAMESPACE, current_user.username)
         
         return {"success": True, "message": "분석 데이터가 삭제되었습니다."}
     
@@ -3,11 +3,11 @@ from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from datetime import timedelta
 from ..models.schemas import UserCreate, UserLogin, Token, User
 from ..services.auth import (
-    authenticate_user, 
+    authenticate_user_async, 
     create_access_token, 
-    create_user, 
-    get_user, 
-    decode_access_token,
+    register_user, 
+    get_user_for_token, 
+    is_admin,
     ACCESS_TOKEN_EXPIRE_MINUTES
 )
 
@@ -20,7 +20,7 @@ security = HTTPBearer()
 async def register(user_data: UserCreate):
     """회원가입"""
     try:
-        user = create_user(user_data)
+        user = await register_user(user_data)
         return user
     except HTTPException:
         raise
@@ -33,7 +33,7 @@ async def register(user_data: UserCreate):
 @router.post("/login", response_model=Token)
 async def login(user_credentials: UserLogin):
     """로그인"""
-    user = authenticate_user(user_credentials.username, user_credentials.password)
+    user = await authenticate_user_async(user_credentials.username, user_credentials.password)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -57,19 +57,23 @@ async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(s
     )
     
     try:
-        token = credentials.credentials
-        username = decode_access_token(token)
-        if username is None:
-            raise credentials_exception
+        user = get_user_for_token(credentials.credentials)
     except Exception:
         raise credentials_exception
-    
-    user = get_user(username)
     if user is None:
         raise credentials_exception
     
     return user
 
+async def get_current_admin(current_user: User = Depends(get_current_user)) -> User:
+    """관리자만 접근 가능한 엔드포인트용 의존성"""
+    if not is_admin(current_user.username):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="관리자 권한이 필요합니다."
+        )
+    return current_user
+
 @router.get("/me", response_model=User)
 async def get_current_user_info(current_user: User = Depends(get_current_user)):
     """현재 사용자 정보 조회"""
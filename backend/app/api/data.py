@@ -1,27 +1,69 @@
-from fastapi import APIRouter, UploadFile, File, HTTPException, Query, Depends
-from fastapi.responses import StreamingResponse
+from fastapi import APIRouter, UploadFile, File, HTTPException, Query, Depends, Request
+from fastapi.responses import StreamingResponse, Response
 from typing import Dict, Any, Optional
 import io
 
 from ..models.schemas import ProcessingRequest, ProcessingResponse, DataSummary, VisualizationRequest, User
-from ..services.data_processing import data_service
+from ..services.upload import spool_upload, DATA_UPLOAD_MAX_BYTES
 from .auth import get_current_user
 
 router = APIRouter(prefix="/api/data", tags=["data"])
 
+def get_data_service():
+    """데이터 처리 서비스를 lazy loading으로 가져오기 (pandas/sklearn/plotly를 첫 요청에서 로드)
+
+    멀티 워커 실행 시 다른 워커가 올린 데이터가 있으면 먼저 동기화한다.
+    """
+    from ..services.data_processing import data_service
+    data_service.sync_from_state()
+    return data_service
+
+def _cache_headers(etag: Optional[str]) -> Dict[str, str]:
+    """ETag가 있으면 매번 재검증하도록 하는 캐시 헤더
+
+    같은 ETag가 gzip/비압축 응답에 모두 쓰이므로 약한 ETag를 쓰고 Accept-Encoding별로 구분하도록 Vary를 붙인다.
+    """
+    if etag is None:
+        return {}
+    return {"ETag": etag, "Cache-Control": "private, no-cache", "Vary": "Accept-Encoding"}
+
+def _opaque_tag(tag: str) -> str:
+    """약한 비교용 태그 값 (W/ 접두사 제거)"""
+    tag = tag.strip()
+    return tag[2:] if tag.startswith('W/') else tag
+
+def _is_not_modified(request: Request, etag: Optional[str]) -> bool:
+    """If-None-Match 헤더의 ETag 목록 중 현재 ETag와 약한 비교로 일치하는 것이 있는지 확인"""
+    if etag is None:
+        return False
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    candidates = [_opaque_tag(tag) for tag in if_none_match.split(',')]
+    return '*' in candidates or _opaque_tag(etag) in candidates
+
+def _not_modified_response(etag: str) -> Response:
+    return Response(status_code=304, headers=_cache_headers(etag))
+
 @router.post("/upload", response_model=Dict[str, Any])
 async def upload_file(
     file: UploadFile = File(...), 
+    optimize_memory: bool = Query(True),
     current_user: User = Depends(get_current_user)
 ):
     """CSV 파일 업로드 (로그인 필요)"""
+    data_service = get_data_service()
     if not file.filename.endswith('.csv'):
         raise HTTPException(status_code=400, detail="CSV 파일만 업로드 가능합니다.")
     
+    # 청크 단위로 크기 검사 및 해시 계산 후 스풀된 파일에서 바로 파싱
+    source, content_hash = await spool_upload(file, DATA_UPLOAD_MAX_BYTES)
+    
     try:
-        content = await file.read()
-        result = data_service.load_csv_data(content, file.filename)
+        result = data_service.load_csv_data(source, file.filename, optimize_memory, content_hash)
         return result
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"파일 업로드 중 오류 발생: {str(e)}")
 
@@ -31,6 +73,7 @@ async def process_data(
     current_user: User = Depends(get_current_user)
 ):
     """데이터 전처리 및 증강 실행 (로그인 필요)"""
+    data_service = get_data_service()
     try:
         config = {
             'preprocessing_config': request.preprocessing_config.dict(),
@@ -43,23 +86,54 @@ async def process_data(
 
 @router.get("/processed", response_model=Dict[str, Any])
 async def get_processed_data(
+    request: Request,
+    response: Response,
     page: int = Query(0, ge=0),
     page_size: int = Query(100, ge=1, le=1000),
+    format: str = Query("records", pattern="^(records|columnar|arrow)$"),
+    cursor: Optional[str] = Query(None),
+    columns: Optional[str] = Query(None, description="쉼표로 구분된 조회 컬럼 목록"),
     current_user: User = Depends(get_current_user)
 ):
-    """처리된 데이터 조회 (페이징) (로그인 필요)"""
+    """처리된 데이터 조회 (페이징) (로그인 필요)
+
+    format=columnar는 컬럼명 -> 배열 형태의 JSON, format=arrow는 Arrow IPC 스트림을 반환하며
+    cursor(이전 응답의 next_cursor)와 columns로 커서 기반 페이징과 컬럼 선택을 지원한다.
+    """
+    data_service = get_data_service()
+    # 데이터 버전이 같으면 조회 없이 304 반환
+    etag = data_service.make_etag('processed', page, page_size, format, cursor, columns)
+    if _is_not_modified(request, etag):
+        return _not_modified_response(etag)
+    
     try:
-        result = data_service.get_processed_data(page, page_size)
-        return result
+        if format == "records":
+            result = data_service.get_processed_data(page, page_size)
+            response.headers.update(_cache_headers(etag))
+            return result
+        
+        column_list = [column.strip() for column in columns.split(',') if column.strip()] if columns else None
+        body, next_cursor = data_service.get_processed_columnar(
+            cursor, page_size, column_list, format, page
+        )
+        
+        headers = _cache_headers(etag)
+        if next_cursor:
+            headers["X-Next-Cursor"] = next_cursor
+        media_type = "application/vnd.apache.arrow.stream" if format == "arrow" else "application/json"
+        return Response(content=body, media_type=media_type, headers=headers)
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"데이터 조회 중 오류 발생: {str(e)}")
 
 @router.get("/download")
 async def download_data(
-    encoding: str = Query("utf-8", regex="^(utf-8|cp949|utf-8-bom)$"),
+    encoding: str = Query("utf-8", pattern="^(utf-8|cp949|utf-8-bom)$"),
     current_user: User = Depends(get_current_user)
 ):
     """증강된 데이터 다운로드 (로그인 필요)"""
+    data_service = get_data_service()
     try:
         csv_bytes = data_service.download_data(encoding)
         
@@ -79,33 +153,99 @@ async def download_data(
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"다운로드 중 오류 발생: {str(e)}")
 
+def _render_visualization(request: Request, params: VisualizationRequest, conditional: bool) -> Response:
+    data_service = get_data_service()
+    etag = data_service.make_etag(
+        'visualize', params.column_name, params.chart_type, params.max_columns,
+        params.top_k, params.y_column, params.max_points
+    )
+    if conditional and _is_not_modified(request, etag):
+        return _not_modified_response(etag)
+    
+    try:
+        body = data_service.generate_visualization(
+            params.column_name, 
+            params.chart_type,
+            params.max_columns,
+            params.top_k,
+            params.y_column,
+            params.max_points
+        )
+        # 이미 직렬화된 JSON을 그대로 전송
+        return Response(content=body, media_type="application/json", headers=_cache_headers(etag))
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"시각화 생성 중 오류 발생: {str(e)}")
+
 @router.post("/visualize", response_model=Dict[str, Any])
 async def create_visualization(
-    request: VisualizationRequest,
+    request: Request,
+    params: VisualizationRequest,
     current_user: User = Depends(get_current_user)
 ):
     """시각화 생성 (로그인 필요)"""
+    return _render_visualization(request, params, conditional=False)
+
+@router.get("/visualize", response_model=Dict[str, Any])
+async def get_visualization(
+    request: Request,
+    params: VisualizationRequest = Depends(),
+    current_user: User = Depends(get_current_user)
+):
+    """시각화 조회 (로그인 필요)
+
+    POST /visualize와 같은 결과를 쿼리 파라미터로 조회하며, If-None-Match가 현재 ETag와
+    같으면 차트를 다시 만들지 않고 304를 반환한다.
+    """
+    return _render_visualization(request, params, conditional=True)
+
+@router.get("/dashboard", response_model=Dict[str, Any])
+async def get_dashboard(
+    request: Request,
+    bins: int = Query(30, ge=5, le=200),
+    top_n: int = Query(20, ge=1, le=100),
+    current_user: User = Depends(get_current_user)
+):
+    """전체 컬럼 분포 요약 및 품질 지표 조회 (로그인 필요)"""
+    data_service = get_data_service()
+    etag = data_service.make_etag('dashboard', bins, top_n)
+    if _is_not_modified(request, etag):
+        return _not_modified_response(etag)
+    
     try:
-        result = data_service.generate_visualization(
-            request.column_name, 
-            request.chart_type
-        )
-        return result
+        body = data_service.get_dashboard(bins, top_n)
+        return Response(content=body, media_type="application/json", headers=_cache_headers(etag))
+    except HTTPException:
+        raise
     except Exception as e:
-        raise HTTPException(status_code=500, detail=f"시각화 생성 중 오류 발생: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"대시보드 생성 중 오류 발생: {str(e)}")
 
 @router.get("/statistics", response_model=Dict[str, Any])
-async def get_statistics(current_user: User = Depends(get_current_user)):
+async def get_statistics(
+    request: Request,
+    response: Response,
+    current_user: User = Depends(get_current_user)
+):
     """통계 정보 조회 (로그인 필요)"""
+    data_service = get_data_service()
+    etag = data_service.make_etag('statistics')
+    if _is_not_modified(request, etag):
+        return _not_modified_response(etag)
+    
     try:
         result = data_service.get_statistics()
+        response.headers.update(_cache_headers(etag))
         return result
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"통계 조회 중 오류 발생: {str(e)}")
 
 @router.get("/columns", response_model=Dict[str, Any])
 async def get_columns(current_user: User = Depends(get_current_user)):
     """컬럼 정보 조회 (로그인 필요)"""
+    data_service = get_data_service()
     try:
         if data_service.current_data is None:
             raise HTTPException(status_code=400, detail="데이터가 로드되지 않았습니다.")
@@ -120,4 +260,13 @@ async def get_columns(current_user: User = Depends(get_current_user)):
             'categorical_columns': categorical_columns
         }
     except Exception as e:
-        raise HTTPException(status_code=500, detail=f"컬럼 정보 조회 중 오류 발생: {str(e)}")
\ No newline at end of file
+        raise HTTPException(status_code=500, detail=f"컬럼 정보 조회 중 오류 발생: {str(e)}")
+
+@router.get("/cache/stats", response_model=Dict[str, Any])
+async def get_cache_stats(current_user: User = Depends(get_current_user)):
+    """데이터셋/파이프라인 캐시 적중률 및 사용량 조회 (로그인 필요)"""
+    data_service = get_data_service()
+    return {
+        'dataset': data_service.dataset_cache.stats(),
+        'pipeline': data_service.pipeline_cache.stats()
+    }
@@ -0,0 +1,110 @@
+from fastapi import APIRouter, HTTPException, Depends, Request
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from typing import Dict, Any
+
+from ..models.schemas import User
+from ..services.auth import decode_access_token, is_admin
+from ..services.profiling import request_profiler
+from .auth import get_current_admin
+
+router = APIRouter(prefix="/debug", tags=["debug"])
+
+# 프로파일링 요청 헤더/쿼리 파라미터
+PROFILE_HEADER = "x-profile"
+PROFILE_QUERY_PARAM = "profile"
+
+def _profiling_requested(request: Request) -> bool:
+    flag = request.headers.get(PROFILE_HEADER) or request.query_params.get(PROFILE_QUERY_PARAM)
+    return flag is not None and flag.lower() in ("1", "true", "yes")
+
+def _admin_username(request: Request) -> str:
+    """Authorization 헤더의 토큰이 관리자 계정이면 사용자명, 아니면 빈 문자열"""
+    authorization = request.headers.get("authorization", "")
+    scheme, _, token = authorization.partition(" ")
+    if scheme.lower() != "bearer" or not token:
+        return ""
+    username = decode_access_token(token)
+    return username if username and is_admin(username) else ""
+
+class ProfilingMiddleware:
+    """관리자가 X-Profile 헤더나 ?profile=1로 요청하면 cProfile/tracemalloc으로 측정
+
+    이 요청의 코루틴이 이벤트 루프에서 실행되는 구간만 측정하므로 동시에 처리되는 다른 요청은 섞이지 않지만,
+    스레드 풀/실행기로 넘긴 작업은 포함되지 않는다 (보고서의 scope 참고).
+    보고서 id는 X-Profile-Id 응답 헤더로 전달된다. 관리자가 아니면 플래그를 무시한다.
+    BaseHTTPMiddleware(anyio 태스크 그룹) 대신 순수 ASGI로 구현해서 프로파일링하지 않는
+    요청은 추가 비용 없이 그대로 통과한다.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request = Request(scope)
+        if not _profiling_requested(request):
+            await self.app(scope, receive, send)
+            return
+
+        username = _admin_username(request)
+        if not username:
+            await self.app(scope, receive, send)
+            return
+
+        session = request_profiler.try_start()
+        if session is None:
+            # 다른 요청을 프로파일링 중이거나 간격 제한에 걸린 경우 그대로 처리
+            await self.app(scope, receive, _with_headers(send, {"X-Profile-Status": "skipped"}))
+            return
+        session.start()
+
+        request_info = {
+            'method': request.method,
+            'path': request.url.path,
+            'query': str(request.query_params),
+            'username': username
+        }
+        status_code = 500
+        send_with_headers = _with_headers(send, {"X-Profile-Id": session.id})
+
+        async def send_and_record(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send_with_headers(message)
+
+        try:
+            await session.profile(self.app(scope, receive, send_and_record))
+        finally:
+            session.finish({**request_info, 'status_code': status_code})
+
+def _with_headers(send: Send, headers: Dict[str, str]) -> Send:
+    """응답 시작 메시지에 헤더를 추가하는 send 래퍼"""
+    async def wrapped(message: Message) -> None:
+        if message["type"] == "http.response.start":
+            response_headers = MutableHeaders(scope=message)
+            for name, value in headers.items():
+                response_headers[name] = value
+        await send(message)
+    return wrapped
+
+@router.get("/profiles", response_model=Dict[str, Any])
+async def list_profiles(current_user: User = Depends(get_current_admin)):
+    """저장된 프로파일링 보고서 목록 (관리자 전용)"""
+    return {
+        'profiles': request_profiler.list_reports(),
+        'max_reports': request_profiler.max_reports,
+        'min_interval_seconds': request_profiler.min_interval
+    }
+
+@router.get("/profiles/{profile_id}", response_model=Dict[str, Any])
+async def get_profile(profile_id: str, current_user: User = Depends(get_current_admin)):
+    """프로파일링 보고서 조회 (관리자 전용)"""
+    report = request_profiler.get_report(profile_id)
+    if report is None:
+        raise HTTPException(status_code=404, detail="프로파일링 보고서를 찾을 수 없습니다.")
+    return report
@@ -1,11 +1,19 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, Response
+import os
 
 from .api.data import router as data_router
 from .api.auth import router as auth_router
 from .api.analysis import router as analysis_router
+from .api.debug import router as debug_router, ProfilingMiddleware
+from .services.metrics import metrics
+
+# 이 크기(바이트) 이상인 응답만 gzip 압축
+COMPRESSION_MIN_SIZE = int(os.getenv("COMPRESSION_MIN_SIZE", "1024"))
+COMPRESSION_LEVEL = int(os.getenv("COMPRESSION_LEVEL", "6"))
 
 def create_app() -> FastAPI:
     """FastAPI 앱 생성 및 설정"""
@@ -25,14 +33,17 @@ def create_app() -> FastAPI:
         allow_credentials=True,
         allow_methods=["*"],
         allow_headers=["*"],
+        expose_headers=["ETag", "X-Next-Cursor", "X-Profile-Id", "X-Profile-Status"],
     )
     
-    # API 라우터 등록
-    app.include_router(auth_router)  # 인증 라우터 추가
-    app.include_router(data_router)
-    app.include_router(analysis_router)  # 분석 라우터 추가
+    # 큰 JSON/Arrow 응답 압축 (Accept-Encoding에 gzip이 있을 때만)
+    app.add_middleware(GZipMiddleware, minimum_size=COMPRESSION_MIN_SIZE, compresslevel=COMPRESSION_LEVEL)
+    
+    # 관리자 요청 단위 프로파일링 (X-Profile 헤더 또는 ?profile=1)
+    app.add_middleware(ProfilingMiddleware)
     
-    # 헬스 체크 엔드포인트
+    # 헬스 체크 엔드포인트 (라우트는 등록 순서대로 매칭되고 첫 매칭 시 준비되므로
+    # 라우터보다 먼저 등록해야 시작 직후 /health 응답이 다른 라우트 준비를 기다리지 않음)
     @app.get("/")
     async def root():
         return {
@@ -46,6 +57,17 @@ def create_app() -> FastAPI:
     async def health_check():
         return {"status": "healthy"}
     
+    # API 라우터 등록
+    app.include_router(auth_router)  # 인증 라우터 추가
+    app.include_router(data_router)
+    app.include_router(analysis_router)  # 분석 라우터 추가
+    app.include_router(debug_router)  # 프로파일링 보고서
+    
+    # Prometheus 수집용 메트릭 (단계별 소요 시간/행 수/메모리 히스토그램)
+    @app.get("/metrics")
+    async def get_metrics():
+        return Response(content=metrics.render(), media_type="text/plain; version=0.0.4; charset=utf-8")
+    
     return app
 
 app = create_app()
\ No newline at end of file
@@ -1,4 +1,4 @@
-from pydantic import BaseModel, EmailStr
+from pydantic import BaseModel, EmailStr, Field
 from typing import Optional, Dict, Any, List
 from enum import Enum
 from datetime import datetime
@@ -91,4 +91,8 @@ class DataSummary(BaseModel):
 
 class VisualizationRequest(BaseModel):
     column_name: str
-    chart_type: str = "distribution"
\ No newline at end of file
+    chart_type: str = "distribution"
+    max_columns: int = Field(50, ge=2, le=1000)  # 상관관계 히트맵에 표시할 최대 컬럼 수
+    top_k: Optional[int] = Field(None, ge=1, le=1000)  # 지정 시 상관관계가 강한 컬럼 쌍 k개만 표시
+    y_column: Optional[str] = None  # 산점도의 y축 컬럼
+    max_points: int = Field(5000, ge=3, le=100000)  # 산점도/선 그래프에 전송할 최대 점 개수 (LTTB는 최소 3점)
\ No newline at end of file
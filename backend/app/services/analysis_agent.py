@@ -2,14 +2,18 @@ import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
 import plotly.io as pio
-from plotly.utils import PlotlyJSONEncoder
-import json
+import numpy as np
+import asyncio
+import io
 import os
-from typing import Dict, Any, Optional, List
+import sys
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from typing import Dict, Any, AsyncIterator, Optional, List, Tuple, Union, BinaryIO
 from dotenv import load_dotenv
 import pathlib
-import matplotlib
-matplotlib.use('Agg')  # GUI 없는 백엔드 사용
 
 # Plotly 렌더러를 JSON 전용으로 설정 (GUI 창 방지)
 pio.renderers.default = "json"
@@ -22,13 +26,49 @@ load_dotenv(dotenv_path=env_path)
 # 추가적으로 현재 디렉토리에서도 시도
 load_dotenv()
 
+# backend 폴더의 공용 모듈(downsampling 등) 사용
+sys.path.append(str(backend_dir))
+from downsampling import Downsampler
+
+# 차트 하나에 전송할 최대 점 개수
+CHART_MAX_POINTS = int(os.getenv("CHART_MAX_POINTS", "5000"))
+# 워커당 보관할 세션별 pandas 에이전트 수 (LRU)
+ANALYSIS_AGENT_CACHE_SIZE = int(os.getenv("ANALYSIS_AGENT_CACHE_SIZE", "32"))
+# 워커당 메모리에 보관할 세션 DataFrame 수 (LRU, 밀려난 세션은 공유 저장소에서 다시 읽음)
+ANALYSIS_SESSION_CACHE_SIZE = int(os.getenv("ANALYSIS_SESSION_CACHE_SIZE", "32"))
+# 워커당 동시에 실행할 수 있는 LLM 에이전트 수와 질문당 제한 시간 (초)
+LLM_MAX_CONCURRENCY = int(os.getenv("LLM_MAX_CONCURRENCY", "4"))
+ANALYSIS_QUERY_TIMEOUT_SECONDS = float(os.getenv("ANALYSIS_QUERY_TIMEOUT_SECONDS", "90"))
+# 에이전트 실행기 설정 (매 실행마다 새 실행기를 만들 때 사용)
+AGENT_EXECUTOR_OPTIONS = {"verbose": True, "max_iterations": 5, "handle_parsing_errors": True}
+# 반복/시간 제한으로 중단된 에이전트가 최종 답변 대신 돌려주는 문구
+AGENT_STOPPED_PREFIX = "Agent stopped due to"
+
 from langchain_openai import ChatOpenAI
-from langchain_experimental.agents import create_pandas_dataframe_agent
-from langchain.agents.agent_types import AgentType
-from langchain_community.callbacks import get_openai_callback
-import tempfile
-import io
-import base64
+
+from .ingestion import read_csv_source
+from .state import get_state
+from .upload import compute_content_hash
+from .llm_cache import LLMResponseCache, make_response_key
+from .query_intents import match_intent, answer_intent
+from .llm_usage import AgentUsageTracker, empty_usage, record_usage
+from .metrics import (
+    ANALYSIS_AGENT_CACHE, ANALYSIS_AGENT_SETUP, ANALYSIS_AGENT_SETUP_SAVED, LLM_RESPONSE_CACHE, ANALYSIS_FAST_PATH
+)
+
+# 세션별 데이터셋 내용 해시 (세션 ID -> 해시, 응답 캐시 키에 사용)
+DATASET_HASH_NAMESPACE = "analysis_dataset_hashes"
+
+NO_DATA_ERROR = "데이터가 업로드되지 않았습니다. 먼저 CSV 파일을 업로드해주세요."
+
+_llm_semaphore: Optional[asyncio.Semaphore] = None
+
+def get_llm_semaphore() -> asyncio.Semaphore:
+    """동시 LLM 호출 수를 제한하는 전역 세마포어 (처음 사용할 때 생성)"""
+    global _llm_semaphore
+    if _llm_semaphore is None:
+        _llm_semaphore = asyncio.Semaphore(LLM_MAX_CONCURRENCY)
+    return _llm_semaphore
 
 class CSVAnalysisAgent:
     def __init__(self):
@@ -39,26 +79,163 @@ class CSVAnalysisAgent:
         self.llm = ChatOpenAI(
             temperature=0.1,
             openai_api_key=self.openai_api_key,
-            model="gpt-4o"  # 최신 모델로 변경
+            model="gpt-4o",  # 최신 모델로 변경
+            stream_usage=True  # 스트리밍 응답에서도 토큰 사용량 수집
         )
         
-        # 세션별 데이터 저장
-        self.session_data: Dict[str, pd.DataFrame] = {}
+        # 세션별 데이터 (공유 상태 저장소에 저장하고, 이 워커에서 읽은 DataFrame은
+        # 세션 ID -> (데이터셋 해시, DataFrame) LRU로 보관)
+        self.session_data: "OrderedDict[str, Tuple[str, pd.DataFrame]]" = OrderedDict()
+        self._session_lock = threading.Lock()
+        self.state = get_state()
         
-    def load_csv_data(self, session_id: str, csv_content: bytes) -> Dict[str, Any]:
-        """CSV 데이터를 로드하고 세션에 저장"""
-        try:
-            # CSV 파일을 DataFrame으로 읽기
-            df = pd.read_csv(io.BytesIO(csv_content), encoding='utf-8')
-        except UnicodeDecodeError:
-            # UTF-8로 실패하면 다른 인코딩 시도
-            try:
-                df = pd.read_csv(io.BytesIO(csv_content), encoding='cp949')
-            except:
-                df = pd.read_csv(io.BytesIO(csv_content), encoding='latin-1')
+        # 세션 ID -> (에이전트를 만든 DataFrame, 에이전트, 생성 시간(초)) LRU 캐시
+        self._agents: "OrderedDict[str, Tuple[pd.DataFrame, Any, float]]" = OrderedDict()
+        self._agents_lock = threading.Lock()
+        # 같은 세션의 에이전트 실행은 한 번에 하나씩 (동기 경로는 스레드 락, 비동기 경로는 asyncio 락)
+        self._run_locks: "weakref.WeakValueDictionary[str, threading.Lock]" = weakref.WeakValueDictionary()
+        self._async_run_locks: "weakref.WeakValueDictionary[str, asyncio.Lock]" = weakref.WeakValueDictionary()
+        
+        # 같은 데이터셋에 대한 같은 질문은 LLM을 호출하지 않고 저장된 응답 반환
+        self.response_cache = LLMResponseCache()
+    
+    @property
+    def model_name(self) -> str:
+        """응답 캐시 키에 사용할 모델 이름"""
+        return getattr(self.llm, "model_name", None) or type(self.llm).__name__
+    
+    def _get_agent(self, session_id: str, df: pd.DataFrame) -> Tuple[Any, Dict[str, Any]]:
+        """세션의 pandas 에이전트(프롬프트/LLM)를 재사용하고, 없거나 데이터가 바뀌었으면 새로 생성
+
+        Returns:
+            (이번 실행 전용 실행기, 캐시 정보 {'hit', 'setup_ms', 'saved_ms'})
+        """
+        with self._agents_lock:
+            cached = self._agents.get(session_id)
+            if cached is not None and cached[0] is df:
+                self._agents.move_to_end(session_id)
+        if cached is not None and cached[0] is df:
+            # 실행기 생성(DataFrame 사본 포함)은 캐시 적중 시에도 매번 들므로 생성 시간에서 빼고 절약분 계산
+            start = time.perf_counter()
+            executor = self._new_executor(cached[1], df)
+            executor_seconds = time.perf_counter() - start
+            saved_seconds = max(cached[2] - executor_seconds, 0.0)
+            ANALYSIS_AGENT_CACHE.inc(result="hit")
+            ANALYSIS_AGENT_SETUP_SAVED.inc(saved_seconds)
+            return executor, {
+                "hit": True,
+                "setup_ms": round(executor_seconds * 1000, 2),
+                "saved_ms": round(saved_seconds * 1000, 2)
+            }
+        
+        # pandas 에이전트(langchain_experimental)는 import 비용이 커서 첫 질문 시 로드
+        from langchain_experimental.agents import create_pandas_dataframe_agent
+        from langchain.agents.agent_types import AgentType
+        
+        start = time.perf_counter()
+        # LangChain Agent 생성 (Python REPL 활성화)
+        agent = create_pandas_dataframe_agent(
+            llm=self.llm,
+            df=df,
+            agent_type=AgentType.ZERO_SHOT_REACT_DESCRIPTION,
+            allow_dangerous_code=True  # Python REPL 기능 활성화
+        )
+        agent_seconds = time.perf_counter() - start
+        executor = self._new_executor(agent, df)
+        setup_seconds = time.perf_counter() - start
+        ANALYSIS_AGENT_CACHE.inc(result="miss")
+        ANALYSIS_AGENT_SETUP.observe(setup_seconds)
+        
+        with self._agents_lock:
+            self._agents[session_id] = (df, agent, agent_seconds)
+            self._agents.move_to_end(session_id)
+            while len(self._agents) > ANALYSIS_AGENT_CACHE_SIZE:
+                self._agents.popitem(last=False)
+        return executor, {"hit": False, "setup_ms": round(setup_seconds * 1000, 2), "saved_ms": 0.0}
+    
+    @staticmethod
+    def _new_executor(agent: Any, df: pd.DataFrame) -> Any:
+        """캐시된 에이전트의 프롬프트/LLM에 새 Python REPL 도구를 붙인 실행기
+
+        REPL 도구의 변수는 실행 사이에 남으므로(`df = df[...]` 등) 매 실행마다 DataFrame 사본으로
+        새로 만든다. 사본이므로 도구 코드가 df를 제자리에서 바꿔도 세션 데이터에는 영향이 없다.
+        사본 비용은 행 수에 비례하며(50MB 프레임에서 약 10ms) 응답의 agent_cache.setup_ms에 포함된다.
+        """
+        from langchain.agents import AgentExecutor
+        from langchain_experimental.tools.python.tool import PythonAstREPLTool
+        
+        tool = agent.tools[0]
+        repl = PythonAstREPLTool(name=tool.name, description=tool.description, locals={"df": df.copy()})
+        return AgentExecutor.from_agent_and_tools(agent=agent.agent, tools=[repl], **AGENT_EXECUTOR_OPTIONS)
+    
+    def _session_run_lock(self, locks: "weakref.WeakValueDictionary", session_id: str, factory) -> Any:
+        """세션별 실행 락 (실행 중인 쪽이 참조하는 동안만 유지)"""
+        with self._agents_lock:
+            lock = locks.get(session_id)
+            if lock is None:
+                lock = factory()
+                locks[session_id] = lock
+            return lock
+    
+    def _invalidate_agent(self, session_id: str) -> None:
+        with self._agents_lock:
+            self._agents.pop(session_id, None)
+    
+    def _remember_session_data(self, session_id: str, dataset_hash: str, df: pd.DataFrame) -> None:
+        with self._session_lock:
+            self.session_data[session_id] = (dataset_hash, df)
+            self.session_data.move_to_end(session_id)
+            while len(self.session_data) > ANALYSIS_SESSION_CACHE_SIZE:
+                evicted, _ = self.session_data.popitem(last=False)
+                self._invalidate_agent(evicted)
+    
+    def _get_session_data(self, session_id: str) -> Optional[pd.DataFrame]:
+        """세션 DataFrame 조회
+
+        공유 저장소의 데이터셋 해시가 로컬 사본과 다르면(다른 워커에서 다시 업로드) 새로 읽고,
+        해시가 없으면(다른 워커에서 세션 삭제) 로컬 사본과 에이전트도 버린다.
+        """
+        dataset_hash = self.state.get(DATASET_HASH_NAMESPACE, session_id)
+        with self._session_lock:
+            cached = self.session_data.get(session_id)
+            if cached is not None and dataset_hash is not None and cached[0] == dataset_hash:
+                self.session_data.move_to_end(session_id)
+                return cached[1]
+            self.session_data.pop(session_id, None)
+        
+        df = self.state.get_frame(f"analysis-{session_id}") if dataset_hash is not None else None
+        if df is None:
+            self._invalidate_agent(session_id)
+            return None
+        self._remember_session_data(session_id, dataset_hash, df)
+        return df
+        
+    def load_csv_data(
+        self,
+        session_id: str,
+        csv_content: Union[bytes, BinaryIO],
+        content_hash: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """CSV 데이터를 로드하고 세션에 저장
+
+        Args:
+            session_id: 분석 세션 ID
+            csv_content: CSV 바이트 또는 디스크에 스풀된 업로드 파일 객체
+            content_hash: 업로드 시 계산된 내용 해시 (없으면 여기서 계산)
+        """
+        if isinstance(csv_content, (bytes, bytearray)):
+            csv_content = io.BytesIO(csv_content)
+        if content_hash is None:
+            content_hash = compute_content_hash(csv_content)
+        
+        # 인코딩/구분자를 앞부분에서 감지한 뒤 한 번만 파싱
+        df, _ = read_csv_source(csv_content)
         
-        # 세션에 데이터 저장
-        self.session_data[session_id] = df
+        # 세션에 데이터 저장 (이전 데이터로 만든 에이전트는 폐기)
+        self._invalidate_agent(session_id)
+        self.state.put_frame(f"analysis-{session_id}", df)
+        self.state.set(DATASET_HASH_NAMESPACE, session_id, content_hash)
+        self._remember_session_data(session_id, content_hash, df)
         
         # 데이터 기본 정보 반환
         return {
@@ -73,30 +250,9 @@ class CSVAnalysisAgent:
             }
         }
     
-    def analyze_query(self, session_id: str, query: str) -> Dict[str, Any]:
-        """자연어 쿼리를 분석하여 결과 반환"""
-        if session_id not in self.session_data:
-            return {
-                "success": False,
-                "error": "데이터가 업로드되지 않았습니다. 먼저 CSV 파일을 업로드해주세요."
-            }
-        
-        df = self.session_data[session_id]
-        
-        try:
-            # LangChain Agent 생성 (Python REPL 활성화)
-            agent = create_pandas_dataframe_agent(
-                llm=self.llm,
-                df=df,
-                verbose=True,
-                agent_type=AgentType.ZERO_SHOT_REACT_DESCRIPTION,
-                handle_parsing_errors=True,
-                max_iterations=5,
-                allow_dangerous_code=True  # Python REPL 기능 활성화
-            )
-            
-            # 한국어 프롬프트 개선
-            enhanced_query = f"""
+    def _build_prompt(self, query: str) -> str:
+        """한국어 프롬프트 개선"""
+        return f"""
             다음 질문에 대해 데이터를 분석하고 한국어로 친절하게 답변해주세요:
             
             질문: {query}
@@ -109,34 +265,316 @@ class CSVAnalysisAgent:
             
             답변 형식: 분석 결과를 문장으로 설명하고, 필요시 주요 수치나 발견사항을 포함해주세요.
             """
+    
+    def _answer_locally(
+        self,
+        df: pd.DataFrame,
+        query: str,
+        username: Optional[str] = None,
+        dataset_hash: Optional[str] = None
+    ) -> Optional[Dict[str, Any]]:
+        """결측값/컬럼 집계/고유값 개수/그룹별 평균 같은 단순 질문은 LLM 없이 pandas로 바로 답변"""
+        intent = match_intent(query, df)
+        if intent is None:
+            ANALYSIS_FAST_PATH.inc(intent="none")
+            return None
+        
+        start = time.perf_counter()
+        try:
+            answer = answer_intent(df, intent)
+        except Exception as e:
+            # 계산할 수 없는 경우(예: 숫자로 변환할 수 없는 값)는 LLM 에이전트로 처리
+            print(f"Fast path failed for intent {intent['intent']}: {str(e)}")
+            ANALYSIS_FAST_PATH.inc(intent="none")
+            return None
+        ANALYSIS_FAST_PATH.inc(intent=intent["intent"])
+        duration = time.perf_counter() - start
+        
+        usage = {**empty_usage("fast_path"), "total_seconds": round(duration, 3)}
+        record_usage(username, usage, dataset_hash)
+        return {
+            "success": True,
+            "response": answer["response"],
+            "chart_data": answer["chart_data"],
+            "fast_path": {
+                "intent": intent["intent"],
+                "duration_ms": round(duration * 1000, 2)
+            },
+            "cache": {"hit": False},
+            "api_usage": usage
+        }
+    
+    def _lookup_cached_response(
+        self,
+        dataset_hash: Optional[str],
+        query: str,
+        username: Optional[str] = None
+    ) -> Tuple[Optional[str], Optional[Dict[str, Any]]]:
+        """같은 데이터셋/질문/모델의 응답이 캐시에 있으면 LLM 호출 생략
+
+        Returns:
+            (캐시 키, 캐시된 결과 또는 None)
+        """
+        if not dataset_hash:
+            return None, None
+        cache_key = make_response_key(dataset_hash, query, self.model_name)
+        cached = self.response_cache.get(cache_key)
+        LLM_RESPONSE_CACHE.inc(result="hit" if cached is not None else "miss")
+        if cached is None:
+            return cache_key, None
+        
+        usage = empty_usage("cache")
+        record_usage(username, usage, dataset_hash)
+        return cache_key, {
+            "success": True,
+            "response": cached["response"],
+            "chart_data": cached["chart_data"],
+            "cache": {"hit": True, "age_seconds": cached["age_seconds"]},
+            "api_usage": usage
+        }
+    
+    def _build_result(
+        self,
+        df: pd.DataFrame,
+        query: str,
+        response: Optional[str],
+        cache_key: Optional[str],
+        agent_cache: Dict[str, Any],
+        tracker: AgentUsageTracker,
+        username: Optional[str] = None,
+        dataset_hash: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """에이전트 응답에 차트를 붙이고, 최종 답변이면 응답 캐시에 저장"""
+        usage = tracker.record(username, dataset_hash)
+        if response is None:
+            # 스트리밍 중 최상위 체인의 종료 이벤트를 받지 못한 경우
+            return {
+                "success": False,
+                "error": "분석 중 오류가 발생했습니다: 에이전트가 최종 답변을 반환하지 않았습니다.",
+                "api_usage": usage
+            }
+        
+        # 시각화가 필요한지 판단하고 차트 생성
+        chart_data = self._generate_visualization_if_needed(df, query, response)
+        
+        # 반복/시간 제한으로 중단된 응답은 다시 물으면 성공할 수 있으므로 캐시하지 않음
+        if cache_key is not None and self._is_final_answer(response):
+            self.response_cache.put(cache_key, {"response": response, "chart_data": chart_data})
+        
+        return {
+            "success": True,
+            "response": response,
+            "chart_data": chart_data,
+            "agent_cache": agent_cache,
+            "cache": {"hit": False},
+            "api_usage": usage
+        }
+    
+    @staticmethod
+    def _is_final_answer(response: Any) -> bool:
+        return isinstance(response, str) and bool(response.strip()) and not response.startswith(AGENT_STOPPED_PREFIX)
+    
+    def analyze_query(self, session_id: str, query: str, username: Optional[str] = None) -> Dict[str, Any]:
+        """자연어 쿼리를 분석하여 결과 반환"""
+        df = self._get_session_data(session_id)
+        if df is None:
+            return {
+                "success": False,
+                "error": NO_DATA_ERROR
+            }
+        
+        dataset_hash = self.state.get(DATASET_HASH_NAMESPACE, session_id)
+        fast_result = self._answer_locally(df, query, username, dataset_hash)
+        if fast_result is not None:
+            return fast_result
+        
+        cache_key, cached = self._lookup_cached_response(dataset_hash, query, username)
+        if cached is not None:
+            return cached
+        
+        # 에이전트 실행의 토큰/비용/시간은 성공/실패와 관계없이 finally에서 한 번 집계
+        tracker = AgentUsageTracker()
+        try:
+            enhanced_query = self._build_prompt(query)
             
-            # API 사용량 추적 (최신 버전에서는 invoke 사용)
-            try:
-                result = agent.invoke({"input": enhanced_query})
-                if isinstance(result, dict):
-                    result = result.get("output", str(result))
-            except Exception:
-                # Fallback to older method
-                result = agent.run(enhanced_query)
+            with self._session_run_lock(self._run_locks, session_id, threading.Lock):
+                # 같은 세션의 질문은 프롬프트가 준비된 에이전트를 재사용 (REPL은 실행마다 새로 생성)
+                agent, agent_cache = self._get_agent(session_id, df)
                 
-            # 시각화가 필요한지 판단하고 차트 생성
-            chart_data = self._generate_visualization_if_needed(df, query, result)
+                # API 사용량 추적 (최신 버전에서는 invoke 사용)
+                try:
+                    result = agent.invoke({"input": enhanced_query}, config={"callbacks": [tracker]})
+                    if isinstance(result, dict):
+                        result = result.get("output", str(result))
+                except Exception:
+                    # Fallback to older method
+                    result = agent.run(enhanced_query, callbacks=[tracker])
             
-            return {
-                "success": True,
-                "response": result,
-                "chart_data": chart_data,
-                "api_usage": {
-                    "total_tokens": 0,  # 추후 구현
-                    "total_cost": 0.0   # 추후 구현
-                }
-            }
+            return self._build_result(df, query, result, cache_key, agent_cache, tracker, username, dataset_hash)
             
         except Exception as e:
             return {
                 "success": False,
-                "error": f"분석 중 오류가 발생했습니다: {str(e)}"
+                "error": f"분석 중 오류가 발생했습니다: {str(e)}",
+                "api_usage": tracker.record(username, dataset_hash)
             }
+        finally:
+            tracker.record(username, dataset_hash)
+    
+    async def astream_query(
+        self,
+        session_id: str,
+        query: str,
+        timeout: Optional[float] = None,
+        username: Optional[str] = None
+    ) -> AsyncIterator[Tuple[str, Dict[str, Any]]]:
+        """이벤트 루프를 막지 않고 쿼리를 분석하면서 중간 과정을 (이벤트, 데이터)로 전달
+
+        이벤트 종류:
+            token: LLM이 생성한 토큰 {'text'}
+            step: 도구(Python REPL) 실행 시작/종료 {'tool', 'input'} / {'tool', 'output'}
+            result: 최종 결과 (analyze_query와 같은 형식, 항상 마지막에 한 번)
+
+        같은 세션의 실행은 차례로 처리하고, LLM 호출은 전역 세마포어로 동시 실행 수를 제한한다.
+        대기 시간을 포함해 timeout초가 지나면 중단한다. 호출한 쪽이 순회를 멈추면(클라이언트 연결 종료) 에이전트 실행도 취소된다.
+        """
+        df = self._get_session_data(session_id)
+        if df is None:
+            yield "result", {"success": False, "error": NO_DATA_ERROR}
+            return
+        
+        loop = asyncio.get_running_loop()
+        dataset_hash = self.state.get(DATASET_HASH_NAMESPACE, session_id)
+        fast_result = await loop.run_in_executor(None, self._answer_locally, df, query, username, dataset_hash)
+        if fast_result is not None:
+            yield "result", fast_result
+            return
+        
+        cache_key, cached = self._lookup_cached_response(dataset_hash, query, username)
+        if cached is not None:
+            yield "result", cached
+            return
+        
+        timeout = ANALYSIS_QUERY_TIMEOUT_SECONDS if timeout is None else timeout
+        timeout_error = {"success": False, "error": f"분석 시간이 초과되었습니다 ({timeout:g}초)."}
+        deadline = loop.time() + timeout
+        
+        session_lock = self._session_run_lock(self._async_run_locks, session_id, asyncio.Lock)
+        semaphore = get_llm_semaphore()
+        try:
+            await asyncio.wait_for(session_lock.acquire(), timeout)
+        except asyncio.TimeoutError:
+            yield "result", timeout_error
+            return
+        try:
+            await asyncio.wait_for(semaphore.acquire(), max(deadline - loop.time(), 0))
+        except asyncio.TimeoutError:
+            session_lock.release()
+            yield "result", timeout_error
+            return
+        except BaseException:
+            # 대기 중 취소된 경우
+            session_lock.release()
+            raise
+        
+        # 클라이언트 연결 종료(GeneratorExit/CancelledError)로 중단되어도 사용량은 finally에서 한 번 집계
+        tracker = AgentUsageTracker()
+        try:
+            try:
+                # 에이전트 생성(첫 질문 시 langchain import 포함)은 이벤트 루프 밖에서 실행
+                agent, agent_cache = await loop.run_in_executor(None, self._get_agent, session_id, df)
+                events = agent.astream_events(
+                    {"input": self._build_prompt(query)}, config={"callbacks": [tracker]}, version="v2"
+                )
+                root_run_id = None
+                output = None
+                try:
+                    while True:
+                        remaining = deadline - loop.time()
+                        if remaining <= 0:
+                            raise asyncio.TimeoutError
+                        try:
+                            event = await asyncio.wait_for(events.__anext__(), remaining)
+                        except StopAsyncIteration:
+                            break
+                        
+                        kind = event["event"]
+                        if root_run_id is None:
+                            root_run_id = event["run_id"]
+                        if kind == "on_chat_model_stream":
+                            token = event["data"]["chunk"].content
+                            if token:
+                                yield "token", {"text": token}
+                        elif kind == "on_tool_start":
+                            yield "step", {"tool": event["name"], "input": event["data"].get("input")}
+                        elif kind == "on_tool_end":
+                            yield "step", {"tool": event["name"], "output": str(event["data"].get("output"))}
+                        elif kind == "on_chain_end" and event["run_id"] == root_run_id:
+                            output = event["data"].get("output")
+                            if isinstance(output, dict):
+                                output = output.get("output", str(output))
+                finally:
+                    await events.aclose()
+            except asyncio.TimeoutError:
+                yield "result", {**timeout_error, "api_usage": tracker.record(username, dataset_hash)}
+                return
+            except Exception as e:
+                yield "result", {
+                    "success": False,
+                    "error": f"분석 중 오류가 발생했습니다: {str(e)}",
+                    "api_usage": tracker.record(username, dataset_hash)
+                }
+                return
+            finally:
+                semaphore.release()
+                session_lock.release()
+            
+            result = await loop.run_in_executor(
+                None, self._build_result, df, query, output, cache_key, agent_cache, tracker, username, dataset_hash
+            )
+            yield "result", result
+        finally:
+            tracker.record(username, dataset_hash)
+    
+    async def aanalyze_query(
+        self,
+        session_id: str,
+        query: str,
+        timeout: Optional[float] = None,
+        username: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """analyze_query의 비동기 버전 (스트리밍 없이 최종 결과만 반환)"""
+        result = None
+        async for event, data in self.astream_query(session_id, query, timeout, username):
+            if event == "result":
+                result = data
+        return result
+    
+    @staticmethod
+    def _find_order_column(df: pd.DataFrame, numeric_columns: List[str]) -> Optional[Tuple[str, pd.Series]]:
+        """추세 그래프의 x축으로 쓸 날짜 컬럼 또는 순서 컬럼 (없으면 None)
+
+        날짜 타입 컬럼, 앞부분 값이 모두 날짜로 해석되는 문자열 컬럼, 값이 중복 없이
+        증가하는 수치형 컬럼(연도, 순번 등) 순서로 찾는다. 정렬 기준이 없는 데이터에서는
+        행 순서가 의미가 없으므로 추세 그래프를 그리지 않는다.
+        """
+        for column in df.columns:
+            if pd.api.types.is_datetime64_any_dtype(df[column]):
+                return column, df[column]
+        
+        for column in df.select_dtypes(include=['object', 'category']).columns:
+            sample = df[column].dropna().head(100).astype(str)
+            if sample.empty or not sample.str.contains(r'\d{4}[-/.]\d{1,2}', regex=True).all():
+                continue
+            parsed = pd.to_datetime(df[column].astype('string'), errors='coerce', format='mixed')
+            if parsed.notna().sum() >= 0.9 * df[column].notna().sum():
+                return column, parsed
+        
+        for column in numeric_columns:
+            series = df[column]
+            if series.notna().all() and series.is_unique and series.is_monotonic_increasing:
+                return column, series
+        return None
     
     def _generate_visualization_if_needed(self, df: pd.DataFrame, query: str, analysis_result: str) -> Optional[Dict[str, Any]]:
         """쿼리 내용에 따라 적절한 시각화 생성"""
@@ -146,7 +584,7 @@ class CSVAnalysisAgent:
         visualization_keywords = {
             'distribution': ['분포', '히스토그램', 'distribution', 'hist'],
             'correlation': ['상관관계', '상관', 'correlation', 'corr'],
-            'trend': ['트렌드', '추세', '변화', 'trend', 'time'],
+            'trend': ['트렌드', '추세', '시계열', '시간에 따른', 'trend', 'over time', 'time series'],
             'comparison': ['비교', '차이', 'compare', 'vs', '대비'],
             'top': ['상위', '높은', '최대', 'top', 'high', 'max'],
             'pie': ['비율', '구성', '점유율', 'ratio', 'proportion', 'pie']
@@ -156,6 +594,12 @@ class CSVAnalysisAgent:
             numeric_columns = df.select_dtypes(include=['number']).columns.tolist()
             categorical_columns = df.select_dtypes(include=['object', 'category']).columns.tolist()
             
+            # 추세 그래프는 날짜/순서 컬럼이 있을 때만 그리고, 없으면 아래의 다른 차트를 검사
+            order = None
+            if any(keyword in query_lower for keyword in visualization_keywords['trend']):
+                order = self._find_order_column(df, numeric_columns)
+            trend_columns = [column for column in numeric_columns if order is not None and column != order[0]]
+            
             # 상관관계 분석
             if any(keyword in query_lower for keyword in visualization_keywords['correlation']) and len(numeric_columns) >= 2:
                 corr_matrix = df[numeric_columns].corr()
@@ -169,9 +613,34 @@ class CSVAnalysisAgent:
             # 분포 분석
             elif any(keyword in query_lower for keyword in visualization_keywords['distribution']) and len(numeric_columns) > 0:
                 col = numeric_columns[0]  # 첫 번째 숫자 컬럼 사용
-                fig = px.histogram(df, x=col, title=f"{col} 분포")
+                # 원시 값 대신 서버에서 계산한 구간별 개수만 전송
+                values = df[col].to_numpy(dtype=np.float64, na_value=np.nan)
+                counts, edges = np.histogram(values[np.isfinite(values)], bins=30)
+                fig = go.Figure(go.Bar(
+                    x=(edges[:-1] + edges[1:]) / 2,
+                    y=counts,
+                    width=np.diff(edges)
+                ))
+                fig.update_layout(title=f"{col} 분포", xaxis_title=col, yaxis_title="count", bargap=0)
                 return {"type": "distribution", "data": fig.to_json()}
             
+            # 추세 분석 (날짜/순서 컬럼 기준 선 그래프, LTTB로 점 개수 제한)
+            elif trend_columns:
+                order_column, order_values = order
+                col = trend_columns[0]
+                values = df[col].to_numpy(dtype=np.float64, na_value=np.nan)
+                if pd.api.types.is_datetime64_any_dtype(order_values):
+                    x = np.where(order_values.isna(), np.nan, order_values.to_numpy('datetime64[ns]').astype(np.int64))
+                else:
+                    x = order_values.to_numpy(dtype=np.float64, na_value=np.nan)
+                positions = np.flatnonzero(np.isfinite(values) & np.isfinite(x))
+                positions = positions[np.argsort(x[positions], kind='stable')]
+                selected = positions[Downsampler(CHART_MAX_POINTS).lttb_indices(x[positions], values[positions])]
+                x_values = order_values.iloc[selected]
+                fig = go.Figure(go.Scattergl(x=x_values, y=values[selected], mode='lines', name=col))
+                fig.update_layout(title=f"{order_column}에 따른 {col} 추세", xaxis_title=order_column, yaxis_title=col)
+                return {"type": "trend", "data": fig.to_json()}
+            
             # 비율/파이 차트
             elif any(keyword in query_lower for keyword in visualization_keywords['pie']) and len(categorical_columns) > 0:
                 col = categorical_columns[0]
@@ -200,10 +669,10 @@ class CSVAnalysisAgent:
     
     def get_suggested_queries(self, session_id: str) -> List[str]:
         """데이터에 기반한 추천 질문 생성"""
-        if session_id not in self.session_data:
+        df = self._get_session_data(session_id)
+        if df is None:
             return []
         
-        df = self.session_data[session_id]
         suggestions = [
             "데이터의 전체적인 요약을 보여주세요",
             "결측값이 있는 컬럼들을 알려주세요",
@@ -215,7 +684,7 @@ class CSVAnalysisAgent:
         if numeric_columns:
             suggestions.extend([
                 f"{numeric_columns[0]}의 평균과 최댓값을 알려주세요",
-                f"숫자형 컬럼들 간의 상관관계를 분석해주세요"
+                "숫자형 컬럼들 간의 상관관계를 분석해주세요"
             ])
         
         if categorical_columns:
@@ -230,19 +699,22 @@ class CSVAnalysisAgent:
         return suggestions[:8]  # 최대 8개 제한
     
     def clear_session_data(self, session_id: str):
-        """세션 데이터 삭제"""
-        if session_id in self.session_data:
-            del self.session_data[session_id]
+        """세션 데이터 삭제 (다른 워커의 사본은 다음 조회 때 해시가 없어서 버려짐)"""
+        with self._session_lock:
+            self.session_data.pop(session_id, None)
+        self._invalidate_agent(session_id)
+        self.state.delete_frame(f"analysis-{session_id}")
+        self.state.delete(DATASET_HASH_NAMESPACE, session_id)
     
     def get_data_info(self, session_id: str) -> Optional[Dict[str, Any]]:
         """세션의 데이터 정보 반환"""
-        if session_id not in self.session_data:
+        df = self._get_session_data(session_id)
+        if df is None:
             return None
         
-        df = self.session_data[session_id]
         return {
             "shape": df.shape,
             "columns": df.columns.tolist(),
             "dtypes": df.dtypes.astype(str).to_dict(),
-            "memory_usage": df.memory_usage(deep=True).sum()
+            "memory_usage": int(df.memory_usage(deep=True).sum())
         }
\ No newline at end of file
@@ -1,79 +1,144 @@
 from datetime import datetime, timedelta
-from typing import Optional
-from jose import JWTError, jwt
-from passlib.context import CryptContext
+from typing import Optional, Tuple
+from functools import lru_cache
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from fastapi import HTTPException, status
+import asyncio
 import os
+import threading
+import time
 from ..models.schemas import User, UserCreate
+from .user_store import get_user_repository, UserAlreadyExists
 
 # 설정
 SECRET_KEY = os.getenv("JWT_SECRET_KEY", "your-secret-key-here-change-this-in-production")
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 30
+# 관리자 권한(프로파일링 등)을 가진 사용자명 (쉼표로 구분)
+ADMIN_USERNAMES = {name.strip() for name in os.getenv("ADMIN_USERNAMES", "admin").split(",") if name.strip()}
+# bcrypt 해싱/검증 전용 스레드 수 (이벤트 루프를 막지 않도록 별도 풀에서 실행)
+PASSWORD_HASH_WORKERS = int(os.getenv("PASSWORD_HASH_WORKERS", "4"))
+# 검증된 토큰 -> 사용자 캐시 (토큰 만료 시각을 넘겨서 보관하지 않음)
+TOKEN_CACHE_TTL_SECONDS = float(os.getenv("TOKEN_CACHE_TTL_SECONDS", "60"))
+TOKEN_CACHE_SIZE = int(os.getenv("TOKEN_CACHE_SIZE", "1024"))
 
-# 비밀번호 해싱
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+@lru_cache(maxsize=1)
+def get_pwd_context():
+    """비밀번호 해싱 컨텍스트 (passlib/bcrypt는 처음 사용할 때 로드)"""
+    from passlib.context import CryptContext
+    return CryptContext(schemes=["bcrypt"], deprecated="auto")
 
-# 임시 사용자 데이터베이스 (실제 환경에서는 DB 사용)
-fake_users_db = {}
-user_id_counter = 1
+@lru_cache(maxsize=1)
+def get_password_executor() -> ThreadPoolExecutor:
+    """bcrypt 작업용 스레드 풀 (동시에 실행되는 해싱 수를 제한)"""
+    return ThreadPoolExecutor(max_workers=PASSWORD_HASH_WORKERS, thread_name_prefix="password-hash")
+
+async def _run_in_password_executor(func, *args):
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(get_password_executor(), func, *args)
+
+# 사용자 정보는 SQLite 사용자 저장소(user_store)에 보관 (사용자명/이메일 유니크 인덱스)
+
+# 토큰 -> (만료 시각, 사용자) LRU 캐시
+_token_cache: "OrderedDict[str, Tuple[float, User]]" = OrderedDict()
+_token_cache_lock = threading.Lock()
+
+# 기본 관리자 계정은 bcrypt 해시 비용 때문에 import 시점이 아닌 첫 사용자 조회 시 생성
+_default_admin_lock = threading.Lock()
+_default_admin_ready = False
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """비밀번호 검증"""
-    return pwd_context.verify(plain_password, hashed_password)
+    return get_pwd_context().verify(plain_password, hashed_password)
 
 def get_password_hash(password: str) -> str:
     """비밀번호 해시화"""
-    return pwd_context.hash(password)
+    return get_pwd_context().hash(password)
 
-def create_user(user_data: UserCreate) -> User:
-    """새 사용자 생성"""
-    global user_id_counter
-    
-    # 이메일 중복 체크
-    for user in fake_users_db.values():
-        if user["email"] == user_data.email:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="이미 등록된 이메일입니다."
-            )
-    
-    # 사용자명 중복 체크
-    for user in fake_users_db.values():
-        if user["username"] == user_data.username:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="이미 사용 중인 사용자명입니다."
-            )
+def _email_taken() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        detail="이미 등록된 이메일입니다."
+    )
+
+def _username_taken() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        detail="이미 사용 중인 사용자명입니다."
+    )
+
+def _check_available(repository, user_data: UserCreate) -> None:
+    """이메일/사용자명 중복 체크 (인덱스 조회)"""
+    if repository.get_by_email(user_data.email) is not None:
+        raise _email_taken()
+    if repository.get_by_username(user_data.username) is not None:
+        raise _username_taken()
+
+def create_user(user_data: UserCreate, hashed_password: Optional[str] = None) -> User:
+    """새 사용자 생성
+
+    Args:
+        user_data: 회원가입 정보
+        hashed_password: 미리 계산한 비밀번호 해시 (없으면 여기서 계산)
+    """
+    _ensure_default_admin()
+    return _insert_user(user_data, hashed_password)
+
+def _insert_user(user_data: UserCreate, hashed_password: Optional[str] = None) -> User:
+    """중복 체크 후 사용자 저장 (기본 관리자 생성에서도 사용하므로 관리자 확인은 하지 않음)"""
+    repository = get_user_repository()
+    _check_available(repository, user_data)
     
     # 새 사용자 생성
-    hashed_password = get_password_hash(user_data.password)
-    user_dict = {
-        "id": user_id_counter,
-        "email": user_data.email,
-        "username": user_data.username,
-        "full_name": user_data.full_name,
-        "hashed_password": hashed_password,
-        "is_active": True,
-        "created_at": datetime.utcnow()
-    }
-    
-    fake_users_db[user_data.username] = user_dict
-    user_id_counter += 1
+    if hashed_password is None:
+        hashed_password = get_password_hash(user_data.password)
+    try:
+        user_dict = repository.add(
+            email=user_data.email,
+            username=user_data.username,
+            full_name=user_data.full_name,
+            hashed_password=hashed_password,
+            created_at=datetime.utcnow()
+        )
+    except UserAlreadyExists as e:
+        # 중복 체크 이후 다른 요청(워커)이 같은 이메일/사용자명을 먼저 등록한 경우
+        raise _email_taken() if e.field == "email" else _username_taken()
     
     return User(**user_dict)
 
+async def register_user(user_data: UserCreate) -> User:
+    """회원가입 (bcrypt 해싱은 전용 스레드 풀에서 실행)"""
+    await _ensure_default_admin_async()
+    # 중복이면 해싱 전에 바로 거절
+    _check_available(get_user_repository(), user_data)
+    hashed_password = await _run_in_password_executor(get_password_hash, user_data.password)
+    return create_user(user_data, hashed_password)
+
 def authenticate_user(username: str, password: str) -> Optional[dict]:
     """사용자 인증"""
-    user = fake_users_db.get(username)
+    _ensure_default_admin()
+    user = get_user_repository().get_by_username(username)
     if not user:
         return None
     if not verify_password(password, user["hashed_password"]):
         return None
     return user
 
+async def authenticate_user_async(username: str, password: str) -> Optional[dict]:
+    """사용자 인증 (bcrypt 검증은 전용 스레드 풀에서 실행)"""
+    await _ensure_default_admin_async()
+    user = get_user_repository().get_by_username(username)
+    if not user:
+        return None
+    if not await _run_in_password_executor(verify_password, password, user["hashed_password"]):
+        return None
+    return user
+
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     """JWT 토큰 생성"""
+    from jose import jwt
+    
     to_encode = data.copy()
     if expires_delta:
         expire = datetime.utcnow() + expires_delta
@@ -84,37 +149,98 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
     return encoded_jwt
 
-def decode_access_token(token: str) -> Optional[str]:
-    """JWT 토큰 디코딩"""
+def _decode_token_payload(token: str) -> Optional[dict]:
+    from jose import JWTError, jwt
+    
     try:
         payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        username: str = payload.get("sub")
-        if username is None:
-            return None
-        return username
     except JWTError:
         return None
+    if payload.get("sub") is None:
+        return None
+    return payload
+
+def decode_access_token(token: str) -> Optional[str]:
+    """JWT 토큰 디코딩"""
+    payload = _decode_token_payload(token)
+    if payload is None:
+        return None
+    return payload["sub"]
+
+def get_user_for_token(token: str) -> Optional[User]:
+    """토큰으로 사용자 조회 (검증된 토큰은 TTL 동안 캐시해서 JWT 디코딩/조회를 생략)"""
+    now = time.time()
+    with _token_cache_lock:
+        cached = _token_cache.get(token)
+        if cached is not None:
+            if cached[0] > now:
+                _token_cache.move_to_end(token)
+                return cached[1]
+            del _token_cache[token]
+    
+    payload = _decode_token_payload(token)
+    if payload is None:
+        return None
+    user = get_user(payload["sub"])
+    if user is None:
+        return None
+    
+    expires_at = min(now + TOKEN_CACHE_TTL_SECONDS, float(payload.get("exp", now)))
+    with _token_cache_lock:
+        _token_cache[token] = (expires_at, user)
+        _token_cache.move_to_end(token)
+        while len(_token_cache) > TOKEN_CACHE_SIZE:
+            _token_cache.popitem(last=False)
+    return user
 
 def get_user(username: str) -> Optional[User]:
     """사용자 정보 조회"""
-    user_dict = fake_users_db.get(username)
+    _ensure_default_admin()
+    user_dict = get_user_repository().get_by_username(username)
     if user_dict:
         return User(**user_dict)
     return None
 
+def is_admin(username: str) -> bool:
+    """관리자 계정 여부"""
+    _ensure_default_admin()
+    return username in ADMIN_USERNAMES and get_user_repository().get_by_username(username) is not None
+
 # 기본 관리자 계정 생성
 def create_default_admin():
     """기본 관리자 계정 생성"""
     admin_username = "admin"
-    if admin_username not in fake_users_db:
+    if get_user_repository().get_by_username(admin_username) is None:
         admin_data = UserCreate(
             email="admin@dddb.com",
             username=admin_username,
             password="admin123",
             full_name="관리자"
         )
-        create_user(admin_data)
+        try:
+            _insert_user(admin_data)
+        except HTTPException:
+            # 다른 워커가 먼저 생성한 경우
+            return
         print("기본 관리자 계정이 생성되었습니다. (username: admin, password: admin123)")
 
-# 시작 시 기본 관리자 계정 생성
-create_default_admin()
\ No newline at end of file
+async def _ensure_default_admin_async():
+    """기본 관리자 계정 생성(bcrypt 해싱 포함)을 이벤트 루프 밖에서 실행"""
+    if not _default_admin_ready:
+        await _run_in_password_executor(_ensure_default_admin)
+
+def _ensure_default_admin():
+    """기본 관리자 계정이 없으면 한 번만 생성"""
+    global _default_admin_ready
+    if _default_admin_ready:
+        return
+    with _default_admin_lock:
+        if _default_admin_ready:
+            return
+        try:
+            create_default_admin()
+        except Exception as e:
+            # DB 잠금 등 일시적인 실패는 다음 요청에서 다시 시도
+            print(f"Warning: Could not create default admin account: {e}")
+            return
+        _default_admin_ready = True
\ No newline at end of file
@@ -3,11 +3,14 @@ import pandas as pd
 import numpy as np
 import io
 import time
-import json
+import base64
+import hashlib
+import uuid
+import orjson
+import pyarrow as pa
+from collections import OrderedDict
 import plotly.graph_objects as go
-import plotly.express as px
-from plotly.utils import PlotlyJSONEncoder
-from typing import Dict, Any, Optional, Tuple
+from typing import Dict, Any, Optional, Tuple, Union, BinaryIO, List
 
 # 기존 클래스들을 import
 import sys
@@ -20,6 +23,24 @@ sys.path.append(current_dir)
 from data_augmentation import DataAugmentor
 from data_preprocessing import DataPreprocessor
 from visualization import DataVisualizer
+from correlation import CorrelationEngine
+from stage_timer import StageTimer
+
+from .ingestion import read_csv_source
+from .memory_optimization import optimize_dtypes, apply_dtype_plan
+from .dataset_cache import DatasetCache
+from .pipeline_cache import TieredLRUCache, make_cache_key
+from .upload import compute_content_hash
+from .statistics import compute_statistics, merge_statistics, describe_statistics
+from .metrics import record_stages
+from .state import get_state
+
+# 렌더링된 차트 캐시 크기 (항목 수)
+VISUALIZATION_CACHE_SIZE = int(os.getenv("VISUALIZATION_CACHE_SIZE", "64"))
+# 상관관계 계산에 사용할 최대 행 수 (초과 시 부분 표본)
+CORRELATION_MAX_ROWS = int(os.getenv("CORRELATION_MAX_ROWS", "200000"))
+# 공유 상태 저장소에서 데이터 스냅샷을 보관하는 네임스페이스
+STATE_NAMESPACE = "data"
 
 class DataProcessingService:
     """데이터 처리 서비스"""
@@ -29,41 +50,189 @@ class DataProcessingService:
         self.original_data = None
         self.preprocessor = None
         self.augmentor = None
+        self.dtype_plan: Dict[str, str] = {}
+        self.dataset_hash: Optional[str] = None
+        self.dataset_key: Optional[str] = None
+        self.dataset_cache = DatasetCache()
+        self.pipeline_cache = TieredLRUCache()
+        # current_data가 바뀔 때마다 증가 (페이징 커서, 캐시 무효화, ETag에 사용)
+        self.data_version = 0
+        # 멀티 워커 실행 시 데이터와 data_version을 워커 간에 공유
+        self.state = get_state()
+        # 프로세스 재시작 후 같은 data_version 값이 다른 데이터를 가리키지 않도록 ETag에 포함
+        # (공유 저장소에서는 모든 워커가 같은 값을 사용)
+        self.instance_id = uuid.uuid4().hex[:8]
+        if self.state.shared:
+            self.state.add(STATE_NAMESPACE, 'instance_id', self.instance_id)
+            self.instance_id = self.state.get(STATE_NAMESPACE, 'instance_id')
+        self.original_statistics: Optional[Dict[str, Any]] = None
+        self.current_statistics: Optional[Dict[str, Any]] = None
+        self._arrow_table: Optional[Tuple[int, pa.Table]] = None
+        self._visualization_cache: "OrderedDict[Tuple, Union[str, bytes]]" = OrderedDict()
+        self.correlation_engine = CorrelationEngine(max_rows=CORRELATION_MAX_ROWS)
+        self._correlation: Optional[Tuple[int, List[str], np.ndarray]] = None
         self.visualizer = DataVisualizer()
         
-    def load_csv_data(self, file_content: bytes, filename: str) -> Dict[str, Any]:
-        """CSV 파일 로드 및 기본 정보 반환"""
+    def _publish(self, original_changed: bool) -> None:
+        """data_version을 올리고, 공유 저장소라면 다른 워커가 읽을 수 있도록 스냅샷 저장"""
+        version = self.state.incr('data_version')
+        if self.state.shared:
+            new_original_frame = f"data-original-{version}" if original_changed else None
+            current_frame = f"data-current-{version}"
+            if original_changed:
+                self.state.put_frame(new_original_frame, self.original_data)
+            self.state.put_frame(current_frame, self.current_data)
+            
+            # 스냅샷 교체와 retired_frames 갱신은 한 트랜잭션에서 수행 (동시에 발행하는 워커/스레드와 경합 방지)
+            replaced: Dict[str, Any] = {}
+            
+            def swap(previous: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+                replaced['previous'] = previous
+                if previous is not None and previous['version'] > version:
+                    # 더 늦게 시작한 발행이 먼저 저장된 경우: 새 스냅샷을 유지하고 이 발행의 파일은 다음 발행 때 삭제
+                    own_frames = [frame for frame in (current_frame, new_original_frame) if frame is not None]
+                    return {**previous, 'retired_frames': previous.get('retired_frames', []) + own_frames}
+                
+                original_frame = new_original_frame or previous['original_frame']
+                # 이전 스냅샷에서 더 이상 쓰지 않는 파일은 바로 지우지 않고 다음 발행 때 삭제
+                # (다른 워커가 sync_from_state에서 이전 스냅샷을 읽는 중일 수 있음)
+                retired_frames = [] if previous is None else [
+                    frame for frame in (previous['current_frame'], previous['original_frame'])
+                    if frame not in (current_frame, original_frame)
+                ]
+                return {
+                    'version': version,
+                    'original_frame': original_frame,
+                    'current_frame': current_frame,
+                    'retired_frames': retired_frames,
+                    'dataset_hash': self.dataset_hash,
+                    'dataset_key': self.dataset_key,
+                    'dtype_plan': self.dtype_plan,
+                    'original_statistics': self.original_statistics,
+                    'current_statistics': self.current_statistics
+                }
+            
+            snapshot = self.state.update(STATE_NAMESPACE, 'snapshot', swap)
+            # 두 단계 전 스냅샷의 파일 정리 (교체한 경우에만, 교체된 스냅샷의 retired_frames는 이 발행만 삭제)
+            previous = replaced['previous']
+            if previous is not None and snapshot['version'] == version:
+                for frame in previous.get('retired_frames', []):
+                    self.state.delete_frame(frame)
+        self.data_version = version
+    
+    def sync_from_state(self) -> None:
+        """다른 워커가 더 새로운 데이터를 저장했으면 로컬 상태를 갱신"""
+        if not self.state.shared:
+            return
+        snapshot = self.state.get(STATE_NAMESPACE, 'snapshot')
+        if snapshot is None or snapshot['version'] == self.data_version:
+            return
+        
+        current_data = self.state.get_frame(snapshot['current_frame'])
+        original_data = self.state.get_frame(snapshot['original_frame'])
+        if current_data is None or original_data is None:
+            # 그 사이 다른 워커가 새 스냅샷으로 교체한 경우 (다음 요청에서 다시 동기화)
+            return
+        
+        self.original_data = apply_dtype_plan(original_data, snapshot['dtype_plan'])
+        self.current_data = apply_dtype_plan(current_data, snapshot['dtype_plan'])
+        self.dataset_hash = snapshot['dataset_hash']
+        self.dataset_key = snapshot['dataset_key']
+        self.dtype_plan = snapshot['dtype_plan']
+        self.original_statistics = snapshot['original_statistics']
+        self.current_statistics = snapshot['current_statistics']
+        self.data_version = snapshot['version']
+    
+    def load_csv_data(
+        self,
+        source: Union[bytes, BinaryIO],
+        filename: str,
+        optimize_memory: bool = True,
+        content_hash: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """CSV 파일 로드 및 기본 정보 반환
+
+        Args:
+            source: CSV 바이트 또는 디스크에 스풀된 업로드 파일 객체
+            filename: 업로드된 파일명
+            optimize_memory: 수치형 다운캐스팅 및 문자열 category 변환 여부
+            content_hash: 업로드 시 계산된 내용 해시 (없으면 여기서 계산)
+        """
+        if isinstance(source, (bytes, bytearray)):
+            source = io.BytesIO(source)
+        
+        timer = StageTimer()
         try:
-            # 인코딩 자동 감지해서 로드
-            try:
-                df = pd.read_csv(io.BytesIO(file_content), encoding='utf-8')
-            except UnicodeDecodeError:
-                try:
-                    df = pd.read_csv(io.BytesIO(file_content), encoding='cp949')
-                except UnicodeDecodeError:
-                    try:
-                        df = pd.read_csv(io.BytesIO(file_content), encoding='latin-1')
-                    except Exception:
-                        df = pd.read_csv(io.BytesIO(file_content), encoding='utf-8', errors='ignore')
+            if content_hash is None:
+                content_hash = compute_content_hash(source)
+            
+            # 동일한 내용이 이미 파싱되어 있으면 캐시 파일을 메모리 맵으로 읽음
+            cache_key = f"{content_hash}-{'opt' if optimize_memory else 'raw'}"
+            with timer.stage('ingest') as record:
+                cached = self.dataset_cache.get(cache_key)
+                if cached is None:
+                    # 인코딩/구분자를 앞부분에서 감지한 뒤 한 번만 파싱
+                    df, ingestion_info = read_csv_source(source)
+                else:
+                    df = cached[0]
+                record['rows'] = len(df)
             
+            if cached is not None:
+                df, metadata = cached
+                ingestion_info = metadata.get('ingestion')
+                memory_info = metadata.get('memory_usage')
+                self.dtype_plan = metadata.get('dtype_plan', {})
+            else:
+                # 메모리 최적화 (dtype 계획은 전처리/증강 결과에도 다시 적용)
+                memory_info = None
+                self.dtype_plan = {}
+                if optimize_memory:
+                    with timer.stage('type_conversion', len(df)):
+                        df, self.dtype_plan, memory_info = optimize_dtypes(df)
+                
+                self.dataset_cache.put(cache_key, df, {
+                    'ingestion': ingestion_info,
+                    'memory_usage': memory_info,
+                    'dtype_plan': self.dtype_plan
+                })
+            
+            self.dataset_hash = content_hash
+            self.dataset_key = cache_key
             self.original_data = df.copy()
             self.current_data = df.copy()
             
-            # 데이터 요약 정보 생성
-            summary = self._generate_data_summary(df)
+            # 통계는 데이터가 만들어질 때 한 번만 계산해서 보관
+            with timer.stage('statistics', len(df)):
+                self.original_statistics = compute_statistics(df)
+                self.current_statistics = self.original_statistics
+            self._publish(original_changed=True)
             
-            # 샘플 데이터 (처음 10행)
-            sample_data = df.head(10).to_dict('records')
+            with timer.stage('serialize', len(df)):
+                # 데이터 요약 정보 생성
+                summary = self._generate_data_summary(df)
+                
+                # 샘플 데이터 (처음 10행)
+                sample_data = df.head(10).to_dict('records')
             
+            record_stages('upload', timer.stages)
             return {
                 'success': True,
                 'message': '파일이 성공적으로 로드되었습니다.',
                 'summary': summary,
                 'sample_data': sample_data,
-                'columns': df.columns.tolist()
+                'columns': df.columns.tolist(),
+                'ingestion': ingestion_info,
+                'memory_usage': memory_info,
+                'dtype_plan': self.dtype_plan,
+                'cache': {
+                    'hit': cached is not None,
+                    'content_hash': content_hash
+                },
+                'stages': timer.summary()
             }
             
         except Exception as e:
+            record_stages('upload', timer.stages, status='error')
             raise HTTPException(status_code=400, detail=f"파일 로드 중 오류 발생: {str(e)}")
     
     def _generate_data_summary(self, df: pd.DataFrame) -> Dict[str, Any]:
@@ -88,6 +257,7 @@ class DataProcessingService:
         if self.original_data is None:
             raise HTTPException(status_code=400, detail="먼저 데이터를 업로드해주세요.")
         
+        timer = StageTimer()
         try:
             start_time = time.time()
             
@@ -95,39 +265,108 @@ class DataProcessingService:
             preprocessing_config = processing_config.get('preprocessing_config', {})
             augmentation_config = processing_config.get('augmentation_config', {})
             
-            # 전처리 실행
-            self.preprocessor = DataPreprocessor(
-                missing_strategy=preprocessing_config.get('missing_strategy', 'mean'),
-                outlier_strategy=preprocessing_config.get('outlier_strategy', 'none'),
-                column_types=preprocessing_config.get('column_types', {})
-            )
+            # 전처리 실행 (데이터셋 해시 + 전처리 설정이 같으면 캐시된 결과 재사용)
+            preprocess_key = make_cache_key('preprocess', self.dataset_key, preprocessing_config)
+            cached_preprocess, preprocess_cache = self.pipeline_cache.lookup(preprocess_key)
             
-            processed_data = self.preprocessor.fit_transform(self.original_data)
+            if cached_preprocess is not None:
+                self.preprocessor, processed_data, dtype_plan, processed_statistics = cached_preprocess
+            else:
+                self.preprocessor = DataPreprocessor(
+                    missing_strategy=preprocessing_config.get('missing_strategy', 'mean'),
+                    outlier_strategy=preprocessing_config.get('outlier_strategy', 'none'),
+                    column_types=preprocessing_config.get('column_types', {})
+                )
+                
+                processed_data = self.preprocessor.fit_transform(self.original_data, timer)
+                
+                # 사용자가 지정한 컬럼 타입을 제외하고 로드 시점의 dtype 계획 유지
+                dtype_plan = {
+                    column: dtype for column, dtype in self.dtype_plan.items()
+                    if column not in self.preprocessor.column_types
+                }
+                with timer.stage('type_conversion', len(processed_data)):
+                    processed_data = apply_dtype_plan(processed_data, dtype_plan)
+                with timer.stage('statistics', len(processed_data)):
+                    processed_statistics = compute_statistics(processed_data)
+                self.pipeline_cache.put(
+                    preprocess_key,
+                    (self.preprocessor, processed_data, dtype_plan, processed_statistics)
+                )
             
             # 증강 실행
             method = augmentation_config.get('method', 'gaussian_copula')
             
+            # 학습된 모델은 샘플 수와 무관하므로 증강 비율/목표 행 수를 제외한 설정으로 캐시
+            fit_config = {
+                key: value for key, value in augmentation_config.items()
+                if key not in ('augmentation_ratio', 'target_rows')
+            }
+            augment_key = make_cache_key('augment', preprocess_key, fit_config)
+            
             if method == 'smote':
-                self.augmentor = DataAugmentor(
-                    method=method,
-                    target_column=augmentation_config.get('target_column'),
-                    k_neighbors=augmentation_config.get('k_neighbors', 5),
-                    sampling_strategy=augmentation_config.get('sampling_strategy', 'auto')
-                )
+                # SMOTE는 샘플링 전략에 따라 결과가 정해지므로 결과 자체를 캐시
+                cached_augment, augment_cache = self.pipeline_cache.lookup(augment_key)
+                if cached_augment is not None:
+                    self.augmentor, augmented_data = cached_augment
+                else:
+                    self.augmentor = DataAugmentor(
+                        method=method,
+                        target_column=augmentation_config.get('target_column'),
+                        k_neighbors=augmentation_config.get('k_neighbors', 5),
+                        sampling_strategy=augmentation_config.get('sampling_strategy', 'auto')
+                    )
+                    # SMOTE는 학습과 샘플링이 한 번에 이뤄지므로 하나의 fit 단계로 기록
+                    with timer.stage('fit', len(processed_data)) as record:
+                        augmented_data = self.augmentor.fit_transform(processed_data)
+                        record['rows'] = len(augmented_data)
+                    self.pipeline_cache.put(augment_key, (self.augmentor, augmented_data))
             else:
-                self.augmentor = DataAugmentor(
-                    method=method,
-                    augmentation_ratio=augmentation_config.get('augmentation_ratio', 1.0),
-                    target_rows=augmentation_config.get('target_rows')
+                augmentation_ratio = augmentation_config.get('augmentation_ratio', 1.0)
+                target_rows = augmentation_config.get('target_rows')
+                
+                cached_augment, augment_cache = self.pipeline_cache.lookup(augment_key)
+                if cached_augment is not None:
+                    self.augmentor = cached_augment
+                else:
+                    with timer.stage('fit', len(processed_data)):
+                        self.augmentor = DataAugmentor(
+                            method=method,
+                            augmentation_ratio=augmentation_ratio,
+                            target_rows=target_rows
+                        ).fit(processed_data)
+                    self.pipeline_cache.put(augment_key, self.augmentor)
+                
+                # 비율만 바뀐 경우 학습 없이 샘플링만 수행
+                num_samples = DataAugmentor.compute_num_samples(
+                    len(processed_data), augmentation_ratio, target_rows
                 )
+                augmented_data = self.augmentor.transform(processed_data, num_samples, timer)
+            
+            with timer.stage('type_conversion', len(augmented_data)):
+                self.current_data = apply_dtype_plan(augmented_data, dtype_plan)
             
-            self.current_data = self.augmentor.fit_transform(processed_data)
+            with timer.stage('statistics', len(self.current_data)):
+                if method == 'smote':
+                    # SMOTE 결과는 원본 행 순서를 보존하지 않으므로 전체를 다시 계산
+                    self.current_statistics = compute_statistics(self.current_data)
+                else:
+                    # 전처리 결과 통계에 합성 블록 통계만 병합
+                    synthetic_block = self.current_data.iloc[len(processed_data):]
+                    self.current_statistics = merge_statistics(
+                        processed_statistics, compute_statistics(synthetic_block), self.current_data
+                    )
+            self._publish(original_changed=False)
             
             processing_time = time.time() - start_time
             original_rows = len(self.original_data)
             augmented_rows = len(self.current_data)
             increase_ratio = ((augmented_rows - original_rows) / original_rows) * 100
             
+            with timer.stage('serialize', augmented_rows):
+                summary = self._generate_data_summary(self.current_data)
+            
+            record_stages('process', timer.stages)
             return {
                 'success': True,
                 'message': '데이터 처리가 완료되었습니다.',
@@ -135,10 +374,16 @@ class DataProcessingService:
                 'augmented_rows': augmented_rows,
                 'increase_ratio': round(increase_ratio, 2),
                 'processing_time': round(processing_time, 2),
-                'summary': self._generate_data_summary(self.current_data)
+                'summary': summary,
+                'cache': {
+                    'preprocessing': preprocess_cache or 'miss',
+                    'augmentation': augment_cache or 'miss'
+                },
+                'stages': timer.summary()
             }
             
         except Exception as e:
+            record_stages('process', timer.stages, status='error')
             raise HTTPException(status_code=500, detail=f"데이터 처리 중 오류 발생: {str(e)}")
     
     def get_processed_data(self, page: int = 0, page_size: int = 100) -> Dict[str, Any]:
@@ -159,6 +404,108 @@ class DataProcessingService:
             'total_pages': (len(self.current_data) + page_size - 1) // page_size
         }
     
+    def make_etag(self, *parts: Any) -> Optional[str]:
+        """현재 데이터 버전과 요청 파라미터로 약한 ETag 생성 (데이터가 없으면 None)
+
+        gzip 압축 여부와 관계없이 같은 내용이면 같은 값이므로 약한 ETag로 표시한다.
+        """
+        if self.current_data is None:
+            return None
+        payload = orjson.dumps([self.instance_id, self.data_version, *parts], default=str)
+        return f'W/"{self.data_version}-{hashlib.blake2b(payload, digest_size=8).hexdigest()}"'
+    
+    def _encode_cursor(self, offset: int) -> str:
+        """페이징 커서 생성 (데이터 버전 + 행 오프셋)"""
+        payload = orjson.dumps({'v': self.data_version, 'o': offset})
+        return base64.urlsafe_b64encode(payload).decode('ascii')
+    
+    def _decode_cursor(self, cursor: str) -> int:
+        """페이징 커서에서 행 오프셋 추출"""
+        try:
+            payload = orjson.loads(base64.urlsafe_b64decode(cursor.encode('ascii')))
+            version, offset = int(payload['v']), int(payload['o'])
+        except Exception:
+            raise HTTPException(status_code=400, detail="잘못된 커서입니다.")
+        
+        if version != self.data_version:
+            raise HTTPException(status_code=409, detail="데이터가 변경되었습니다. 처음부터 다시 조회해주세요.")
+        if offset < 0 or offset > len(self.current_data):
+            raise HTTPException(status_code=400, detail="잘못된 커서입니다.")
+        return offset
+    
+    def _get_arrow_table(self) -> pa.Table:
+        """현재 데이터의 Arrow 테이블 (데이터 버전별로 한 번만 변환)"""
+        if self._arrow_table is None or self._arrow_table[0] != self.data_version:
+            table = pa.Table.from_pandas(self.current_data, preserve_index=False)
+            self._arrow_table = (self.data_version, table)
+        return self._arrow_table[1]
+    
+    def get_processed_columnar(
+        self,
+        cursor: Optional[str] = None,
+        page_size: int = 100,
+        columns: Optional[List[str]] = None,
+        output_format: str = 'columnar',
+        page: int = 0
+    ) -> Tuple[bytes, Optional[str]]:
+        """처리된 데이터를 컬럼 단위로 페이징해서 직렬화된 바이트로 반환
+
+        Args:
+            cursor: 이전 응답의 next_cursor (없으면 처음부터)
+            page_size: 페이지당 행 수
+            columns: 조회할 컬럼 목록 (없으면 전체)
+            output_format: 'columnar' (컬럼명 -> 배열 JSON) 또는 'arrow' (Arrow IPC 스트림)
+            page: 커서가 없을 때 시작할 페이지 번호
+
+        Returns:
+            직렬화된 페이지, 다음 페이지 커서 (마지막 페이지면 None)
+        """
+        if self.current_data is None:
+            raise HTTPException(status_code=400, detail="처리된 데이터가 없습니다.")
+        
+        total_rows = len(self.current_data)
+        offset = self._decode_cursor(cursor) if cursor else min(page * page_size, total_rows)
+        
+        if columns:
+            missing = [column for column in columns if column not in self.current_data.columns]
+            if missing:
+                raise HTTPException(status_code=400, detail=f"컬럼을 찾을 수 없습니다: {', '.join(missing)}")
+        else:
+            columns = self.current_data.columns.tolist()
+        
+        end = min(offset + page_size, total_rows)
+        next_cursor = self._encode_cursor(end) if end < total_rows else None
+        
+        if output_format == 'arrow':
+            # 버전별로 변환해 둔 테이블을 zero-copy로 잘라서 전송
+            batch = self._get_arrow_table().select(columns).slice(offset, end - offset)
+            sink = pa.BufferOutputStream()
+            with pa.ipc.new_stream(sink, batch.schema) as writer:
+                writer.write_table(batch)
+            return sink.getvalue().to_pybytes(), next_cursor
+        
+        page_data = self.current_data.iloc[offset:end]
+        data = {}
+        for column in columns:
+            series = page_data[column]
+            if series.dtype.kind in 'biuf':
+                # 수치형은 numpy 배열 그대로 직렬화 (NaN은 null로 변환됨)
+                data[column] = np.ascontiguousarray(series.to_numpy())
+            else:
+                data[column] = series.astype(object).where(series.notna(), None).tolist()
+        
+        body = orjson.dumps({
+            'columns': columns,
+            'data': data,
+            'dtypes': {column: str(self.current_data[column].dtype) for column in columns},
+            'offset': offset,
+            'page_size': page_size,
+            'total_rows': total_rows,
+            'next_cursor': next_cursor,
+            'data_version': self.data_version
+        }, option=orjson.OPT_SERIALIZE_NUMPY)
+        return body, next_cursor
+    
     def download_data(self, encoding: str = 'utf-8') -> bytes:
         """데이터 다운로드"""
         if self.current_data is None:
@@ -178,36 +525,130 @@ class DataProcessingService:
         except Exception as e:
             raise HTTPException(status_code=500, detail=f"다운로드 중 오류 발생: {str(e)}")
     
-    def generate_visualization(self, column_name: str, chart_type: str = 'distribution') -> Dict[str, Any]:
-        """시각화 생성"""
+    def _get_correlation(self) -> Tuple[List[str], np.ndarray]:
+        """현재 데이터의 상관계수 행렬 (데이터 버전별로 한 번만 계산)"""
+        if self._correlation is None or self._correlation[0] != self.data_version:
+            columns, corr_matrix = self.correlation_engine.compute(self.current_data)
+            self._correlation = (self.data_version, columns, corr_matrix)
+        return self._correlation[1], self._correlation[2]
+    
+    def _render_figure(
+        self,
+        column_name: str,
+        chart_type: str,
+        max_columns: int,
+        top_k: Optional[int],
+        y_column: Optional[str],
+        max_points: int
+    ) -> go.Figure:
+        """차트 타입에 맞는 Plotly figure 생성"""
+        if chart_type == 'distribution':
+            return self.visualizer.plot_distribution_comparison(
+                self.original_data, self.current_data, column_name
+            )
+        elif chart_type == 'scatter':
+            if y_column not in self.current_data.columns:
+                raise HTTPException(status_code=400, detail="산점도에는 y_column이 필요합니다.")
+            return self.visualizer.plot_scatter_comparison(
+                self.original_data, self.current_data, column_name, y_column, max_points
+            )
+        elif chart_type == 'line':
+            return self.visualizer.plot_line(self.current_data, column_name, max_points)
+        elif chart_type == 'correlation':
+            columns, corr_matrix = self._get_correlation()
+            if top_k:
+                return self.visualizer.plot_top_correlations(
+                    self.correlation_engine.top_pairs(columns, corr_matrix, top_k)
+                )
+            return self.visualizer.plot_correlation_matrix(columns, corr_matrix, max_columns=max_columns)
+        else:
+            raise HTTPException(status_code=400, detail="지원하지 않는 차트 타입입니다.")
+    
+    def generate_visualization(
+        self,
+        column_name: str,
+        chart_type: str = 'distribution',
+        max_columns: int = 50,
+        top_k: Optional[int] = None,
+        y_column: Optional[str] = None,
+        max_points: int = 5000
+    ) -> bytes:
+        """시각화 생성 후 직렬화된 JSON 응답 바이트 반환
+
+        Plotly figure는 orjson으로 한 번만 직렬화해서 응답에 그대로 끼워 넣고,
+        직렬화된 figure는 (데이터 버전, 컬럼, 차트 타입) 단위로 캐시한다.
+        """
         if self.current_data is None or self.original_data is None:
             raise HTTPException(status_code=400, detail="시각화할 데이터가 없습니다.")
         
         if column_name not in self.current_data.columns:
             raise HTTPException(status_code=400, detail=f"컬럼 '{column_name}'을 찾을 수 없습니다.")
         
-        try:
-            if chart_type == 'distribution':
-                fig = self.visualizer.plot_distribution_comparison(
-                    self.original_data, self.current_data, column_name
-                )
-            elif chart_type == 'correlation':
-                fig = self.visualizer.plot_correlation_heatmap(self.current_data)
-            else:
-                raise HTTPException(status_code=400, detail="지원하지 않는 차트 타입입니다.")
-            
-            # Plotly figure를 JSON으로 변환
-            fig_json = fig.to_json()
+        # 상관관계 히트맵은 컬럼과 무관
+        if chart_type == 'correlation':
+            cache_key = (self.data_version, None, chart_type, max_columns, top_k)
+        elif chart_type in ('scatter', 'line'):
+            cache_key = (self.data_version, column_name, chart_type, y_column, max_points)
+        else:
+            cache_key = (self.data_version, column_name, chart_type)
+        fig_json = self._visualization_cache.get(cache_key)
+        if fig_json is not None:
+            self._visualization_cache.move_to_end(cache_key)
+        else:
+            timer = StageTimer()
+            try:
+                with timer.stage('render', len(self.current_data)):
+                    fig = self._render_figure(column_name, chart_type, max_columns, top_k, y_column, max_points)
+                
+                # Plotly figure를 JSON으로 한 번만 변환해서 캐시 (요청별 필드는 응답을 만들 때 추가)
+                with timer.stage('serialize'):
+                    fig_json = fig.to_json(engine='orjson')
+                record_stages('visualize', timer.stages)
+                
+            except HTTPException:
+                raise
+            except Exception as e:
+                raise HTTPException(status_code=500, detail=f"시각화 생성 중 오류 발생: {str(e)}")
             
-            return {
+            self._visualization_cache[cache_key] = fig_json
+            while len(self._visualization_cache) > VISUALIZATION_CACHE_SIZE:
+                self._visualization_cache.popitem(last=False)
+        
+        # 상관관계 히트맵은 여러 컬럼 요청이 같은 figure를 공유하므로 column_name은 매번 채움
+        return orjson.dumps({
+            'success': True,
+            'chart_data': orjson.Fragment(fig_json),
+            'column_name': column_name,
+            'chart_type': chart_type
+        })
+    
+    def get_dashboard(self, bins: int = 30, top_n: int = 20) -> bytes:
+        """모든 컬럼의 분포 요약과 품질 지표를 한 번에 직렬화해서 반환"""
+        if self.current_data is None or self.original_data is None:
+            raise HTTPException(status_code=400, detail="시각화할 데이터가 없습니다.")
+        
+        cache_key = (self.data_version, None, 'dashboard', bins, top_n)
+        cached = self._visualization_cache.get(cache_key)
+        if cached is not None:
+            self._visualization_cache.move_to_end(cache_key)
+            return cached
+        
+        try:
+            summary = self.visualizer.summarize_all_columns(
+                self.original_data, self.current_data, bins=bins, top_n=top_n
+            )
+            body = orjson.dumps({
                 'success': True,
-                'chart_data': json.loads(fig_json),
-                'column_name': column_name,
-                'chart_type': chart_type
-            }
-            
+                'data_version': self.data_version,
+                **summary
+            }, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS)
         except Exception as e:
-            raise HTTPException(status_code=500, detail=f"시각화 생성 중 오류 발생: {str(e)}")
+            raise HTTPException(status_code=500, detail=f"대시보드 생성 중 오류 발생: {str(e)}")
+        
+        self._visualization_cache[cache_key] = body
+        while len(self._visualization_cache) > VISUALIZATION_CACHE_SIZE:
+            self._visualization_cache.popitem(last=False)
+        return body
     
     def get_statistics(self) -> Dict[str, Any]:
         """통계 정보 반환"""
@@ -215,8 +656,14 @@ class DataProcessingService:
             raise HTTPException(status_code=400, detail="통계를 계산할 데이터가 없습니다.")
         
         try:
-            original_stats = self.original_data.describe().to_dict()
-            augmented_stats = self.current_data.describe().to_dict()
+            # 데이터 생성 시 계산해 둔 통계 사용 (컬럼 수에 비례하는 비용)
+            if self.original_statistics is None:
+                self.original_statistics = compute_statistics(self.original_data)
+            if self.current_statistics is None:
+                self.current_statistics = compute_statistics(self.current_data)
+            
+            original_stats = describe_statistics(self.original_statistics)
+            augmented_stats = describe_statistics(self.current_statistics)
             
             return {
                 'original_statistics': original_stats,
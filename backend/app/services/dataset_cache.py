@@ -0,0 +1,122 @@
+import json
+import os
+import threading
+import uuid
+import pandas as pd
+import pyarrow as pa
+from typing import Any, Dict, Optional, Tuple
+
+# 파싱된 데이터셋 캐시 설정
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+DATASET_CACHE_DIR = os.getenv("DATASET_CACHE_DIR", os.path.join(BACKEND_DIR, ".cache", "datasets"))
+DATASET_CACHE_MAX_BYTES = int(os.getenv("DATASET_CACHE_MAX_BYTES", str(2 * 1024 * 1024 * 1024)))  # 2GB
+
+_METADATA_KEY = b'dddb_metadata'
+
+class DatasetCache:
+    """업로드 내용 해시를 키로 파싱된 DataFrame을 Arrow IPC 파일로 저장하는 디스크 캐시
+
+    동일한 파일을 다시 업로드하면 CSV 파싱 대신 캐시 파일을 메모리 맵으로 읽는다.
+    전체 크기가 max_bytes를 넘으면 가장 오래 사용되지 않은 파일부터 삭제한다.
+    """
+    
+    def __init__(self, cache_dir: str = DATASET_CACHE_DIR, max_bytes: int = DATASET_CACHE_MAX_BYTES):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+        os.makedirs(self.cache_dir, exist_ok=True)
+    
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.arrow")
+    
+    def get(self, key: str) -> Optional[Tuple[pd.DataFrame, Dict[str, Any]]]:
+        """캐시된 DataFrame과 메타데이터 반환 (없으면 None)"""
+        path = self._path(key)
+        try:
+            with pa.memory_map(path) as source:
+                table = pa.ipc.open_file(source).read_all()
+            # LRU 순서를 위해 사용 시각 갱신
+            os.utime(path)
+        except (FileNotFoundError, pa.ArrowInvalid, OSError):
+            with self._lock:
+                self.misses += 1
+            return None
+        
+        metadata = json.loads((table.schema.metadata or {}).get(_METADATA_KEY, b'{}'))
+        df = table.to_pandas()
+        with self._lock:
+            self.hits += 1
+        return df, metadata
+    
+    def put(self, key: str, df: pd.DataFrame, metadata: Dict[str, Any]) -> None:
+        """DataFrame을 캐시에 저장하고 용량 초과 시 오래된 항목 삭제"""
+        try:
+            table = pa.Table.from_pandas(df, preserve_index=False)
+        except (pa.ArrowInvalid, pa.ArrowTypeError) as e:
+            # 혼합 타입 object 컬럼 등 Arrow로 표현할 수 없는 경우 캐시하지 않음
+            print(f"Warning: Could not cache dataset {key}: {e}")
+            return
+        
+        schema_metadata = dict(table.schema.metadata or {})
+        schema_metadata[_METADATA_KEY] = json.dumps(metadata, default=str).encode('utf-8')
+        table = table.replace_schema_metadata(schema_metadata)
+        
+        # 다른 워커가 같은 키를 읽는 중일 수 있으므로 임시 파일에 쓴 뒤 교체
+        tmp_path = f"{self._path(key)}.{uuid.uuid4().hex}.tmp"
+        with pa.OSFile(tmp_path, 'wb') as sink:
+            with pa.ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+        os.replace(tmp_path, self._path(key))
+        
+        self._evict()
+    
+    def _evict(self) -> None:
+        """전체 크기가 max_bytes 이하가 될 때까지 오래된 항목 삭제"""
+        with self._lock:
+            entries = []
+            for name in os.listdir(self.cache_dir):
+                if not name.endswith('.arrow'):
+                    continue
+                path = os.path.join(self.cache_dir, name)
+                try:
+                    stat = os.stat(path)
+                except FileNotFoundError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, path))
+            
+            total_size = sum(size for _, size, _ in entries)
+            for _, size, path in sorted(entries):
+                if total_size <= self.max_bytes:
+                    break
+                try:
+                    os.remove(path)
+                except FileNotFoundError:
+                    continue
+                total_size -= size
+                self.evictions += 1
+    
+    def stats(self) -> Dict[str, Any]:
+        """캐시 적중/실패 횟수 및 사용량"""
+        entries = 0
+        size_bytes = 0
+        for name in os.listdir(self.cache_dir):
+            if name.endswith('.arrow'):
+                entries += 1
+                try:
+                    size_bytes += os.path.getsize(os.path.join(self.cache_dir, name))
+                except FileNotFoundError:
+                    continue
+        
+        requests = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'hit_ratio': round(self.hits / requests, 4) if requests else 0.0,
+            'entries': entries,
+            'size_bytes': size_bytes,
+            'max_bytes': self.max_bytes
+        }
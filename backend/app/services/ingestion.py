@@ -0,0 +1,152 @@
+import codecs
+import csv
+import io
+import os
+import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pa_csv
+from typing import Any, BinaryIO, Dict, Tuple, Union
+
+# 인코딩/구분자 감지에 사용할 파일 앞부분 크기
+SNIFF_PREFIX_BYTES = 64 * 1024
+# 감지 후보 (앞쪽이 우선순위가 높음)
+CANDIDATE_ENCODINGS = ['utf-8', 'cp949']
+FALLBACK_ENCODING = 'latin-1'
+CANDIDATE_DELIMITERS = ',;\t|'
+# pyarrow CSV 파서 블록 크기 (블록 단위로 여러 스레드에서 병렬 파싱)
+ARROW_BLOCK_SIZE = int(os.getenv("CSV_BLOCK_SIZE", str(4 * 1024 * 1024)))
+
+def detect_encoding(prefix: bytes) -> str:
+    """파일 앞부분 바이트로 인코딩 감지"""
+    if prefix.startswith(codecs.BOM_UTF8):
+        return 'utf-8-sig'
+
+    for encoding in CANDIDATE_ENCODINGS:
+        # 앞부분이 멀티바이트 문자 중간에서 잘릴 수 있으므로 incremental decoder 사용
+        decoder = codecs.getincrementaldecoder(encoding)()
+        try:
+            decoder.decode(prefix, final=False)
+            return encoding
+        except UnicodeDecodeError:
+            continue
+
+    return FALLBACK_ENCODING
+
+def detect_delimiter(sample: str) -> str:
+    """디코딩된 앞부분 텍스트로 구분자 감지"""
+    # 마지막 줄은 잘렸을 수 있으므로 제외
+    lines = sample.splitlines()
+    if len(lines) > 1:
+        lines = lines[:-1]
+    sample = '\n'.join(lines[:100])
+    if not sample:
+        return ','
+
+    try:
+        delimiter = csv.Sniffer().sniff(sample, delimiters=CANDIDATE_DELIMITERS).delimiter
+    except csv.Error:
+        return ','
+
+    # 헤더에 없는 구분자는 잘못 감지된 것으로 간주
+    return delimiter if delimiter in lines[0] else ','
+
+def _temporal_columns_as_string(
+    source: BinaryIO,
+    read_options: pa_csv.ReadOptions,
+    parse_options: pa_csv.ParseOptions
+) -> Dict[str, pa.DataType]:
+    """첫 블록에서 날짜/시간으로 추론되는 컬럼을 찾아 문자열 타입으로 지정
+
+    변환 후 다시 문자열로 바꾸면 '2024-01-05T10:00' 같은 원본 표기가
+    '2024-01-05 10:00:00'으로 바뀌므로, 파싱 단계에서부터 문자열로 읽는다.
+    """
+    start = source.tell()
+    try:
+        reader = pa_csv.open_csv(
+            source,
+            read_options=read_options,
+            parse_options=parse_options,
+            convert_options=pa_csv.ConvertOptions(strings_can_be_null=True)
+        )
+        schema = reader.schema
+        reader.close()
+    finally:
+        source.seek(start)
+    return {field.name: pa.string() for field in schema if pa.types.is_temporal(field.type)}
+
+def _read_with_arrow(source: BinaryIO, encoding: str, delimiter: str) -> pd.DataFrame:
+    """pyarrow CSV 엔진으로 멀티스레드 파싱"""
+    read_options = pa_csv.ReadOptions(
+        encoding='utf8' if encoding == 'utf-8' else encoding,
+        use_threads=True,
+        block_size=ARROW_BLOCK_SIZE
+    )
+    parse_options = pa_csv.ParseOptions(delimiter=delimiter, newlines_in_values=True)
+    convert_options = pa_csv.ConvertOptions(
+        strings_can_be_null=True,
+        # 날짜/시간은 원본 텍스트 그대로 유지 (pandas 엔진과 동일한 결과)
+        column_types=_temporal_columns_as_string(source, read_options, parse_options)
+    )
+
+    table = pa_csv.read_csv(
+        source,
+        read_options=read_options,
+        parse_options=parse_options,
+        convert_options=convert_options
+    )
+
+    # 잘못된 UTF-8은 binary 컬럼으로 읽히므로 디코딩 실패로 처리
+    if any(pa.types.is_binary(field.type) for field in table.schema):
+        raise UnicodeDecodeError(encoding, b'', 0, 1, "invalid byte sequence in CSV data")
+    if len(set(table.column_names)) != len(table.column_names):
+        raise ValueError("duplicate column names")
+
+    return table.to_pandas(split_blocks=True, self_destruct=True)
+
+def read_csv_source(source: Union[bytes, BinaryIO]) -> Tuple[pd.DataFrame, Dict[str, Any]]:
+    """CSV를 한 번만 파싱해서 DataFrame과 감지 정보 반환
+
+    앞부분 바이트로 인코딩과 구분자를 감지한 뒤 pyarrow 엔진으로 파싱한다.
+    pyarrow가 처리하지 못하는 파일(블록 간 타입 불일치, 중복 컬럼명 등)은
+    감지된 설정으로 pandas C 엔진을 사용한다.
+    """
+    if isinstance(source, (bytes, bytearray)):
+        source = io.BytesIO(source)
+
+    source.seek(0)
+    prefix = source.read(SNIFF_PREFIX_BYTES)
+    encoding = detect_encoding(prefix)
+    delimiter = detect_delimiter(prefix.decode(encoding, errors='ignore'))
+
+    info = {'encoding': encoding, 'delimiter': delimiter, 'engine': 'pyarrow'}
+
+    source.seek(0)
+    try:
+        df = _read_with_arrow(source, encoding, delimiter)
+        return df, info
+    except UnicodeDecodeError:
+        pass
+    except (pa.ArrowInvalid, ValueError):
+        # 인코딩은 맞지만 pyarrow 변환이 불가능한 경우: pandas 엔진으로 한 번 더 파싱
+        source.seek(0)
+        info['engine'] = 'c'
+        df = pd.read_csv(source, encoding=encoding, sep=delimiter)
+        return df, info
+
+    # 앞부분 이후에서 디코딩 실패 (앞부분이 ASCII뿐인 cp949 파일 등)
+    remaining = [enc for enc in CANDIDATE_ENCODINGS if enc != encoding.replace('-sig', '')]
+    info['engine'] = 'c'
+    for candidate in remaining:
+        source.seek(0)
+        try:
+            df = pd.read_csv(source, encoding=candidate, sep=delimiter)
+            info['encoding'] = candidate
+            return df, info
+        except UnicodeDecodeError:
+            continue
+
+    # 최후 수단: 디코딩할 수 없는 문자를 치환해서 로드
+    source.seek(0)
+    df = pd.read_csv(source, encoding=encoding, sep=delimiter, encoding_errors='replace')
+    info['encoding_errors'] = 'replace'
+    return df, info
@@ -0,0 +1,77 @@
+import hashlib
+import os
+import re
+import time
+import unicodedata
+from typing import Any, Dict, Optional
+
+import orjson
+
+from .user_store import BACKEND_DIR, SQLiteConnectionPool
+
+# LLM 응답 캐시 설정 (워커 간에 공유되고 재시작 후에도 유지되는 SQLite 파일)
+LLM_CACHE_PATH = os.getenv("LLM_CACHE_PATH", os.path.join(BACKEND_DIR, ".cache", "llm_responses.db"))
+LLM_CACHE_TTL_SECONDS = float(os.getenv("LLM_CACHE_TTL_SECONDS", str(24 * 60 * 60)))  # 0이면 캐시 사용 안 함
+
+_WHITESPACE = re.compile(r"\s+")
+_TRAILING_PUNCTUATION = re.compile(r"[\s?？!！.。~]+$")
+
+def normalize_query(query: str) -> str:
+    """캐시 키용 질문 정규화 (유니코드 NFKC, 소문자, 공백 정리, 끝 문장부호 제거)"""
+    normalized = unicodedata.normalize("NFKC", query).lower()
+    normalized = _WHITESPACE.sub(" ", normalized).strip()
+    return _TRAILING_PUNCTUATION.sub("", normalized)
+
+def make_response_key(dataset_hash: str, query: str, model: str) -> str:
+    """(데이터셋 내용 해시, 정규화된 질문, 모델) 캐시 키"""
+    payload = "\x1f".join([dataset_hash, normalize_query(query), model])
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
+
+class LLMResponseCache:
+    """분석 응답 캐시 (TTL, SQLite 디스크 저장)"""
+
+    def __init__(self, db_path: str = LLM_CACHE_PATH, ttl_seconds: float = LLM_CACHE_TTL_SECONDS):
+        self.ttl_seconds = ttl_seconds
+        os.makedirs(os.path.dirname(os.path.abspath(db_path)), exist_ok=True)
+        self.pool = SQLiteConnectionPool(db_path)
+        with self.pool.connection() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, value BLOB NOT NULL, created_at REAL NOT NULL)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS ix_responses_created_at ON responses (created_at)")
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl_seconds > 0
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """만료되지 않은 응답 반환 (age_seconds 포함)"""
+        if not self.enabled:
+            return None
+        with self.pool.connection() as conn:
+            row = conn.execute("SELECT value, created_at FROM responses WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return None
+        age_seconds = time.time() - row[1]
+        if age_seconds > self.ttl_seconds:
+            return None
+        value = orjson.loads(row[0])
+        value["age_seconds"] = round(age_seconds, 3)
+        return value
+
+    def put(self, key: str, value: Dict[str, Any]) -> None:
+        if not self.enabled:
+            return
+        now = time.time()
+        with self.pool.connection() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO responses (key, value, created_at) VALUES (?, ?, ?)",
+                (key, orjson.dumps(value, option=orjson.OPT_SERIALIZE_NUMPY), now)
+            )
+            # 만료된 항목 정리
+            conn.execute("DELETE FROM responses WHERE created_at < ?", (now - self.ttl_seconds,))
+
+    def clear(self) -> None:
+        with self.pool.connection() as conn:
+            conn.execute("DELETE FROM responses")
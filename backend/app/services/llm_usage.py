@@ -0,0 +1,157 @@
+import threading
+import time
+from typing import Any, Dict, Optional
+from uuid import UUID
+
+from langchain_community.callbacks.openai_info import OpenAICallbackHandler
+
+from .metrics import (
+    ANALYSIS_QUERIES, ANALYSIS_TOKENS, ANALYSIS_COST, ANALYSIS_ITERATIONS, ANALYSIS_LATENCY
+)
+from .state import get_state
+
+# 사용자별/데이터셋별 누적 사용량 카운터 이름 (공유 상태 저장소의 정수 카운터, 비용은 마이크로 달러 단위)
+USAGE_COUNTER_FIELDS = ("queries", "llm_queries", "prompt_tokens", "completion_tokens", "cost_microusd")
+# 데이터셋 해시를 알 수 없는 경우(세션 데이터 해시가 아직 없음)의 라벨
+UNKNOWN_DATASET = "unknown"
+
+class AgentUsageTracker(OpenAICallbackHandler):
+    """에이전트 실행 1회의 토큰/비용과 LLM/도구 실행 시간을 기록하는 콜백
+
+    get_openai_callback()이 쓰는 OpenAICallbackHandler에 시간 측정과 반복 횟수를 더했다.
+    컨텍스트 변수 대신 config의 callbacks로 넘기므로 동기 invoke와 astream_events 모두에서 동작한다.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.started_at = time.perf_counter()
+        self.iterations = 0
+        self.llm_seconds = 0.0
+        self.tool_seconds = 0.0
+        self._llm_starts: Dict[UUID, float] = {}
+        self._tool_starts: Dict[UUID, float] = {}
+        self._timing_lock = threading.Lock()
+        self._recorded_usage: Optional[Dict[str, Any]] = None
+
+    def _start(self, starts: Dict[UUID, float], run_id: UUID) -> None:
+        with self._timing_lock:
+            starts[run_id] = time.perf_counter()
+
+    def _stop(self, starts: Dict[UUID, float], run_id: UUID, total_attribute: str) -> None:
+        with self._timing_lock:
+            started = starts.pop(run_id, None)
+            if started is not None:
+                setattr(self, total_attribute, getattr(self, total_attribute) + time.perf_counter() - started)
+
+    def on_llm_start(self, serialized: Dict[str, Any], prompts, *, run_id: UUID, **kwargs: Any) -> None:
+        self._start(self._llm_starts, run_id)
+
+    def on_chat_model_start(self, serialized: Dict[str, Any], messages, *, run_id: UUID, **kwargs: Any) -> None:
+        self._start(self._llm_starts, run_id)
+
+    def on_llm_end(self, response, *, run_id: UUID, **kwargs: Any) -> None:
+        self._stop(self._llm_starts, run_id, 'llm_seconds')
+        super().on_llm_end(response, run_id=run_id, **kwargs)
+
+    def on_llm_error(self, error: BaseException, *, run_id: UUID, **kwargs: Any) -> None:
+        self._stop(self._llm_starts, run_id, 'llm_seconds')
+
+    def on_tool_start(self, serialized: Dict[str, Any], input_str: str, *, run_id: UUID, **kwargs: Any) -> None:
+        self._start(self._tool_starts, run_id)
+
+    def on_tool_end(self, output: Any, *, run_id: UUID, **kwargs: Any) -> None:
+        self._stop(self._tool_starts, run_id, 'tool_seconds')
+
+    def on_tool_error(self, error: BaseException, *, run_id: UUID, **kwargs: Any) -> None:
+        self._stop(self._tool_starts, run_id, 'tool_seconds')
+
+    # 반복 횟수 = 도구 실행을 결정한 단계 + 최종 답변 단계
+    def on_agent_action(self, action: Any, **kwargs: Any) -> None:
+        self.iterations += 1
+
+    def on_agent_finish(self, finish: Any, **kwargs: Any) -> None:
+        self.iterations += 1
+
+    def summary(self) -> Dict[str, Any]:
+        """api_usage 응답 형식의 사용량 요약"""
+        return {
+            "total_tokens": self.total_tokens,
+            "prompt_tokens": self.prompt_tokens,
+            "completion_tokens": self.completion_tokens,
+            "total_cost": round(self.total_cost, 6),
+            "llm_calls": self.successful_requests,
+            "iterations": self.iterations,
+            "llm_seconds": round(self.llm_seconds, 3),
+            "tool_seconds": round(self.tool_seconds, 3),
+            "total_seconds": round(time.perf_counter() - self.started_at, 3)
+        }
+
+    def record(self, username: Optional[str], dataset_hash: Optional[str] = None) -> Dict[str, Any]:
+        """실행의 사용량을 한 번만 집계하고 그 값을 반환 (이후 호출은 같은 값만 반환)
+
+        결과 생성, 오류 처리, 연결 종료 시의 finally가 모두 호출해도 중복 집계되지 않는다.
+        """
+        with self._timing_lock:
+            if self._recorded_usage is None:
+                self._recorded_usage = {"source": "llm", **self.summary()}
+                record_usage(username, self._recorded_usage, dataset_hash)
+            return self._recorded_usage
+
+def empty_usage(source: str) -> Dict[str, Any]:
+    """LLM을 호출하지 않은 응답(fast_path/cache)의 사용량"""
+    return {
+        "source": source,
+        "total_tokens": 0,
+        "prompt_tokens": 0,
+        "completion_tokens": 0,
+        "total_cost": 0.0,
+        "llm_calls": 0,
+        "iterations": 0,
+        "llm_seconds": 0.0,
+        "tool_seconds": 0.0
+    }
+
+def record_usage(username: Optional[str], usage: Dict[str, Any], dataset_hash: Optional[str] = None) -> None:
+    """질문 1건의 사용량을 전역 메트릭과 사용자별/데이터셋별 공유 누적 카운터에 반영"""
+    user = username or "anonymous"
+    dataset = dataset_hash or UNKNOWN_DATASET
+    source = usage["source"]
+    ANALYSIS_QUERIES.inc(source=source)
+    if source == "llm":
+        ANALYSIS_TOKENS.inc(usage["prompt_tokens"], type="prompt")
+        ANALYSIS_TOKENS.inc(usage["completion_tokens"], type="completion")
+        ANALYSIS_COST.inc(usage["total_cost"])
+        ANALYSIS_ITERATIONS.observe(usage["iterations"])
+        ANALYSIS_LATENCY.observe(usage["llm_seconds"], component="llm")
+        ANALYSIS_LATENCY.observe(usage["tool_seconds"], component="tool")
+    ANALYSIS_LATENCY.observe(usage.get("total_seconds", 0.0), component="total")
+
+    # 워커 간에 합산되는 사용자별/데이터셋별 누적값
+    state = get_state()
+    for prefix in (f"analysis_usage:{user}", f"analysis_usage_dataset:{dataset}"):
+        state.incr(f"{prefix}:queries")
+        if source == "llm":
+            state.incr(f"{prefix}:llm_queries")
+            state.incr(f"{prefix}:prompt_tokens", usage["prompt_tokens"])
+            state.incr(f"{prefix}:completion_tokens", usage["completion_tokens"])
+            state.incr(f"{prefix}:cost_microusd", int(round(usage["total_cost"] * 1_000_000)))
+
+def _read_usage(prefix: str) -> Dict[str, Any]:
+    state = get_state()
+    totals = {field: state.get_counter(f"{prefix}:{field}") for field in USAGE_COUNTER_FIELDS}
+    return {
+        "queries": totals["queries"],
+        "llm_queries": totals["llm_queries"],
+        "prompt_tokens": totals["prompt_tokens"],
+        "completion_tokens": totals["completion_tokens"],
+        "total_tokens": totals["prompt_tokens"] + totals["completion_tokens"],
+        "total_cost": totals["cost_microusd"] / 1_000_000
+    }
+
+def get_user_usage(username: str) -> Dict[str, Any]:
+    """사용자의 누적 분석 사용량"""
+    return _read_usage(f"analysis_usage:{username}")
+
+def get_dataset_usage(dataset_hash: str) -> Dict[str, Any]:
+    """데이터셋(내용 해시)별 누적 분석 사용량 (모든 사용자 합계)"""
+    return _read_usage(f"analysis_usage_dataset:{dataset_hash}")
@@ -0,0 +1,95 @@
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+from typing import Any, Dict, Tuple
+
+# 고유값 비율이 이 값 이하인 문자열 컬럼은 category로 변환
+CATEGORY_MAX_UNIQUE_RATIO = 0.5
+ARROW_STRING = 'string[pyarrow]'
+
+def _resolve_dtype(dtype_name: str):
+    """dtype 계획의 이름을 실제 dtype으로 변환"""
+    if dtype_name == ARROW_STRING:
+        return pd.ArrowDtype(pa.string())
+    return dtype_name
+
+def _plan_column(series: pd.Series) -> str:
+    """컬럼 하나의 최적 dtype 결정"""
+    if pd.api.types.is_bool_dtype(series):
+        return str(series.dtype)
+
+    if pd.api.types.is_integer_dtype(series):
+        return str(pd.to_numeric(series, downcast='integer').dtype)
+
+    if pd.api.types.is_float_dtype(series):
+        # 정밀도 손실이 없을 때만 float32로 변환
+        values = series.to_numpy()
+        downcast = values.astype(np.float32)
+        if np.array_equal(downcast.astype(values.dtype), values, equal_nan=True):
+            return 'float32'
+        return str(series.dtype)
+
+    if series.dtype == object:
+        non_null = series.dropna()
+        if len(non_null) == 0 or not non_null.map(type).eq(str).all():
+            return str(series.dtype)
+        if non_null.nunique() <= len(non_null) * CATEGORY_MAX_UNIQUE_RATIO:
+            return 'category'
+        return ARROW_STRING
+
+    return str(series.dtype)
+
+def optimize_dtypes(df: pd.DataFrame) -> Tuple[pd.DataFrame, Dict[str, str], Dict[str, Any]]:
+    """수치형 다운캐스팅, 저카디널리티 문자열의 category 변환으로 메모리 절감
+
+    Returns:
+        최적화된 DataFrame, 컬럼별 dtype 계획, 변환 전후 메모리 정보
+    """
+    before_bytes = int(df.memory_usage(deep=True).sum())
+
+    dtype_plan = {}
+    for column in df.columns:
+        target = _plan_column(df[column])
+        if target != str(df[column].dtype):
+            dtype_plan[column] = target
+
+    optimized = apply_dtype_plan(df, dtype_plan)
+    after_bytes = int(optimized.memory_usage(deep=True).sum())
+
+    memory_info = {
+        'before_bytes': before_bytes,
+        'after_bytes': after_bytes,
+        'reduction_ratio': round((1 - after_bytes / before_bytes) * 100, 2) if before_bytes else 0.0
+    }
+    return optimized, dtype_plan, memory_info
+
+def apply_dtype_plan(df: pd.DataFrame, dtype_plan: Dict[str, str]) -> pd.DataFrame:
+    """전처리/증강 결과에 dtype 계획을 다시 적용
+
+    증강으로 정수 컬럼에 소수 값이 생기는 등 계획대로 변환할 수 없는 컬럼은 그대로 둔다.
+    """
+    if not dtype_plan:
+        return df
+
+    df = df.copy()
+    for column, dtype_name in dtype_plan.items():
+        if column not in df.columns or str(df[column].dtype) == dtype_name:
+            continue
+
+        series = df[column]
+        try:
+            if dtype_name.startswith('int'):
+                if not pd.api.types.is_numeric_dtype(series) or series.isna().any():
+                    continue
+                values = series.to_numpy()
+                info = np.iinfo(dtype_name)
+                if not (np.all(np.mod(values, 1) == 0) and values.min() >= info.min and values.max() <= info.max):
+                    continue
+            elif dtype_name == 'float32' and not pd.api.types.is_numeric_dtype(series):
+                continue
+
+            df[column] = series.astype(_resolve_dtype(dtype_name))
+        except (TypeError, ValueError) as e:
+            print(f"Warning: Could not apply dtype {dtype_name} to column {column}: {e}")
+
+    return df
@@ -0,0 +1,163 @@
+import math
+import threading
+from typing import Any, Dict, List, Sequence, Tuple
+
+# Prometheus 메트릭 이름 접두사
+METRIC_PREFIX = "data_augmentation"
+
+DURATION_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+ROW_BUCKETS = (100, 1_000, 10_000, 100_000, 1_000_000, 10_000_000)
+MEMORY_BUCKETS = tuple(float(4 ** power * 1024 * 1024) for power in range(7))  # 1MB ~ 4GB
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+def _escape(value: Any) -> str:
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+def _format_labels(labels: Sequence[Tuple[str, Any]]) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in labels) + "}"
+
+class Counter:
+    """단조 증가 카운터"""
+
+    def __init__(self, name: str, help_text: str, label_names: Sequence[str] = ()):
+        self.name = name
+        self.help_text = help_text
+        self.label_names = tuple(label_names)
+        self._values: Dict[Tuple, float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, value: float = 1.0, **labels: Any) -> None:
+        key = tuple(labels.get(name, "") for name in self.label_names)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + value
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} counter"]
+        with self._lock:
+            for key, value in sorted(self._values.items()):
+                labels = _format_labels(list(zip(self.label_names, key)))
+                lines.append(f"{self.name}{labels} {_format_value(value)}")
+        return lines
+
+class Histogram:
+    """누적 버킷 히스토그램 (Prometheus histogram 형식)"""
+
+    def __init__(self, name: str, help_text: str, buckets: Sequence[float], label_names: Sequence[str] = ()):
+        self.name = name
+        self.help_text = help_text
+        self.buckets = tuple(sorted(buckets)) + (math.inf,)
+        self.label_names = tuple(label_names)
+        # 라벨 값 -> (버킷별 개수, 합계, 개수)
+        self._series: Dict[Tuple, List[Any]] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, **labels: Any) -> None:
+        key = tuple(labels.get(name, "") for name in self.label_names)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = [[0] * len(self.buckets), 0.0, 0]
+            for index, bound in enumerate(self.buckets):
+                if value <= bound:
+                    series[0][index] += 1
+                    break
+            series[1] += value
+            series[2] += 1
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} histogram"]
+        with self._lock:
+            for key, (bucket_counts, total, count) in sorted(self._series.items()):
+                base_labels = list(zip(self.label_names, key))
+                cumulative = 0
+                for bound, bucket_count in zip(self.buckets, bucket_counts):
+                    cumulative += bucket_count
+                    labels = _format_labels(base_labels + [("le", _format_value(bound))])
+                    lines.append(f"{self.name}_bucket{labels} {cumulative}")
+                labels = _format_labels(base_labels)
+                lines.append(f"{self.name}_sum{labels} {_format_value(total)}")
+                lines.append(f"{self.name}_count{labels} {count}")
+        return lines
+
+class MetricsRegistry:
+    """프로세스 내 메트릭 모음 (Prometheus 텍스트 형식으로 출력)"""
+
+    def __init__(self):
+        self._metrics: Dict[str, Any] = {}
+        self._lock = threading.Lock()
+
+    def _register(self, metric):
+        with self._lock:
+            return self._metrics.setdefault(metric.name, metric)
+
+    def counter(self, name: str, help_text: str, label_names: Sequence[str] = ()) -> Counter:
+        return self._register(Counter(f"{METRIC_PREFIX}_{name}", help_text, label_names))
+
+    def histogram(
+        self,
+        name: str,
+        help_text: str,
+        buckets: Sequence[float] = DURATION_BUCKETS,
+        label_names: Sequence[str] = ()
+    ) -> Histogram:
+        return self._register(Histogram(f"{METRIC_PREFIX}_{name}", help_text, buckets, label_names))
+
+    def render(self) -> str:
+        with self._lock:
+            metrics = list(self._metrics.values())
+        lines: List[str] = []
+        for metric in metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+# 전역 레지스트리
+metrics = MetricsRegistry()
+
+STAGE_DURATION = metrics.histogram(
+    "stage_duration_seconds", "파이프라인 단계별 소요 시간", DURATION_BUCKETS, ("operation", "stage")
+)
+STAGE_ROWS = metrics.histogram(
+    "stage_rows", "파이프라인 단계별 처리 행 수", ROW_BUCKETS, ("operation", "stage")
+)
+STAGE_PEAK_MEMORY = metrics.histogram(
+    "stage_peak_memory_delta_bytes", "파이프라인 단계 동안 증가한 최대 RSS", MEMORY_BUCKETS, ("operation", "stage")
+)
+OPERATIONS = metrics.counter("operations_total", "작업 실행 횟수", ("operation", "status"))
+ANALYSIS_AGENT_CACHE = metrics.counter("analysis_agent_cache_total", "세션별 분석 에이전트 캐시 조회 결과", ("result",))
+ANALYSIS_AGENT_SETUP = metrics.histogram("analysis_agent_setup_seconds", "분석 에이전트 생성 시간", DURATION_BUCKETS)
+# /metrics는 인증 없이 노출되므로 사용자명/데이터셋 해시는 라벨로 쓰지 않음
+# (사용자별/데이터셋별 누적값은 공유 상태 저장소 카운터와 인증된 /api/analysis/usage로 제공)
+ANALYSIS_QUERIES = metrics.counter(
+    "analysis_queries_total", "분석 질문 수 (source=llm|cache|fast_path)", ("source",)
+)
+ANALYSIS_TOKENS = metrics.counter("analysis_tokens_total", "LLM 토큰 사용량", ("type",))
+ANALYSIS_COST = metrics.counter("analysis_cost_usd_total", "LLM 비용 (USD)")
+ANALYSIS_ITERATIONS = metrics.histogram("analysis_agent_iterations", "질문당 에이전트 반복 횟수", (1, 2, 3, 4, 5, 8))
+ANALYSIS_LATENCY = metrics.histogram(
+    "analysis_latency_seconds", "질문당 LLM/도구 실행/전체 소요 시간", DURATION_BUCKETS, ("component",)
+)
+ANALYSIS_FAST_PATH = metrics.counter(
+    "analysis_fast_path_total", "LLM 없이 바로 답변한 분석 질문 수 (intent=none은 LLM 사용)", ("intent",)
+)
+LLM_RESPONSE_CACHE = metrics.counter("llm_response_cache_total", "분석 응답 캐시 조회 결과", ("result",))
+ANALYSIS_AGENT_SETUP_SAVED = metrics.counter(
+    "analysis_agent_setup_saved_seconds_total", "캐시된 에이전트 재사용으로 생략한 생성 시간"
+)
+
+def record_stages(operation: str, stages: List[Dict[str, Any]], status: str = "success") -> None:
+    """StageTimer에 기록된 단계들을 전역 메트릭에 반영"""
+    for record in stages:
+        STAGE_DURATION.observe(record['duration'], operation=operation, stage=record['stage'])
+        if record.get('rows') is not None:
+            STAGE_ROWS.observe(record['rows'], operation=operation, stage=record['stage'])
+        if record.get('peak_memory_delta_bytes') is not None:
+            STAGE_PEAK_MEMORY.observe(record['peak_memory_delta_bytes'], operation=operation, stage=record['stage'])
+    OPERATIONS.inc(operation=operation, status=status)
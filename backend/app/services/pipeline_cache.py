@@ -0,0 +1,209 @@
+import hashlib
+import json
+import os
+import pickle
+import sys
+import threading
+import uuid
+import numpy as np
+import pandas as pd
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+from .dataset_cache import BACKEND_DIR
+
+# 파이프라인 단계 결과 캐시 설정
+PIPELINE_CACHE_DIR = os.getenv("PIPELINE_CACHE_DIR", os.path.join(BACKEND_DIR, ".cache", "pipeline"))
+PIPELINE_CACHE_MEMORY_BYTES = int(os.getenv("PIPELINE_CACHE_MEMORY_BYTES", str(512 * 1024 * 1024)))  # 512MB
+PIPELINE_CACHE_DISK_BYTES = int(os.getenv("PIPELINE_CACHE_DISK_BYTES", str(2 * 1024 * 1024 * 1024)))  # 2GB
+# 캐시 값의 형식(전처리 결과 튜플 구성, 클래스 구조 등)이 바뀌면 올려서 이전 디스크 항목을 무효화
+PIPELINE_CACHE_FORMAT_VERSION = 3
+
+def make_cache_key(*parts: Any) -> str:
+    """설정 딕셔너리 등을 정규화해서 캐시 키 생성 (캐시 형식 버전 포함)"""
+    payload = json.dumps((PIPELINE_CACHE_FORMAT_VERSION,) + parts, sort_keys=True, default=str, ensure_ascii=False)
+    return hashlib.blake2b(payload.encode('utf-8'), digest_size=16).hexdigest()
+
+def estimate_size(value: Any, _seen: Optional[set] = None) -> int:
+    """캐시 항목의 대략적인 메모리 크기 (바이트)"""
+    if _seen is None:
+        _seen = set()
+    if id(value) in _seen:
+        return 0
+    _seen.add(id(value))
+
+    if isinstance(value, pd.DataFrame):
+        return int(value.memory_usage(deep=True).sum())
+    if isinstance(value, pd.Series):
+        return int(value.memory_usage(deep=True))
+    if isinstance(value, np.ndarray):
+        return int(value.nbytes)
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum(estimate_size(v, _seen) for v in value.values())
+    if isinstance(value, (list, tuple, set)):
+        return sys.getsizeof(value) + sum(estimate_size(v, _seen) for v in value)
+    if hasattr(value, '__dict__'):
+        return sys.getsizeof(value) + estimate_size(vars(value), _seen)
+    return sys.getsizeof(value)
+
+class TieredLRUCache:
+    """메모리/디스크 2단계 LRU 캐시
+
+    메모리 단계는 항목 크기 합이 memory_max_bytes를 넘으면 가장 오래 사용되지 않은 항목을
+    디스크 단계로 내리고, 디스크 단계는 disk_max_bytes를 넘으면 오래된 파일부터 삭제한다.
+    디스크에서 찾은 항목은 다시 메모리 단계로 올린다.
+    """
+
+    def __init__(
+        self,
+        cache_dir: str = PIPELINE_CACHE_DIR,
+        memory_max_bytes: int = PIPELINE_CACHE_MEMORY_BYTES,
+        disk_max_bytes: int = PIPELINE_CACHE_DISK_BYTES
+    ):
+        self.cache_dir = cache_dir
+        self.memory_max_bytes = memory_max_bytes
+        self.disk_max_bytes = disk_max_bytes
+
+        self._memory: "OrderedDict[str, Tuple[Any, int]]" = OrderedDict()
+        self._memory_bytes = 0
+        self._lock = threading.RLock()
+
+        self.counters = {
+            'memory_hits': 0,
+            'disk_hits': 0,
+            'misses': 0,
+            'memory_evictions': 0,
+            'disk_evictions': 0
+        }
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.pkl")
+
+    def lookup(self, key: str) -> Tuple[Optional[Any], Optional[str]]:
+        """캐시 조회 결과와 적중 단계('memory', 'disk', 없으면 None) 반환"""
+        with self._lock:
+            if key in self._memory:
+                self._memory.move_to_end(key)
+                self.counters['memory_hits'] += 1
+                return self._memory[key][0], 'memory'
+
+        path = self._path(key)
+        try:
+            with open(path, 'rb') as f:
+                value = pickle.load(f)
+            os.utime(path)
+        except FileNotFoundError:
+            with self._lock:
+                self.counters['misses'] += 1
+            return None, None
+        except Exception as e:
+            # 손상되었거나 현재 코드로 복원할 수 없는 항목(AttributeError, ModuleNotFoundError 등)은 삭제 후 미스 처리
+            print(f"Warning: Could not load pipeline cache entry {key}: {e}")
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            with self._lock:
+                self.counters['misses'] += 1
+            return None, None
+
+        with self._lock:
+            self.counters['disk_hits'] += 1
+        self._put_memory(key, value)
+        return value, 'disk'
+
+    def get(self, key: str) -> Optional[Any]:
+        """캐시된 값 반환 (없으면 None)"""
+        return self.lookup(key)[0]
+
+    def put(self, key: str, value: Any) -> None:
+        """값을 메모리 단계에 저장 (메모리 예산보다 큰 항목은 바로 디스크에 저장)"""
+        self._put_memory(key, value)
+
+    def _put_memory(self, key: str, value: Any) -> None:
+        size = estimate_size(value)
+        if size > self.memory_max_bytes:
+            self._write_disk(key, value)
+            return
+
+        spilled = []
+        with self._lock:
+            if key in self._memory:
+                self._memory_bytes -= self._memory.pop(key)[1]
+            self._memory[key] = (value, size)
+            self._memory_bytes += size
+
+            while self._memory_bytes > self.memory_max_bytes and len(self._memory) > 1:
+                old_key, (old_value, old_size) = self._memory.popitem(last=False)
+                self._memory_bytes -= old_size
+                self.counters['memory_evictions'] += 1
+                spilled.append((old_key, old_value))
+
+        # 메모리에서 밀려난 항목은 디스크 단계로 이동
+        for old_key, old_value in spilled:
+            self._write_disk(old_key, old_value)
+
+    def _write_disk(self, key: str, value: Any) -> None:
+        if os.path.exists(self._path(key)):
+            os.utime(self._path(key))
+            return
+
+        tmp_path = f"{self._path(key)}.{uuid.uuid4().hex}.tmp"
+        try:
+            with open(tmp_path, 'wb') as f:
+                pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, self._path(key))
+        except (OSError, pickle.PicklingError, TypeError, AttributeError) as e:
+            print(f"Warning: Could not write pipeline cache entry {key}: {e}")
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            return
+
+        self._evict_disk()
+
+    def _evict_disk(self) -> None:
+        """디스크 단계 전체 크기가 disk_max_bytes 이하가 될 때까지 오래된 파일 삭제"""
+        with self._lock:
+            entries = []
+            for name in os.listdir(self.cache_dir):
+                if not name.endswith('.pkl'):
+                    continue
+                path = os.path.join(self.cache_dir, name)
+                try:
+                    stat = os.stat(path)
+                except FileNotFoundError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, path))
+
+            total_size = sum(size for _, size, _ in entries)
+            for _, size, path in sorted(entries):
+                if total_size <= self.disk_max_bytes:
+                    break
+                try:
+                    os.remove(path)
+                except FileNotFoundError:
+                    continue
+                total_size -= size
+                self.counters['disk_evictions'] += 1
+
+    def stats(self) -> Dict[str, Any]:
+        """단계별 적중/실패 횟수 및 사용량"""
+        with self._lock:
+            disk_entries = [name for name in os.listdir(self.cache_dir) if name.endswith('.pkl')]
+            disk_bytes = 0
+            for name in disk_entries:
+                try:
+                    disk_bytes += os.path.getsize(os.path.join(self.cache_dir, name))
+                except FileNotFoundError:
+                    continue
+
+            return {
+                **self.counters,
+                'memory_entries': len(self._memory),
+                'memory_bytes': self._memory_bytes,
+                'memory_max_bytes': self.memory_max_bytes,
+                'disk_entries': len(disk_entries),
+                'disk_bytes': disk_bytes,
+                'disk_max_bytes': self.disk_max_bytes
+            }
@@ -0,0 +1,180 @@
+import cProfile
+import os
+import pstats
+import threading
+import time
+import tracemalloc
+import uuid
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Coroutine, Dict, List, Optional
+
+# 요청 프로파일링 제한 설정
+PROFILE_MIN_INTERVAL_SECONDS = float(os.getenv("PROFILE_MIN_INTERVAL_SECONDS", "10"))
+PROFILE_MAX_REPORTS = int(os.getenv("PROFILE_MAX_REPORTS", "20"))
+PROFILE_TOP_N = int(os.getenv("PROFILE_TOP_N", "30"))
+PROFILE_TRACEMALLOC_FRAMES = int(os.getenv("PROFILE_TRACEMALLOC_FRAMES", "1"))
+# 보고서에 기록하는 측정 범위 설명
+PROFILE_SCOPE = (
+    "cpu: 요청 코루틴이 이벤트 루프에서 실행된 구간만 측정 (동시에 실행된 다른 요청, 스레드 풀/실행기 작업, "
+    "요청이 만든 별도 태스크는 제외); memory: 요청 동안 프로세스 전체의 할당"
+)
+
+def _top_functions(profiler: cProfile.Profile, limit: int) -> List[Dict[str, Any]]:
+    """누적 시간 기준 상위 함수"""
+    stats = pstats.Stats(profiler).stats
+    rows = sorted(stats.items(), key=lambda item: item[1][3], reverse=True)[:limit]
+    return [
+        {
+            'function': function,
+            'file': filename,
+            'line': line,
+            'calls': total_calls,
+            'total_time': round(total_time, 6),
+            'cumulative_time': round(cumulative_time, 6)
+        }
+        for (filename, line, function), (_, total_calls, total_time, cumulative_time, _) in rows
+    ]
+
+def _top_allocations(snapshot: tracemalloc.Snapshot, limit: int) -> List[Dict[str, Any]]:
+    """할당 크기 기준 상위 위치 (요청 동안 해제되지 않은 메모리)"""
+    return [
+        {
+            'location': str(stat.traceback),
+            'size_bytes': stat.size,
+            'count': stat.count
+        }
+        for stat in snapshot.statistics('lineno')[:limit]
+    ]
+
+class RequestProfiler:
+    """
+    관리자가 요청한 API 호출을 cProfile/tracemalloc으로 측정하고 보고서를 보관하는 클래스
+    동시에 하나의 요청만, PROFILE_MIN_INTERVAL_SECONDS 간격으로만 프로파일링한다.
+    """
+
+    def __init__(
+        self,
+        min_interval: float = PROFILE_MIN_INTERVAL_SECONDS,
+        max_reports: int = PROFILE_MAX_REPORTS,
+        top_n: int = PROFILE_TOP_N
+    ):
+        self.min_interval = min_interval
+        self.max_reports = max_reports
+        self.top_n = top_n
+        self._reports: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._active = threading.Lock()
+        self._last_started = 0.0
+
+    def try_start(self) -> Optional["ProfileSession"]:
+        """프로파일링을 시작할 수 있으면 세션 반환 (진행 중이거나 간격 제한에 걸리면 None)"""
+        if not self._active.acquire(blocking=False):
+            return None
+        now = time.monotonic()
+        if now - self._last_started < self.min_interval:
+            self._active.release()
+            return None
+        self._last_started = now
+        return ProfileSession(self)
+
+    def _store(self, report: Dict[str, Any]) -> None:
+        with self._lock:
+            self._reports[report['id']] = report
+            while len(self._reports) > self.max_reports:
+                self._reports.popitem(last=False)
+
+    def list_reports(self) -> List[Dict[str, Any]]:
+        """저장된 보고서 요약 (최신순)"""
+        with self._lock:
+            reports = list(self._reports.values())
+        return [
+            {key: report[key] for key in ('id', 'created_at', 'method', 'path', 'username', 'status_code', 'duration_ms')}
+            for report in reversed(reports)
+        ]
+
+    def get_report(self, report_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            return self._reports.get(report_id)
+
+class _ProfiledCoroutine:
+    """코루틴이 한 단계씩 실행될 때만 프로파일러를 켜는 래퍼
+
+    이벤트 루프에서 번갈아 실행되는 다른 요청의 코루틴은 측정에 섞이지 않는다.
+    """
+
+    def __init__(self, coro: Coroutine, profiler: cProfile.Profile):
+        self.coro = coro
+        self.profiler = profiler
+
+    def __await__(self):
+        value, error = None, None
+        while True:
+            try:
+                self.profiler.enable()
+                enabled = True
+            except ValueError:
+                # 다른 프로파일러가 이미 동작 중인 경우 측정 없이 실행
+                enabled = False
+            try:
+                if error is not None:
+                    yielded = self.coro.throw(error)
+                else:
+                    yielded = self.coro.send(value)
+            except StopIteration as stop:
+                return stop.value
+            finally:
+                if enabled:
+                    self.profiler.disable()
+            try:
+                value, error = (yield yielded), None
+            except BaseException as e:
+                value, error = None, e
+
+class ProfileSession:
+    """프로파일링 중인 요청 하나 (start -> finish 순서로 사용)"""
+
+    def __init__(self, owner: RequestProfiler):
+        self.owner = owner
+        self.id = uuid.uuid4().hex[:12]
+        self.profiler = cProfile.Profile()
+        self._started_tracemalloc = False
+        self._start = 0.0
+
+    def start(self) -> None:
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(PROFILE_TRACEMALLOC_FRAMES)
+            self._started_tracemalloc = True
+        tracemalloc.reset_peak()
+        self._start = time.perf_counter()
+
+    def profile(self, coro: Coroutine) -> Awaitable:
+        """요청 처리 코루틴을 감싸서 그 코루틴이 실행되는 동안만 cProfile로 측정"""
+        return _ProfiledCoroutine(coro, self.profiler)
+
+    def finish(self, request_info: Dict[str, Any]) -> Dict[str, Any]:
+        """측정을 멈추고 보고서를 저장"""
+        try:
+            duration = time.perf_counter() - self._start
+            snapshot = tracemalloc.take_snapshot()
+            _, peak = tracemalloc.get_traced_memory()
+            if self._started_tracemalloc:
+                tracemalloc.stop()
+
+            report = {
+                'id': self.id,
+                'created_at': datetime.now(timezone.utc).isoformat(),
+                **request_info,
+                'duration_ms': round(duration * 1000, 2),
+                'scope': PROFILE_SCOPE,
+                'peak_traced_bytes': peak,
+                'top_functions': _top_functions(self.profiler, self.owner.top_n),
+                'top_allocations': _top_allocations(snapshot, self.owner.top_n)
+            }
+            self.owner._store(report)
+            return report
+        finally:
+            self.owner._active.release()
+
+# 전역 프로파일러 인스턴스
+request_profiler = RequestProfiler()
@@ -0,0 +1,303 @@
+import re
+import unicodedata
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+
+# 차트에 표시할 최대 막대 수
+MAX_CHART_BARS = 30
+
+# 집계 이름 -> (한국어/영어 키워드, 표시 이름)
+AGGREGATIONS = {
+    'mean': (['평균', 'mean', 'average', 'avg'], '평균'),
+    'max': (['최댓값', '최대값', '최대', '가장 큰', 'maximum', 'max', 'largest', 'highest'], '최댓값'),
+    'min': (['최솟값', '최소값', '최소', '가장 작은', 'minimum', 'min', 'smallest', 'lowest'], '최솟값'),
+    'median': (['중앙값', '중간값', 'median'], '중앙값'),
+    'sum': (['합계', '총합', 'sum', 'total'], '합계')
+}
+MISSING_KEYWORDS = ['결측', '누락', '빈 값', '빈값', 'missing', 'null', 'nan', 'empty']
+# 결측값 질문 중 바로 답할 수 있는 것: 개수를 묻거나 해당 컬럼을 나열하는 질문
+MISSING_QUESTION_KEYWORDS = [
+    '몇', '개수', '갯수', '얼마나', '컬럼', '열', '어떤', '어느', '알려',
+    'how many', 'count', 'number of', 'column', 'columns', 'which'
+]
+# 결측값을 제거/대체한 결과를 묻는 질문은 LLM 에이전트로 보냄
+MISSING_ACTION_KEYWORDS = [
+    '제거', '삭제', '빼', '채우', '채운', '대체', '처리', '남', '행',
+    'drop', 'remove', 'fill', 'impute', 'replace', 'row', 'rows', 'remain'
+]
+# 조건/필터가 있는 질문은 전체 컬럼 집계로 답하면 틀리므로 LLM 에이전트로 보냄 (숫자가 있어도 동일)
+FILTER_KEYWORDS = [
+    '이상', '이하', '초과', '미만', '보다', '사이', '제외', '경우', '조건',
+    'where', 'greater', 'less', 'above', 'below', 'between', 'except', 'excluding', 'filter', 'only'
+]
+_FILTER_SYMBOLS = re.compile(r"[<>=≤≥]|\d")
+UNIQUE_KEYWORDS = ['고유값', '고유 값', '고유한', '유니크', '종류', 'unique', 'distinct']
+# 설명/추론이 필요한 질문은 LLM 에이전트로 보냄
+OPEN_ENDED_KEYWORDS = [
+    '왜', '이유', '원인', '설명', '해석', '예측', '추천', '어떻게', '의미',
+    'why', 'explain', 'reason', 'predict', 'recommend', 'how', 'interpret', 'insight'
+]
+_GROUP_BY_EN = re.compile(r"\b(?:by|per|for each|grouped by|group by)\s*$")
+# 컬럼과 집계 키워드 사이에 올 수 있는 말 ('age의 평균', 'age 컬럼의 최댓값', 'mean of age')
+_AFTER_COLUMN = re.compile(r"\s*(?:컬럼|열|column)?\s*(?:'s|의|에서|은|는|이|가)?\s*")
+_BEFORE_COLUMN = re.compile(r"\s*(?:of\s+(?:the\s+)?)?(?:column\s+)?$")
+# 여러 집계를 나열할 때의 연결어 ('평균과 최댓값', 'mean and max')
+_AGGREGATION_JOIN = re.compile(r"\s*(?:과|와|및|이랑|랑|하고|,|&|and|or)\s*")
+_AGGREGATION_JOIN_BEFORE = re.compile(r"\s*(?:과|와|및|,|&|and|or)\s*$")
+# 'how many', 'how much'는 집계 질문이므로 open-ended 검사에서 제외
+_HOW_MANY = re.compile(r"\bhow (?:many|much)\b")
+
+def _normalize(text: str) -> str:
+    return unicodedata.normalize("NFKC", text).lower()
+
+def _contains(text: str, keyword: str) -> bool:
+    """영어 키워드는 단어 단위, 한국어 키워드는 부분 문자열로 검사"""
+    if keyword.isascii():
+        return re.search(rf"(?<![a-z0-9_]){re.escape(keyword)}(?![a-z0-9_])", text) is not None
+    return keyword in text
+
+def _find_columns(text: str, columns: List[str]) -> List[Dict[str, Any]]:
+    """질문에 언급된 컬럼을 등장 순서대로 반환 (긴 이름부터 매칭해 num_1/num_10 같은 겹침 방지)"""
+    found = []
+    taken = [False] * len(text)
+    for column in sorted(columns, key=lambda name: len(str(name)), reverse=True):
+        name = _normalize(str(column))
+        if not name:
+            continue
+        for match in re.finditer(re.escape(name), text):
+            start, end = match.span()
+            # 영문/숫자 컬럼명은 다른 단어의 일부가 아닐 때만 인정
+            if name[0].isascii() and start > 0 and (text[start - 1].isalnum() or text[start - 1] == '_'):
+                continue
+            if name[-1].isascii() and end < len(text) and text[end].isascii() and (text[end].isalnum() or text[end] == '_'):
+                continue
+            if any(taken[start:end]):
+                continue
+            taken[start:end] = [True] * (end - start)
+            found.append({'column': column, 'start': start, 'end': end})
+            break
+    return sorted(found, key=lambda item: item['start'])
+
+def _keyword_at(text: str, position: int, keyword: str) -> bool:
+    """text[position:]이 keyword로 시작하는지 (영어 키워드는 단어 단위)"""
+    if not text.startswith(keyword, position):
+        return False
+    end = position + len(keyword)
+    if keyword.isascii():
+        if position > 0 and (text[position - 1].isalnum() or text[position - 1] == '_'):
+            return False
+        if end < len(text) and (text[end].isascii() and (text[end].isalnum() or text[end] == '_')):
+            return False
+    return True
+
+# 긴 키워드부터 확인 ('최댓값'이 '최대'보다 먼저)
+_AGGREGATION_KEYWORDS = sorted(
+    ((name, keyword) for name, (keywords, _) in AGGREGATIONS.items() for keyword in keywords),
+    key=lambda item: len(item[1]), reverse=True
+)
+
+def _aggregation_after(text: str, position: int) -> Optional[Tuple[str, int]]:
+    for name, keyword in _AGGREGATION_KEYWORDS:
+        if _keyword_at(text, position, keyword):
+            return name, position + len(keyword)
+    return None
+
+def _aggregation_before(text: str, end: int) -> Optional[Tuple[str, int]]:
+    for name, keyword in _AGGREGATION_KEYWORDS:
+        start = end - len(keyword)
+        if start >= 0 and _keyword_at(text, start, keyword):
+            return name, start
+    return None
+
+def _adjacent_aggregations(text: str, item: Dict[str, Any]) -> List[str]:
+    """컬럼 바로 앞뒤에 붙은 집계 키워드 ('age의 평균과 최댓값', 'mean and max of age')
+
+    'price distribution with max bins'처럼 컬럼과 떨어진 키워드는 해당 컬럼의 집계로 보지 않는다.
+    """
+    found = []
+
+    position = _AFTER_COLUMN.match(text, item['end']).end()
+    while (hit := _aggregation_after(text, position)) is not None:
+        found.append(hit[0])
+        joined = _AGGREGATION_JOIN.match(text, hit[1])
+        if joined is None:
+            break
+        position = joined.end()
+
+    prefix = text[:item['start']]
+    end = _BEFORE_COLUMN.search(prefix).start()
+    while (hit := _aggregation_before(prefix, end)) is not None:
+        found.append(hit[0])
+        joined = _AGGREGATION_JOIN_BEFORE.search(prefix[:hit[1]])
+        if joined is None:
+            break
+        end = joined.start()
+
+    return list(dict.fromkeys(found))
+
+def _has_filter(text: str, mentioned: List[Dict[str, Any]]) -> bool:
+    """조건/비교가 있는 질문인지 (컬럼명 안의 숫자는 제외하고 검사)"""
+    remaining = list(text)
+    for item in mentioned:
+        remaining[item['start']:item['end']] = [' '] * (item['end'] - item['start'])
+    remaining = ''.join(remaining)
+    return _FILTER_SYMBOLS.search(remaining) is not None or \
+        any(_contains(remaining, keyword) for keyword in FILTER_KEYWORDS)
+
+def _is_missing_question(text: str) -> bool:
+    """결측값 개수/컬럼 목록을 묻는 질문인지 (제거/대체 후 결과를 묻는 질문은 제외)"""
+    if any(_contains(text, keyword) for keyword in MISSING_ACTION_KEYWORDS):
+        return False
+    return any(_contains(text, keyword) for keyword in MISSING_QUESTION_KEYWORDS)
+
+def match_intent(query: str, df: pd.DataFrame) -> Optional[Dict[str, Any]]:
+    """단순 집계 질문의 의도를 인식 (결측값, 컬럼 평균/최댓값 등, 고유값 개수, 그룹별 평균)
+
+    조건/비교가 있거나, 집계 키워드가 컬럼에 붙어 있지 않은 질문은 확실하지 않으므로 None을 반환한다.
+
+    Returns:
+        {'intent': 'missing' | 'aggregate' | 'unique' | 'group_by', ...} 또는 None (LLM 필요)
+    """
+    text = _normalize(query)
+    if any(_contains(_HOW_MANY.sub("", text), keyword) for keyword in OPEN_ENDED_KEYWORDS):
+        return None
+
+    numeric_columns = set(df.select_dtypes(include=['number']).columns)
+    mentioned = _find_columns(text, df.columns.tolist())
+    if _has_filter(text, mentioned):
+        return None
+
+    if any(_contains(text, keyword) for keyword in MISSING_KEYWORDS):
+        if not _is_missing_question(text):
+            return None
+        return {'intent': 'missing', 'columns': [item['column'] for item in mentioned]}
+
+    has_aggregation = any(_contains(text, keyword) for _, keyword in _AGGREGATION_KEYWORDS)
+
+    # 그룹별 집계: "{범주}별 {수치}의 평균", "average {수치} by {범주}"
+    for item in mentioned:
+        column = item['column']
+        after, before = text[item['end']:], text[:item['start']]
+        is_group = after.startswith('별') or after.startswith(' 별') or _GROUP_BY_EN.search(before) is not None
+        targets = [other for other in mentioned if other['column'] != column and other['column'] in numeric_columns]
+        if is_group and targets:
+            aggregations = _adjacent_aggregations(text, targets[0])
+            if has_aggregation and not aggregations:
+                return None
+            return {
+                'intent': 'group_by',
+                'group_column': column,
+                'column': targets[0]['column'],
+                'aggregation': aggregations[0] if aggregations else 'mean'
+            }
+
+    if len(mentioned) == 1 and any(_contains(text, keyword) for keyword in UNIQUE_KEYWORDS):
+        return {'intent': 'unique', 'column': mentioned[0]['column']}
+
+    if len(mentioned) == 1 and mentioned[0]['column'] in numeric_columns:
+        aggregations = _adjacent_aggregations(text, mentioned[0])
+        if aggregations:
+            return {'intent': 'aggregate', 'column': mentioned[0]['column'], 'aggregations': aggregations}
+
+    return None
+
+def _topic_particle(word: str) -> str:
+    """받침 유무에 따라 '은'/'는' 선택"""
+    last = word[-1]
+    if '가' <= last <= '힣':
+        return '은' if (ord(last) - ord('가')) % 28 else '는'
+    return '은'
+
+def _format_number(value: Any) -> str:
+    if value is None or (isinstance(value, float) and not np.isfinite(value)):
+        return "없음"
+    if isinstance(value, (int, np.integer)) or float(value).is_integer():
+        return f"{int(value):,}"
+    return f"{float(value):,.4f}".rstrip('0').rstrip('.')
+
+def _bar_chart(x: List[Any], y: List[Any], title: str, x_title: str, y_title: str) -> str:
+    fig = go.Figure(go.Bar(x=[str(value) for value in x], y=y))
+    fig.update_layout(title=title, xaxis_title=x_title, yaxis_title=y_title)
+    return fig.to_json()
+
+def _answer_missing(df: pd.DataFrame, intent: Dict[str, Any]) -> Dict[str, Any]:
+    columns = intent['columns'] or df.columns.tolist()
+    counts = df[columns].isna().sum()
+    missing = counts[counts > 0].sort_values(ascending=False)
+    total_rows = len(df)
+
+    if missing.empty:
+        response = f"{', '.join(map(str, columns))} 컬럼에는 결측값이 없습니다." if intent['columns'] \
+            else f"전체 {len(columns)}개 컬럼에 결측값이 없습니다."
+    else:
+        lines = [f"- {column}: {_format_number(count)}개 ({count / total_rows * 100:.2f}%)"
+                 for column, count in missing.items()]
+        response = f"결측값이 있는 컬럼은 {len(missing)}개입니다 (전체 {_format_number(total_rows)}행).\n" + "\n".join(lines)
+
+    chart_counts = missing.head(MAX_CHART_BARS) if not missing.empty else counts.head(MAX_CHART_BARS)
+    chart = _bar_chart(chart_counts.index.tolist(), chart_counts.tolist(), "컬럼별 결측값 개수", "column", "missing")
+    return {'response': response, 'chart_data': {'type': 'missing', 'data': chart}}
+
+def _answer_aggregate(df: pd.DataFrame, intent: Dict[str, Any]) -> Dict[str, Any]:
+    column = intent['column']
+    values = df[column].to_numpy(dtype=np.float64, na_value=np.nan)
+    finite = values[np.isfinite(values)]
+    functions = {'mean': np.mean, 'max': np.max, 'min': np.min, 'median': np.median, 'sum': np.sum}
+    results = {name: (float(functions[name](finite)) if len(finite) else None) for name in intent['aggregations']}
+
+    parts = [f"{AGGREGATIONS[name][1]}{_topic_particle(AGGREGATIONS[name][1])} {_format_number(value)}"
+             for name, value in results.items()]
+    response = f"{column}의 " + ", ".join(parts) + f"입니다 (결측 제외 {_format_number(len(finite))}개 값 기준)."
+
+    # 분포 히스토그램에 집계 값을 세로선으로 표시
+    counts, edges = np.histogram(finite, bins=30) if len(finite) else (np.array([]), np.array([0.0]))
+    fig = go.Figure(go.Bar(x=(edges[:-1] + edges[1:]) / 2, y=counts, width=np.diff(edges), name=str(column)))
+    for name, value in results.items():
+        if value is not None and name != 'sum':
+            fig.add_vline(x=value, line_dash="dash", annotation_text=f"{AGGREGATIONS[name][1]} {_format_number(value)}")
+    fig.update_layout(title=f"{column} 분포", xaxis_title=str(column), yaxis_title="count", bargap=0)
+    return {
+        'response': response,
+        'chart_data': {'type': 'distribution', 'data': fig.to_json()},
+        'values': results
+    }
+
+def _answer_unique(df: pd.DataFrame, intent: Dict[str, Any]) -> Dict[str, Any]:
+    column = intent['column']
+    counts = df[column].value_counts(dropna=True)
+    top = counts.head(MAX_CHART_BARS)
+    examples = ", ".join(f"{value}({_format_number(count)})" for value, count in counts.head(5).items())
+    response = f"{column}의 고유값은 {_format_number(len(counts))}개입니다."
+    if examples:
+        response += f" 가장 많은 값: {examples}."
+    chart = _bar_chart(top.index.tolist(), top.tolist(), f"{column} 값별 개수", str(column), "count")
+    return {'response': response, 'chart_data': {'type': 'bar', 'data': chart}, 'values': {'unique': int(len(counts))}}
+
+def _answer_group_by(df: pd.DataFrame, intent: Dict[str, Any]) -> Dict[str, Any]:
+    group_column, column, aggregation = intent['group_column'], intent['column'], intent['aggregation']
+    grouped = df.groupby(group_column, observed=True, sort=False)[column].agg(aggregation).dropna()
+    grouped = grouped.sort_values(ascending=False)
+    label = AGGREGATIONS[aggregation][1]
+
+    lines = [f"- {group}: {_format_number(value)}" for group, value in grouped.head(MAX_CHART_BARS).items()]
+    response = f"{group_column}별 {column}의 {label}입니다 ({_format_number(len(grouped))}개 그룹, 큰 순서).\n" + "\n".join(lines)
+    if len(grouped) > MAX_CHART_BARS:
+        response += f"\n... 외 {len(grouped) - MAX_CHART_BARS}개 그룹"
+
+    top = grouped.head(MAX_CHART_BARS)
+    chart = _bar_chart(top.index.tolist(), top.tolist(), f"{group_column}별 {column} {label}", str(group_column), f"{column} {label}")
+    return {'response': response, 'chart_data': {'type': 'bar', 'data': chart}}
+
+_ANSWERS = {
+    'missing': _answer_missing,
+    'aggregate': _answer_aggregate,
+    'unique': _answer_unique,
+    'group_by': _answer_group_by
+}
+
+def answer_intent(df: pd.DataFrame, intent: Dict[str, Any]) -> Dict[str, Any]:
+    """인식한 의도를 pandas 벡터 연산으로 바로 계산해서 응답과 차트 반환"""
+    return _ANSWERS[intent['intent']](df, intent)
@@ -0,0 +1,245 @@
+import os
+import pickle
+import sqlite3
+import threading
+import uuid
+from typing import Any, Callable, Dict, Iterator, Optional
+
+# 공유 상태 설정 (멀티 워커 실행 시 sqlite 사용)
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+STATE_BACKEND = os.getenv("STATE_BACKEND", "memory")  # memory | sqlite
+STATE_DIR = os.getenv("STATE_DIR", os.path.join(BACKEND_DIR, ".cache", "state"))
+
+class MemoryStateBackend:
+    """프로세스 내부 딕셔너리 상태 저장소 (단일 워커 기본값)
+
+    DataFrame도 복사 없이 참조만 보관한다.
+    """
+
+    shared = False
+
+    def __init__(self):
+        self._values: Dict[str, Dict[str, Any]] = {}
+        self._frames: Dict[str, Any] = {}
+        self._lock = threading.RLock()
+
+    def get(self, namespace: str, key: str, default: Any = None) -> Any:
+        with self._lock:
+            return self._values.get(namespace, {}).get(key, default)
+
+    def set(self, namespace: str, key: str, value: Any) -> None:
+        with self._lock:
+            self._values.setdefault(namespace, {})[key] = value
+
+    def add(self, namespace: str, key: str, value: Any) -> bool:
+        """키가 없을 때만 저장 (저장했으면 True)"""
+        with self._lock:
+            values = self._values.setdefault(namespace, {})
+            if key in values:
+                return False
+            values[key] = value
+            return True
+
+    def update(self, namespace: str, key: str, func: Callable[[Optional[Any]], Any]) -> Any:
+        """현재 값(없으면 None)을 func로 바꿔 저장하고 새 값 반환 (읽기-수정-쓰기를 원자적으로 수행)"""
+        with self._lock:
+            values = self._values.setdefault(namespace, {})
+            values[key] = func(values.get(key))
+            return values[key]
+
+    def delete(self, namespace: str, key: str) -> None:
+        with self._lock:
+            self._values.get(namespace, {}).pop(key, None)
+
+    def values(self, namespace: str) -> Iterator[Any]:
+        with self._lock:
+            return iter(list(self._values.get(namespace, {}).values()))
+
+    def incr(self, name: str, amount: int = 1) -> int:
+        """카운터를 증가시키고 증가된 값 반환"""
+        with self._lock:
+            counters = self._values.setdefault('__counters__', {})
+            counters[name] = counters.get(name, 0) + amount
+            return counters[name]
+
+    def get_counter(self, name: str) -> int:
+        """카운터 현재 값 (없으면 0)"""
+        with self._lock:
+            return self._values.get('__counters__', {}).get(name, 0)
+
+    def put_frame(self, key: str, df) -> None:
+        with self._lock:
+            self._frames[key] = df
+
+    def get_frame(self, key: str):
+        with self._lock:
+            return self._frames.get(key)
+
+    def delete_frame(self, key: str) -> None:
+        with self._lock:
+            self._frames.pop(key, None)
+
+class SQLiteStateBackend:
+    """여러 워커 프로세스가 공유하는 SQLite(WAL) 키-값 저장소와 디스크 데이터셋 저장소
+
+    값은 pickle로 저장하고, DataFrame은 state_dir/datasets 아래 Arrow IPC 파일로 저장해
+    다른 워커에서 메모리 맵으로 읽는다 (Arrow로 표현할 수 없는 경우 pickle 파일).
+    """
+
+    shared = True
+
+    def __init__(self, state_dir: str = STATE_DIR):
+        self.state_dir = state_dir
+        self.frames_dir = os.path.join(state_dir, "datasets")
+        self.db_path = os.path.join(state_dir, "state.db")
+        self._local = threading.local()
+        os.makedirs(self.frames_dir, exist_ok=True)
+
+        conn = self._connection()
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS kv ("
+            "namespace TEXT NOT NULL, key TEXT NOT NULL, value BLOB NOT NULL, "
+            "PRIMARY KEY (namespace, key))"
+        )
+        conn.execute("CREATE TABLE IF NOT EXISTS counters (name TEXT PRIMARY KEY, value INTEGER NOT NULL)")
+
+    def _connection(self) -> sqlite3.Connection:
+        """스레드별 연결 (autocommit, WAL)"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=30, isolation_level=None, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def get(self, namespace: str, key: str, default: Any = None) -> Any:
+        row = self._connection().execute(
+            "SELECT value FROM kv WHERE namespace = ? AND key = ?", (namespace, key)
+        ).fetchone()
+        return pickle.loads(row[0]) if row else default
+
+    def set(self, namespace: str, key: str, value: Any) -> None:
+        self._connection().execute(
+            "INSERT OR REPLACE INTO kv (namespace, key, value) VALUES (?, ?, ?)",
+            (namespace, key, pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+        )
+
+    def add(self, namespace: str, key: str, value: Any) -> bool:
+        """키가 없을 때만 저장 (저장했으면 True, 워커 간에도 원자적)"""
+        cursor = self._connection().execute(
+            "INSERT OR IGNORE INTO kv (namespace, key, value) VALUES (?, ?, ?)",
+            (namespace, key, pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+        )
+        return cursor.rowcount == 1
+
+    def update(self, namespace: str, key: str, func: Callable[[Optional[Any]], Any]) -> Any:
+        """현재 값(없으면 None)을 func로 바꿔 저장하고 새 값 반환 (워커 간에도 원자적)
+
+        func는 쓰기 잠금을 잡은 트랜잭션 안에서 실행되므로 다른 상태 저장소 메서드를 호출하지 않아야 한다.
+        """
+        conn = self._connection()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            row = conn.execute(
+                "SELECT value FROM kv WHERE namespace = ? AND key = ?", (namespace, key)
+            ).fetchone()
+            value = func(pickle.loads(row[0]) if row else None)
+            conn.execute(
+                "INSERT OR REPLACE INTO kv (namespace, key, value) VALUES (?, ?, ?)",
+                (namespace, key, pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+            )
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        return value
+
+    def delete(self, namespace: str, key: str) -> None:
+        self._connection().execute("DELETE FROM kv WHERE namespace = ? AND key = ?", (namespace, key))
+
+    def values(self, namespace: str) -> Iterator[Any]:
+        rows = self._connection().execute("SELECT value FROM kv WHERE namespace = ?", (namespace,)).fetchall()
+        return (pickle.loads(row[0]) for row in rows)
+
+    def incr(self, name: str, amount: int = 1) -> int:
+        """카운터를 증가시키고 증가된 값 반환 (워커 간 원자적)"""
+        conn = self._connection()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            conn.execute(
+                "INSERT INTO counters (name, value) VALUES (?, ?) "
+                "ON CONFLICT(name) DO UPDATE SET value = value + excluded.value",
+                (name, amount)
+            )
+            value = conn.execute("SELECT value FROM counters WHERE name = ?", (name,)).fetchone()[0]
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        return value
+
+    def get_counter(self, name: str) -> int:
+        """카운터 현재 값 (없으면 0, 쓰기 잠금 없이 읽기만 함)"""
+        row = self._connection().execute("SELECT value FROM counters WHERE name = ?", (name,)).fetchone()
+        return row[0] if row else 0
+
+    def _frame_path(self, key: str, extension: str) -> str:
+        return os.path.join(self.frames_dir, f"{key}.{extension}")
+
+    def put_frame(self, key: str, df) -> None:
+        import pyarrow as pa
+
+        # 다른 워커가 읽는 중일 수 있으므로 임시 파일에 쓴 뒤 교체
+        try:
+            table = pa.Table.from_pandas(df, preserve_index=False)
+            tmp_path = f"{self._frame_path(key, 'arrow')}.{uuid.uuid4().hex}.tmp"
+            with pa.OSFile(tmp_path, 'wb') as sink:
+                with pa.ipc.new_file(sink, table.schema) as writer:
+                    writer.write_table(table)
+            os.replace(tmp_path, self._frame_path(key, 'arrow'))
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            # 혼합 타입 object 컬럼 등은 pickle로 저장
+            tmp_path = f"{self._frame_path(key, 'pkl')}.{uuid.uuid4().hex}.tmp"
+            with open(tmp_path, 'wb') as f:
+                pickle.dump(df, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, self._frame_path(key, 'pkl'))
+
+    def get_frame(self, key: str):
+        import pyarrow as pa
+
+        try:
+            with pa.memory_map(self._frame_path(key, 'arrow')) as source:
+                return pa.ipc.open_file(source).read_all().to_pandas()
+        except FileNotFoundError:
+            pass
+        try:
+            with open(self._frame_path(key, 'pkl'), 'rb') as f:
+                return pickle.load(f)
+        except FileNotFoundError:
+            return None
+
+    def delete_frame(self, key: str) -> None:
+        for extension in ('arrow', 'pkl'):
+            try:
+                os.remove(self._frame_path(key, extension))
+            except OSError:
+                # 없는 파일이거나 (Windows에서) 다른 워커가 메모리 맵으로 열고 있는 경우
+                continue
+
+_state = None
+_state_lock = threading.Lock()
+
+def get_state():
+    """STATE_BACKEND 설정에 맞는 전역 상태 저장소"""
+    global _state
+    if _state is None:
+        with _state_lock:
+            if _state is None:
+                if STATE_BACKEND == "sqlite":
+                    _state = SQLiteStateBackend(STATE_DIR)
+                elif STATE_BACKEND == "memory":
+                    _state = MemoryStateBackend()
+                else:
+                    raise ValueError(f"Unknown STATE_BACKEND '{STATE_BACKEND}' (use 'memory' or 'sqlite')")
+    return _state
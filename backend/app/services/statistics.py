@@ -0,0 +1,160 @@
+import math
+import numpy as np
+import pandas as pd
+from typing import Any, Dict, Optional
+
+# 분위수 스케치 해상도 (0~1 구간을 균등하게 나눈 분위수 위치에서의 값을 저장)
+QUANTILE_GRID = np.linspace(0.0, 1.0, 257)
+
+class ColumnStatistics:
+    """수치형 컬럼 하나의 병합 가능한 요약 통계
+
+    개수/평균/제곱편차합(M2)/최솟값/최댓값은 블록 간 병합 시 정확하게 합쳐지고,
+    분위수는 고정 격자 위치의 값으로 이루어진 스케치를 가중 CDF로 합쳐 근사한다.
+    """
+
+    def __init__(self, count: int, mean: float, m2: float, min_value: float, max_value: float,
+                 sketch: Optional[np.ndarray]):
+        self.count = count
+        self.mean = mean
+        self.m2 = m2
+        self.min = min_value
+        self.max = max_value
+        self.sketch = sketch
+
+    @classmethod
+    def from_series(cls, series: pd.Series) -> "ColumnStatistics":
+        """컬럼 전체를 한 번 스캔해서 통계 계산"""
+        values = series.to_numpy(dtype=np.float64, na_value=np.nan)
+        values = values[~np.isnan(values)]
+        if len(values) == 0:
+            return cls(0, math.nan, 0.0, math.nan, math.nan, None)
+
+        mean = float(values.mean())
+        return cls(
+            count=len(values),
+            mean=mean,
+            m2=float(np.square(values - mean).sum()),
+            min_value=float(values.min()),
+            max_value=float(values.max()),
+            sketch=np.quantile(values, QUANTILE_GRID)
+        )
+
+    def merge(self, other: "ColumnStatistics") -> "ColumnStatistics":
+        """다른 블록의 통계와 병합 (Chan et al. 병렬 분산 공식)"""
+        if other.count == 0:
+            return self
+        if self.count == 0:
+            return other
+
+        count = self.count + other.count
+        delta = other.mean - self.mean
+        mean = self.mean + delta * other.count / count
+        m2 = self.m2 + other.m2 + delta * delta * self.count * other.count / count
+
+        # 두 스케치의 CDF를 개수로 가중 평균한 뒤 격자 위치에서 역함수 계산
+        points = np.union1d(self.sketch, other.sketch)
+        cdf = (
+            self.count * np.interp(points, self.sketch, QUANTILE_GRID, left=0.0, right=1.0)
+            + other.count * np.interp(points, other.sketch, QUANTILE_GRID, left=0.0, right=1.0)
+        ) / count
+        sketch = np.interp(QUANTILE_GRID, np.maximum.accumulate(cdf), points)
+
+        return ColumnStatistics(
+            count=count,
+            mean=mean,
+            m2=m2,
+            min_value=min(self.min, other.min),
+            max_value=max(self.max, other.max),
+            sketch=sketch
+        )
+
+    def quantile(self, q: float) -> float:
+        if self.sketch is None:
+            return math.nan
+        return float(np.interp(q, QUANTILE_GRID, self.sketch))
+
+    def describe(self) -> Dict[str, Optional[float]]:
+        """pandas describe()와 같은 형식의 요약 (NaN은 None)"""
+        std = math.sqrt(self.m2 / (self.count - 1)) if self.count > 1 else math.nan
+        summary = {
+            'count': float(self.count),
+            'mean': self.mean,
+            'std': std,
+            'min': self.min,
+            '25%': self.quantile(0.25),
+            '50%': self.quantile(0.5),
+            '75%': self.quantile(0.75),
+            'max': self.max
+        }
+        return {key: (None if isinstance(value, float) and math.isnan(value) else value)
+                for key, value in summary.items()}
+
+class CategoricalStatistics:
+    """문자열/범주형 등 비수치형 컬럼 하나의 병합 가능한 요약 통계
+
+    값별 개수를 그대로 저장하므로 블록 간 병합 결과가 전체 계산과 정확히 같다.
+    """
+
+    def __init__(self, counts: pd.Series):
+        self.counts = counts
+
+    @classmethod
+    def from_series(cls, series: pd.Series) -> "CategoricalStatistics":
+        counts = series.value_counts(dropna=True)
+        return cls(counts[counts > 0])
+
+    def merge(self, other: "CategoricalStatistics") -> "CategoricalStatistics":
+        if other.counts.empty:
+            return self
+        if self.counts.empty:
+            return other
+        counts = self.counts.add(other.counts, fill_value=0).astype(np.int64)
+        return CategoricalStatistics(counts.sort_values(ascending=False, kind='stable'))
+
+    def describe(self) -> Dict[str, Any]:
+        """pandas describe()의 비수치형 컬럼 형식 (count/unique/top/freq)"""
+        if self.counts.empty:
+            return {'count': 0, 'unique': 0, 'top': None, 'freq': None}
+        top = self.counts.index[0]
+        return {
+            'count': int(self.counts.sum()),
+            'unique': len(self.counts),
+            'top': top.item() if isinstance(top, np.generic) else top,
+            'freq': int(self.counts.iloc[0])
+        }
+
+def _is_numeric(series: pd.Series) -> bool:
+    return pd.api.types.is_numeric_dtype(series) and not pd.api.types.is_bool_dtype(series)
+
+def _column_statistics(series: pd.Series) -> Any:
+    if _is_numeric(series):
+        return ColumnStatistics.from_series(series)
+    return CategoricalStatistics.from_series(series)
+
+def compute_statistics(df: pd.DataFrame) -> Dict[str, Any]:
+    """DataFrame의 컬럼별 통계 계산 (수치형은 ColumnStatistics, 나머지는 CategoricalStatistics)"""
+    return {column: _column_statistics(df[column]) for column in df.columns}
+
+def merge_statistics(base: Dict[str, Any], block: Dict[str, Any], frame: pd.DataFrame) -> Dict[str, Any]:
+    """기존 데이터 통계와 추가된 블록(합성 데이터 등)의 통계 병합
+
+    블록마다 컬럼 종류가 다르거나(예: 수치형 -> 범주형) 한쪽에만 있는 컬럼은
+    일부 행만 반영한 값이 남지 않도록 병합된 전체 데이터(frame)에서 다시 계산한다.
+    """
+    merged = {}
+    for column in frame.columns:
+        stats, extra = base.get(column), block.get(column)
+        if stats is not None and type(extra) is type(stats):
+            merged[column] = stats.merge(extra)
+        else:
+            merged[column] = _column_statistics(frame[column])
+    return merged
+
+def describe_statistics(statistics: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+    """컬럼별 통계를 describe().to_dict() 형식으로 변환
+
+    describe()와 같이 수치형 컬럼이 있으면 수치형만, 없으면 나머지 컬럼을 요약한다.
+    """
+    numeric = {column: stats for column, stats in statistics.items() if isinstance(stats, ColumnStatistics)}
+    return {column: stats.describe() for column, stats in (numeric or statistics).items()}
@@ -0,0 +1,54 @@
+from fastapi import HTTPException, UploadFile
+from typing import BinaryIO, Tuple
+import hashlib
+import os
+
+# 업로드 설정
+UPLOAD_CHUNK_SIZE = 1024 * 1024  # 1MB 단위로 읽기
+DATA_UPLOAD_MAX_BYTES = int(os.getenv("DATA_UPLOAD_MAX_BYTES", str(2 * 1024 * 1024 * 1024)))  # 2GB
+ANALYSIS_UPLOAD_MAX_BYTES = int(os.getenv("ANALYSIS_UPLOAD_MAX_BYTES", str(50 * 1024 * 1024)))  # 50MB
+
+def _format_size(num_bytes: int) -> str:
+    """바이트 수를 사람이 읽기 쉬운 단위로 변환"""
+    if num_bytes >= 1024 * 1024 * 1024:
+        return f"{num_bytes / (1024 * 1024 * 1024):g}GB"
+    return f"{num_bytes / (1024 * 1024):g}MB"
+
+def _new_hasher():
+    """업로드 내용 해시 (BLAKE2b, 128bit)"""
+    return hashlib.blake2b(digest_size=16)
+
+def compute_content_hash(source: BinaryIO) -> str:
+    """파일 객체의 내용 해시를 청크 단위로 계산하고 처음 위치로 되돌림"""
+    hasher = _new_hasher()
+    source.seek(0)
+    for chunk in iter(lambda: source.read(UPLOAD_CHUNK_SIZE), b''):
+        hasher.update(chunk)
+    source.seek(0)
+    return hasher.hexdigest()
+
+async def spool_upload(file: UploadFile, max_bytes: int) -> Tuple[BinaryIO, str]:
+    """업로드 파일을 청크 단위로 확인하고 디스크에 스풀된 파일 객체와 내용 해시 반환
+
+    업로드 본문은 multipart 파서가 이미 임시 파일(SpooledTemporaryFile)로 스풀해 두므로
+    전체 내용을 메모리로 읽지 않고 청크 단위로 크기 검사와 해시 계산을 한 뒤 처음 위치로 되돌린다.
+    """
+    hasher = _new_hasher()
+    total_size = 0
+    while True:
+        chunk = await file.read(UPLOAD_CHUNK_SIZE)
+        if not chunk:
+            break
+        hasher.update(chunk)
+        total_size += len(chunk)
+        if total_size > max_bytes:
+            raise HTTPException(
+                status_code=413,
+                detail=f"파일 크기는 {_format_size(max_bytes)}를 초과할 수 없습니다."
+            )
+
+    if total_size == 0:
+        raise HTTPException(status_code=400, detail="빈 파일은 업로드할 수 없습니다.")
+
+    await file.seek(0)
+    return file.file, hasher.hexdigest()
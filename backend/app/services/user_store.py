@@ -0,0 +1,141 @@
+import os
+import queue
+import sqlite3
+import threading
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Any, Dict, Iterator, Optional
+
+# 사용자 DB 설정 (재시작/여러 워커에서도 유지되는 로컬 SQLite 파일)
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+USER_DB_PATH = os.getenv("USER_DB_PATH", os.path.join(BACKEND_DIR, "data", "users.db"))
+USER_DB_POOL_SIZE = int(os.getenv("USER_DB_POOL_SIZE", "8"))
+
+_USER_COLUMNS = "id, email, username, full_name, hashed_password, is_active, created_at"
+
+class UserAlreadyExists(Exception):
+    """사용자명 또는 이메일이 이미 등록된 경우 (field: 'username' | 'email')"""
+
+    def __init__(self, field: str):
+        super().__init__(field)
+        self.field = field
+
+class SQLiteConnectionPool:
+    """스레드 간에 재사용하는 SQLite 연결 풀
+
+    연결은 autocommit(WAL) 모드로 열고, 사용 중인 연결은 한 스레드만 쓰도록 풀에서 빌려준다.
+    조회가 수십 µs 수준이라 async 엔드포인트에서도 그대로 호출할 수 있다.
+    """
+
+    def __init__(self, db_path: str, size: int = USER_DB_POOL_SIZE):
+        self.db_path = db_path
+        self.size = size
+        self._pool: "queue.LifoQueue[sqlite3.Connection]" = queue.LifoQueue(maxsize=size)
+        self._created = 0
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_path, timeout=30, isolation_level=None, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    @contextmanager
+    def connection(self) -> Iterator[sqlite3.Connection]:
+        try:
+            conn = self._pool.get_nowait()
+        except queue.Empty:
+            with self._lock:
+                can_create = self._created < self.size
+                if can_create:
+                    self._created += 1
+            # 풀이 가득 찼으면 다른 요청이 반납할 때까지 대기
+            conn = self._connect() if can_create else self._pool.get()
+        try:
+            yield conn
+        finally:
+            self._pool.put(conn)
+
+class SQLiteUserRepository:
+    """SQLite(WAL) 사용자 저장소 (사용자명/이메일 유니크 인덱스)"""
+
+    def __init__(self, db_path: str = USER_DB_PATH, pool_size: int = USER_DB_POOL_SIZE):
+        os.makedirs(os.path.dirname(os.path.abspath(db_path)), exist_ok=True)
+        self.pool = SQLiteConnectionPool(db_path, pool_size)
+        with self.pool.connection() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS users ("
+                "id INTEGER PRIMARY KEY AUTOINCREMENT, "
+                "email TEXT NOT NULL, "
+                "username TEXT NOT NULL, "
+                "full_name TEXT, "
+                "hashed_password TEXT NOT NULL, "
+                "is_active INTEGER NOT NULL DEFAULT 1, "
+                "created_at TEXT NOT NULL)"
+            )
+            conn.execute("CREATE UNIQUE INDEX IF NOT EXISTS ix_users_username ON users (username)")
+            conn.execute("CREATE UNIQUE INDEX IF NOT EXISTS ix_users_email ON users (email)")
+
+    @staticmethod
+    def _to_dict(row) -> Optional[Dict[str, Any]]:
+        if row is None:
+            return None
+        return {
+            "id": row[0],
+            "email": row[1],
+            "username": row[2],
+            "full_name": row[3],
+            "hashed_password": row[4],
+            "is_active": bool(row[5]),
+            "created_at": datetime.fromisoformat(row[6])
+        }
+
+    def get_by_username(self, username: str) -> Optional[Dict[str, Any]]:
+        with self.pool.connection() as conn:
+            row = conn.execute(f"SELECT {_USER_COLUMNS} FROM users WHERE username = ?", (username,)).fetchone()
+        return self._to_dict(row)
+
+    def get_by_email(self, email: str) -> Optional[Dict[str, Any]]:
+        with self.pool.connection() as conn:
+            row = conn.execute(f"SELECT {_USER_COLUMNS} FROM users WHERE email = ?", (email,)).fetchone()
+        return self._to_dict(row)
+
+    def add(
+        self,
+        email: str,
+        username: str,
+        full_name: Optional[str],
+        hashed_password: str,
+        created_at: datetime
+    ) -> Dict[str, Any]:
+        """사용자 추가 (중복이면 UserAlreadyExists, 워커 간에도 유니크 인덱스로 보장)"""
+        try:
+            with self.pool.connection() as conn:
+                cursor = conn.execute(
+                    "INSERT INTO users (email, username, full_name, hashed_password, is_active, created_at) "
+                    "VALUES (?, ?, ?, ?, 1, ?)",
+                    (email, username, full_name, hashed_password, created_at.isoformat())
+                )
+        except sqlite3.IntegrityError as e:
+            raise UserAlreadyExists("email" if "users.email" in str(e) else "username") from e
+        return {
+            "id": cursor.lastrowid,
+            "email": email,
+            "username": username,
+            "full_name": full_name,
+            "hashed_password": hashed_password,
+            "is_active": True,
+            "created_at": created_at
+        }
+
+_repository = None
+_repository_lock = threading.Lock()
+
+def get_user_repository() -> SQLiteUserRepository:
+    """전역 사용자 저장소"""
+    global _repository
+    if _repository is None:
+        with _repository_lock:
+            if _repository is None:
+                _repository = SQLiteUserRepository()
+    return _repository
@@ -0,0 +1,126 @@
+import pandas as pd
+import numpy as np
+from typing import Optional, List, Tuple, Dict, Any
+
+class CorrelationEngine:
+    """
+    넓은 데이터셋을 위한 상관관계 계산 클래스
+    표준화된 데이터를 float32로 행 블록 단위 행렬곱해서 상관계수 행렬을 계산
+    """
+
+    def __init__(
+        self,
+        max_rows: Optional[int] = 200_000,
+        block_rows: int = 65_536,
+        random_state: int = 42
+    ):
+        """
+        Args:
+            max_rows: 이 행 수를 넘으면 무작위 부분 표본으로 계산 (None이면 전체 사용)
+            block_rows: 한 번에 float32로 변환해서 곱할 행 수 (메모리 상한)
+            random_state: 부분 표본 추출 시드
+        """
+        self.max_rows = max_rows
+        self.block_rows = block_rows
+        self.random_state = random_state
+
+    def compute(self, data: pd.DataFrame) -> Tuple[List[str], np.ndarray]:
+        """수치형 컬럼의 피어슨 상관계수 행렬 계산
+
+        결측값은 표준화 후 0(평균)으로 대체하고, 두 컬럼이 모두 관측된 행 수로 나눠
+        pairwise 계산에 가깝게 보정한다 (평균/표준편차는 컬럼 전체 기준).
+        """
+        numeric_data = data.select_dtypes(include=[np.number])
+        columns = numeric_data.columns.tolist()
+        if len(columns) == 0:
+            return columns, np.empty((0, 0), dtype=np.float32)
+
+        if self.max_rows is not None and len(numeric_data) > self.max_rows:
+            numeric_data = numeric_data.sample(n=self.max_rows, random_state=self.random_state)
+
+        # 1차: 컬럼별 평균/표준편차 (float64로 누적)
+        means = numeric_data.mean().to_numpy(dtype=np.float64)
+        stds = numeric_data.std().to_numpy(dtype=np.float64)
+        counts = numeric_data.count().to_numpy()
+        valid = (stds > 0) & (counts > 1)
+        scale = np.where(valid, stds, 1.0)
+        has_missing = bool((counts < len(numeric_data)).any())
+
+        # 2차: 행 블록 단위로 표준화 후 Z^T Z 누적
+        n_columns = len(columns)
+        gram = np.zeros((n_columns, n_columns), dtype=np.float32)
+        pair_counts = np.zeros((n_columns, n_columns), dtype=np.float32) if has_missing else None
+        for start in range(0, len(numeric_data), self.block_rows):
+            block = numeric_data.iloc[start:start + self.block_rows].to_numpy(dtype=np.float32, na_value=np.nan)
+            block = (block - means.astype(np.float32)) / scale.astype(np.float32)
+            if has_missing:
+                observed = (~np.isnan(block)).astype(np.float32)
+                pair_counts += observed.T @ observed
+            np.nan_to_num(block, copy=False, nan=0.0)
+            gram += block.T @ block
+
+        if has_missing:
+            corr = gram / np.maximum(pair_counts - 1, 1)
+        else:
+            corr = gram / np.float32(max(len(numeric_data) - 1, 1))
+        np.clip(corr, -1.0, 1.0, out=corr)
+        np.fill_diagonal(corr, 1.0)
+
+        # 상수 컬럼은 pandas와 동일하게 NaN
+        corr[~valid, :] = np.nan
+        corr[:, ~valid] = np.nan
+
+        return columns, corr
+
+    @staticmethod
+    def top_pairs(columns: List[str], corr: np.ndarray, k: int = 20) -> List[Dict[str, Any]]:
+        """절댓값 기준 상관관계가 가장 강한 컬럼 쌍 k개"""
+        rows, cols = np.triu_indices(len(columns), k=1)
+        values = corr[rows, cols]
+        finite = np.isfinite(values)
+        rows, cols, values = rows[finite], cols[finite], values[finite]
+
+        k = min(k, len(values))
+        if k == 0:
+            return []
+        top = np.argpartition(-np.abs(values), k - 1)[:k]
+        top = top[np.argsort(-np.abs(values[top]))]
+
+        return [
+            {
+                'column_1': columns[rows[i]],
+                'column_2': columns[cols[i]],
+                'correlation': float(values[i])
+            }
+            for i in top
+        ]
+
+    @staticmethod
+    def truncate(
+        columns: List[str],
+        corr: np.ndarray,
+        max_columns: int = 50,
+        cluster: bool = True
+    ) -> Tuple[List[str], np.ndarray]:
+        """상관관계가 강한 컬럼만 남기고 계층적 군집 순서로 정렬"""
+        abs_corr = np.nan_to_num(np.abs(corr), nan=0.0)
+
+        if len(columns) > max_columns:
+            # 다른 컬럼과의 상관계수 절댓값 합이 큰 컬럼 우선
+            strength = abs_corr.sum(axis=0) - np.diag(abs_corr)
+            keep = np.sort(np.argsort(-strength)[:max_columns])
+            columns = [columns[i] for i in keep]
+            corr = corr[np.ix_(keep, keep)]
+            abs_corr = abs_corr[np.ix_(keep, keep)]
+
+        if cluster and len(columns) > 2:
+            from scipy.cluster.hierarchy import linkage, leaves_list
+            from scipy.spatial.distance import squareform
+
+            distance = 1.0 - abs_corr
+            np.fill_diagonal(distance, 0.0)
+            order = leaves_list(linkage(squareform(distance, checks=False), method='average'))
+            columns = [columns[i] for i in order]
+            corr = corr[np.ix_(order, order)]
+
+        return columns, corr
@@ -1,11 +1,7 @@
 import pandas as pd
 import numpy as np
-from sklearn.preprocessing import LabelEncoder
-from sklearn.mixture import GaussianMixture
-from sklearn.preprocessing import StandardScaler
-from imblearn.over_sampling import SMOTE
-from scipy.stats import multivariate_normal
-from typing import Optional, Union, Dict, Any
+from typing import Optional, Dict, Any
+from stage_timer import StageTimer
 import warnings
 warnings.filterwarnings('ignore')
 
@@ -46,20 +42,71 @@ class DataAugmentor:
         
     def fit_transform(self, data: pd.DataFrame) -> pd.DataFrame:
         """데이터에 맞춰 모델을 학습하고 증강된 데이터를 반환"""
+        if self.method == "smote":
+            data = data.copy()
+            self.original_dtypes = data.dtypes.to_dict()
+            return self._smote_augmentation(data)
+        
+        self.fit(data)
+        return self.transform(data)
+    
+    def fit(self, data: pd.DataFrame) -> "DataAugmentor":
+        """생성 모델만 학습 (샘플 수와 무관하므로 증강 비율이 바뀌어도 재사용 가능)"""
         data = data.copy()
         self.original_dtypes = data.dtypes.to_dict()
+        self.model = None
         
         if self.method == "smote":
-            return self._smote_augmentation(data)
+            raise NotImplementedError("SMOTE does not support separate fitting. Use fit_transform instead.")
         elif self.method == "gaussian_copula":
-            return self._gaussian_copula_augmentation(data)
+            self._fit_gaussian_copula(data)
         elif self.method == "bayesian_network":
-            return self._bayesian_network_augmentation(data)
+            self._fit_bayesian_network(data)
         else:
             raise ValueError(f"Unsupported augmentation method: {self.method}")
+        
+        return self
+    
+    def transform(
+        self,
+        data: pd.DataFrame,
+        num_samples: Optional[int] = None,
+        timer: Optional[StageTimer] = None
+    ) -> pd.DataFrame:
+        """학습된 모델로 샘플을 생성해 원본 데이터 뒤에 추가 (timer가 주어지면 단계별 소요 시간 기록)"""
+        timer = timer or StageTimer()
+        if num_samples is None:
+            num_samples = self.compute_num_samples(len(data), self.augmentation_ratio, self.target_rows)
+        
+        if self.model is None or num_samples <= 0:
+            return data
+        
+        try:
+            with timer.stage('sample', num_samples):
+                synthetic_data = self.generate_samples(num_samples)
+            with timer.stage('concat', len(data) + len(synthetic_data)):
+                return pd.concat([data, synthetic_data], ignore_index=True)
+        except Exception as e:
+            print(f"Error in {self.method} sample generation: {e}")
+            return data
+    
+    @staticmethod
+    def compute_num_samples(
+        num_rows: int,
+        augmentation_ratio: float = 1.0,
+        target_rows: Optional[int] = None
+    ) -> int:
+        """생성할 샘플 수 계산 (target_rows가 있으면 우선 사용)"""
+        if target_rows is not None:
+            return max(0, target_rows - num_rows)
+        return int(num_rows * augmentation_ratio)
     
     def _smote_augmentation(self, data: pd.DataFrame) -> pd.DataFrame:
         """SMOTE를 사용한 데이터 증강"""
+        # sklearn/imblearn은 import 비용이 커서 SMOTE를 처음 사용할 때 로드
+        from sklearn.preprocessing import LabelEncoder
+        from imblearn.over_sampling import SMOTE
+        
         if self.target_column is None:
             raise ValueError("SMOTE requires a target column")
         
@@ -73,13 +120,13 @@ class DataAugmentor:
         # 범주형 변수 인코딩
         X_encoded = X.copy()
         for column in X.columns:
-            if X[column].dtype == 'object' or X[column].dtype.name == 'category':
+            if not pd.api.types.is_numeric_dtype(X[column]):
                 le = LabelEncoder()
                 X_encoded[column] = le.fit_transform(X[column].astype(str))
                 self.label_encoders[column] = le
         
         # 타겟 변수 인코딩
-        if y.dtype == 'object' or y.dtype.name == 'category':
+        if not pd.api.types.is_numeric_dtype(y):
             target_le = LabelEncoder()
             y_encoded = target_le.fit_transform(y.astype(str))
             self.label_encoders[self.target_column] = target_le
@@ -120,8 +167,11 @@ class DataAugmentor:
         
         return result
     
-    def _gaussian_copula_augmentation(self, data: pd.DataFrame) -> pd.DataFrame:
-        """Gaussian Copula를 사용한 데이터 증강 (간단한 구현)"""
+    def _fit_gaussian_copula(self, data: pd.DataFrame) -> None:
+        """Gaussian Copula 모델 학습 (간단한 구현)"""
+        from sklearn.mixture import GaussianMixture
+        from sklearn.preprocessing import StandardScaler
+        
         try:
             # 수치형 컬럼만 선택
             numeric_data = data.select_dtypes(include=[np.number])
@@ -129,7 +179,7 @@ class DataAugmentor:
             
             if len(numeric_data.columns) == 0:
                 print("Warning: No numeric columns found for Gaussian Copula")
-                return data
+                return
             
             # 수치형 데이터에 대해 Gaussian Mixture Model 적용
             scaler = StandardScaler()
@@ -143,55 +193,51 @@ class DataAugmentor:
             gmm = GaussianMixture(n_components=n_components, random_state=self.random_state)
             gmm.fit(scaled_data)
             
-            # 새로운 샘플 생성
-            if self.target_rows is not None:
-                num_samples = max(0, self.target_rows - len(data))
-            else:
-                num_samples = int(len(data) * self.augmentation_ratio)
-            
-            if num_samples <= 0:
-                return data
-                
-            synthetic_scaled = gmm.sample(num_samples)[0]
-            
-            # 스케일링 역변환
-            synthetic_numeric = scaler.inverse_transform(synthetic_scaled)
-            synthetic_numeric_df = pd.DataFrame(synthetic_numeric, columns=numeric_data.columns)
-            
-            # 범주형 데이터 처리 (원본에서 랜덤 샘플링)
-            if len(categorical_data.columns) > 0:
-                synthetic_categorical = categorical_data.sample(
-                    n=num_samples, 
-                    replace=True, 
-                    random_state=self.random_state
-                ).reset_index(drop=True)
-                
-                # 합치기
-                synthetic_data = pd.concat([synthetic_numeric_df, synthetic_categorical], axis=1)
-            else:
-                synthetic_data = synthetic_numeric_df
-            
-            # 컬럼 순서 맞추기
-            synthetic_data = synthetic_data[data.columns]
-            
-            # 원본 데이터와 합치기
-            result = pd.concat([data, synthetic_data], ignore_index=True)
-            
-            self.model = {'scaler': scaler, 'gmm': gmm}
-            return result
+            self.model = {
+                'scaler': scaler,
+                'gmm': gmm,
+                'numeric_columns': numeric_data.columns,
+                # 범주형은 원본에서 랜덤 샘플링하므로 학습 데이터 보관
+                'categorical_data': categorical_data,
+                'columns': data.columns
+            }
             
         except Exception as e:
             print(f"Error in Gaussian Copula augmentation: {e}")
-            return data
     
-    def _bayesian_network_augmentation(self, data: pd.DataFrame) -> pd.DataFrame:
-        """Bayesian Network 기반 데이터 증강 (간단한 통계적 구현)"""
+    def _sample_gaussian_copula(self, num_samples: int) -> pd.DataFrame:
+        """학습된 Gaussian Copula 모델에서 샘플 생성"""
+        synthetic_scaled = self.model['gmm'].sample(num_samples)[0]
+        
+        # 스케일링 역변환
+        synthetic_numeric = self.model['scaler'].inverse_transform(synthetic_scaled)
+        synthetic_numeric_df = pd.DataFrame(synthetic_numeric, columns=self.model['numeric_columns'])
+        
+        # 범주형 데이터 처리 (원본에서 랜덤 샘플링)
+        categorical_data = self.model['categorical_data']
+        if len(categorical_data.columns) > 0:
+            synthetic_categorical = categorical_data.sample(
+                n=num_samples, 
+                replace=True, 
+                random_state=self.random_state
+            ).reset_index(drop=True)
+            
+            # 합치기
+            synthetic_data = pd.concat([synthetic_numeric_df, synthetic_categorical], axis=1)
+        else:
+            synthetic_data = synthetic_numeric_df
+        
+        # 컬럼 순서 맞추기
+        return synthetic_data[self.model['columns']]
+    
+    def _fit_bayesian_network(self, data: pd.DataFrame) -> None:
+        """Bayesian Network 기반 모델 학습 (간단한 통계적 구현)"""
         try:
             # 각 컬럼의 통계 정보 계산
             column_stats = {}
             
             for column in data.columns:
-                if data[column].dtype in ['int64', 'float64']:
+                if pd.api.types.is_numeric_dtype(data[column]) and not pd.api.types.is_bool_dtype(data[column]):
                     # 수치형: 평균, 표준편차
                     column_stats[column] = {
                         'type': 'numeric',
@@ -209,55 +255,39 @@ class DataAugmentor:
                         'values': value_counts.index.tolist()
                     }
             
-            # 새로운 샘플 생성
-            if self.target_rows is not None:
-                num_samples = max(0, self.target_rows - len(data))
-            else:
-                num_samples = int(len(data) * self.augmentation_ratio)
-            
-            if num_samples <= 0:
-                return data
-                
-            synthetic_data = []
-            
-            for _ in range(num_samples):
-                sample = {}
-                for column, stats in column_stats.items():
-                    if stats['type'] == 'numeric':
-                        # 정규분포에서 샘플링
-                        value = np.random.normal(stats['mean'], stats['std'])
-                        # 범위 제한
-                        value = np.clip(value, stats['min'], stats['max'])
-                        sample[column] = value
-                    else:
-                        # 범주형은 확률에 따라 샘플링
-                        values = stats['values']
-                        probs = [stats['probabilities'][v] for v in values]
-                        sample[column] = np.random.choice(values, p=probs)
-                
-                synthetic_data.append(sample)
-            
-            synthetic_df = pd.DataFrame(synthetic_data)
-            
-            # 원본 데이터와 합치기
-            result = pd.concat([data, synthetic_df], ignore_index=True)
-            
             self.model = column_stats
-            return result
             
         except Exception as e:
             print(f"Error in Bayesian Network augmentation: {e}")
-            return data
+    
+    def _sample_bayesian_network(self, num_samples: int) -> pd.DataFrame:
+        """학습된 컬럼별 분포에서 샘플 생성 (컬럼 단위 벡터화)"""
+        synthetic_data = {}
+        
+        for column, stats in self.model.items():
+            if stats['type'] == 'numeric':
+                # 정규분포에서 샘플링 후 범위 제한
+                values = np.random.normal(stats['mean'], stats['std'], size=num_samples)
+                synthetic_data[column] = np.clip(values, stats['min'], stats['max'])
+            else:
+                # 범주형은 확률에 따라 샘플링
+                values = stats['values']
+                probs = [stats['probabilities'][v] for v in values]
+                synthetic_data[column] = np.random.choice(values, size=num_samples, p=probs)
+        
+        return pd.DataFrame(synthetic_data)
     
     def generate_samples(self, num_samples: int) -> pd.DataFrame:
         """학습된 모델로 새로운 샘플 생성"""
         if self.model is None:
-            raise ValueError("Model not fitted. Call fit_transform first.")
+            raise ValueError("Model not fitted. Call fit or fit_transform first.")
         
         if self.method == "smote":
             raise NotImplementedError("SMOTE does not support standalone sample generation")
-        
-        return self.model.sample(num_samples)
+        elif self.method == "gaussian_copula":
+            return self._sample_gaussian_copula(num_samples)
+        else:
+            return self._sample_bayesian_network(num_samples)
     
     def get_augmentation_summary(self) -> Dict[str, Any]:
         """증강 요약 정보 반환"""
@@ -1,12 +1,14 @@
 import pandas as pd
 import numpy as np
-from sklearn.preprocessing import StandardScaler, LabelEncoder
-from sklearn.ensemble import IsolationForest
-from scipy import stats
 from typing import Dict, Optional, Any
+from stage_timer import StageTimer
 import warnings
 warnings.filterwarnings('ignore')
 
+def _is_numeric(series: pd.Series) -> bool:
+    """bool을 제외한 수치형 컬럼 여부"""
+    return pd.api.types.is_numeric_dtype(series) and not pd.api.types.is_bool_dtype(series)
+
 class DataPreprocessor:
     """
     데이터 전처리를 담당하는 클래스
@@ -34,18 +36,23 @@ class DataPreprocessor:
         self.fill_values = {}
         self.outlier_bounds = {}
         
-    def fit_transform(self, data: pd.DataFrame) -> pd.DataFrame:
-        """데이터를 전처리하고 변환"""
+    def fit_transform(self, data: pd.DataFrame, timer: Optional[StageTimer] = None) -> pd.DataFrame:
+        """데이터를 전처리하고 변환 (timer가 주어지면 단계별 소요 시간 기록)"""
+        timer = timer or StageTimer()
         data = data.copy()
         
         # 1. 데이터 타입 변환
-        data = self._convert_data_types(data)
+        with timer.stage('type_conversion', len(data)):
+            data = self._convert_data_types(data)
         
         # 2. 결측치 처리
-        data = self._handle_missing_values(data)
+        with timer.stage('imputation', len(data)) as record:
+            data = self._handle_missing_values(data)
+            record['rows'] = len(data)
         
         # 3. 이상치 처리
-        data = self._handle_outliers(data)
+        with timer.stage('outliers', len(data)):
+            data = self._handle_outliers(data)
         
         return data
     
@@ -96,23 +103,31 @@ class DataPreprocessor:
         for column in data.columns:
             if data[column].isna().sum() == 0:
                 continue
+            
+            # 다운캐스팅된 수치형(int8, float32 등)도 수치형으로 처리
+            is_numeric = _is_numeric(data[column])
                 
-            if self.missing_strategy == "mean" and data[column].dtype in ['int64', 'float64']:
+            if self.missing_strategy == "mean" and is_numeric:
                 fill_value = data[column].mean()
-            elif self.missing_strategy == "median" and data[column].dtype in ['int64', 'float64']:
+            elif self.missing_strategy == "median" and is_numeric:
                 fill_value = data[column].median()
             elif self.missing_strategy == "mode":
                 fill_value = data[column].mode().iloc[0] if len(data[column].mode()) > 0 else data[column].iloc[0]
-            elif self.missing_strategy == "interpolate" and data[column].dtype in ['int64', 'float64']:
+            elif self.missing_strategy == "interpolate" and is_numeric:
                 data[column] = data[column].interpolate()
                 continue
             else:
                 # 기본값: 수치형은 평균, 범주형은 최빈값
-                if data[column].dtype in ['int64', 'float64']:
+                if is_numeric:
                     fill_value = data[column].mean()
                 else:
                     fill_value = data[column].mode().iloc[0] if len(data[column].mode()) > 0 else "Unknown"
             
+            # category 컬럼은 채울 값이 범주에 없으면 먼저 추가
+            if isinstance(data[column].dtype, pd.CategoricalDtype) and pd.notna(fill_value) \
+                    and fill_value not in data[column].cat.categories:
+                data[column] = data[column].cat.add_categories([fill_value])
+            
             self.fill_values[column] = fill_value
             data[column] = data[column].fillna(fill_value)
         
@@ -137,7 +152,6 @@ class DataPreprocessor:
                 data[column] = np.clip(data[column], lower_bound, upper_bound)
                 
             elif self.outlier_strategy == "zscore":
-                z_scores = np.abs(stats.zscore(data[column].dropna()))
                 threshold = 3
                 
                 mean_val = data[column].mean()
@@ -149,6 +163,8 @@ class DataPreprocessor:
                 data[column] = np.clip(data[column], lower_bound, upper_bound)
                 
             elif self.outlier_strategy == "isolation_forest":
+                # sklearn은 isolation_forest 전략을 처음 사용할 때 로드
+                from sklearn.ensemble import IsolationForest
                 iso_forest = IsolationForest(contamination=0.1, random_state=42)
                 outliers = iso_forest.fit_predict(data[[column]].dropna())
                 
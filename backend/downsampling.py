@@ -0,0 +1,78 @@
+import numpy as np
+from typing import Optional
+
+class Downsampler:
+    """
+    점 기반 차트(산점도, 선 그래프)의 전송 점 개수를 제한하는 클래스
+    순서가 있는 시계열은 LTTB, 산점도는 그룹 비율을 보존하는 층화 샘플링을 사용
+    """
+
+    def __init__(self, max_points: int = 5000, random_state: int = 42):
+        """
+        Args:
+            max_points: 차트 하나에 전송할 최대 점 개수
+            random_state: 샘플링 시드
+        """
+        self.max_points = max_points
+        self.random_state = random_state
+
+    def lttb_indices(self, x: np.ndarray, y: np.ndarray, max_points: Optional[int] = None) -> np.ndarray:
+        """Largest-Triangle-Three-Buckets로 선택한 점의 인덱스
+
+        첫 점과 마지막 점을 유지하고, 나머지 구간을 max_points - 2개 버킷으로 나눠
+        이전 선택점과 다음 버킷 평균점이 만드는 삼각형 넓이가 가장 큰 점을 고른다.
+        x는 오름차순으로 정렬되어 있어야 한다.
+        """
+        threshold = max_points or self.max_points
+        n = len(x)
+        if threshold >= n or threshold < 3:
+            return np.arange(n)
+
+        x = np.asarray(x, dtype=np.float64)
+        y = np.asarray(y, dtype=np.float64)
+        edges = np.linspace(1, n - 1, threshold - 1).astype(np.int64)
+
+        selected = np.empty(threshold, dtype=np.int64)
+        selected[0] = 0
+        selected[-1] = n - 1
+        a = 0
+        for i in range(threshold - 2):
+            start, end = edges[i], max(edges[i + 1], edges[i] + 1)
+            next_start = end
+            next_end = edges[i + 2] if i + 2 < len(edges) else n
+            next_end = max(next_end, next_start + 1)
+
+            avg_x = x[next_start:next_end].mean()
+            avg_y = y[next_start:next_end].mean()
+
+            area = np.abs(
+                (x[a] - avg_x) * (y[start:end] - y[a])
+                - (x[a] - x[start:end]) * (avg_y - y[a])
+            )
+            a = start + int(np.argmax(area))
+            selected[i + 1] = a
+
+        return selected
+
+    def stratified_indices(self, labels: np.ndarray, max_points: Optional[int] = None) -> np.ndarray:
+        """그룹(예: 원본/증강) 비율을 유지하는 무작위 샘플 인덱스 (정렬됨)"""
+        budget = max_points or self.max_points
+        n = len(labels)
+        if budget >= n:
+            return np.arange(n)
+
+        rng = np.random.default_rng(self.random_state)
+        groups, inverse, counts = np.unique(labels, return_inverse=True, return_counts=True)
+
+        # 비율대로 배분하고 남는 자리는 소수점 이하가 큰 그룹부터 채움
+        exact = counts * budget / n
+        quotas = np.floor(exact).astype(np.int64)
+        remainder = budget - quotas.sum()
+        quotas[np.argsort(-(exact - quotas))[:remainder]] += 1
+
+        selected = []
+        for group_index, quota in enumerate(quotas):
+            members = np.flatnonzero(inverse == group_index)
+            selected.append(rng.choice(members, size=min(quota, len(members)), replace=False))
+
+        return np.sort(np.concatenate(selected))
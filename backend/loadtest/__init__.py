@@ -0,0 +1 @@
+# 이 파일은 loadtest 패키지를 만들기 위한 __init__.py 입니다
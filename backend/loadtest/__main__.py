@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""API 부하 테스트
+
+서버를 로컬에서 띄우고(가짜 LLM 사용) 로그인한 뒤 업로드/처리/페이징/시각화/다운로드/분석 요청을
+섞어서 실행하고, 엔드포인트별 p50/p95/p99 지연 시간과 처리량을 JSON으로 출력한다.
+
+    python -m loadtest run --concurrency 8 --rows 50000 --duration 60 --output results/v1.json
+    python -m loadtest run --url http://localhost:8000 --mix paginate=5,visualize=2
+    python -m loadtest compare results/v1.json results/v2.json
+"""
+import argparse
+import json
+import os
+import platform
+import socket
+import subprocess
+import sys
+from datetime import datetime
+from typing import Optional
+
+from .report import compare, summarize
+from .workload import ApiClient, Workload, generate_dataset, parse_mix
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+def _git_revision() -> Optional[str]:
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=BACKEND_DIR, stderr=subprocess.DEVNULL
+        ).decode().strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def _start_server(port: int, llm_latency: float) -> subprocess.Popen:
+    return subprocess.Popen(
+        [sys.executable, "-m", "loadtest.server", "--port", str(port), "--llm-latency", str(llm_latency)],
+        cwd=BACKEND_DIR
+    )
+
+def run(args: argparse.Namespace) -> dict:
+    server = None
+    base_url = args.url
+    if base_url is None:
+        port = _free_port()
+        server = _start_server(port, args.llm_latency)
+        base_url = f"http://127.0.0.1:{port}"
+
+    try:
+        client = ApiClient(base_url)
+        startup_seconds = client.wait_until_ready()
+        client.login(args.username, args.password)
+
+        dataset = generate_dataset(args.rows, args.numeric_columns, args.categorical_columns, args.seed)
+        workload = Workload(client, dataset, parse_mix(args.mix), args.page_size, args.seed)
+        workload.setup()
+        elapsed = workload.run(args.concurrency, args.duration, args.requests)
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait(timeout=30)
+
+    return {
+        'meta': {
+            'timestamp': datetime.now().isoformat(),
+            'git_revision': _git_revision(),
+            'python': platform.python_version(),
+            'base_url': base_url if args.url else 'local',
+            'startup_seconds': round(startup_seconds, 3) if server is not None else None,
+            'elapsed_seconds': round(elapsed, 3),
+            'config': {
+                'concurrency': args.concurrency,
+                'duration': args.duration,
+                'requests': args.requests,
+                'rows': args.rows,
+                'numeric_columns': args.numeric_columns,
+                'categorical_columns': args.categorical_columns,
+                'dataset_bytes': len(dataset),
+                'page_size': args.page_size,
+                'mix': workload.mix,
+                'llm_latency': args.llm_latency,
+                'seed': args.seed
+            }
+        },
+        'endpoints': summarize(client.samples, elapsed)
+    }
+
+def main() -> None:
+    parser = argparse.ArgumentParser(prog="python -m loadtest", description="API 부하 테스트")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = subparsers.add_parser("run", help="부하 테스트 실행")
+    run_parser.add_argument("--url", help="이미 실행 중인 서버 주소 (없으면 로컬 서버를 띄움)")
+    run_parser.add_argument("--username", default="admin")
+    run_parser.add_argument("--password", default="admin123")
+    run_parser.add_argument("--concurrency", type=int, default=4)
+    run_parser.add_argument("--duration", type=float, default=30.0, help="실행 시간 (초)")
+    run_parser.add_argument("--requests", type=int, help="총 요청 수 (지정 시 duration 대신 사용)")
+    run_parser.add_argument("--rows", type=int, default=10_000)
+    run_parser.add_argument("--numeric-columns", type=int, default=8)
+    run_parser.add_argument("--categorical-columns", type=int, default=2)
+    run_parser.add_argument("--page-size", type=int, default=100)
+    run_parser.add_argument("--mix", help="작업 비율 (예: upload=1,process=2,paginate=8)")
+    run_parser.add_argument("--llm-latency", type=float, default=0.0, help="가짜 LLM 응답 지연 (초)")
+    run_parser.add_argument("--seed", type=int, default=42)
+    run_parser.add_argument("--output", help="결과 JSON 저장 경로 (없으면 표준 출력)")
+
+    compare_parser = subparsers.add_parser("compare", help="두 결과 JSON 비교")
+    compare_parser.add_argument("baseline")
+    compare_parser.add_argument("candidate")
+
+    args = parser.parse_args()
+
+    if args.command == "run":
+        if args.requests:
+            args.duration = None
+        result = run(args)
+    else:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+        with open(args.candidate, encoding="utf-8") as f:
+            candidate = json.load(f)
+        result = compare(baseline, candidate)
+
+    output = json.dumps(result, indent=2, ensure_ascii=False)
+    if getattr(args, "output", None):
+        os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(output)
+    else:
+        print(output)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+from collections import defaultdict
+from typing import Any, Dict, List, Tuple
+
+import numpy as np
+
+def summarize(samples: List[Tuple[str, float, bool]], elapsed: float) -> Dict[str, Any]:
+    """엔드포인트별 지연 시간 분위수(ms)와 처리량(req/s) 요약"""
+    grouped: Dict[str, List[Tuple[float, bool]]] = defaultdict(list)
+    for endpoint, latency, ok in samples:
+        grouped[endpoint].append((latency, ok))
+        grouped['_all'].append((latency, ok))
+
+    endpoints = {}
+    for endpoint, values in sorted(grouped.items()):
+        latencies = np.array([latency for latency, _ in values]) * 1000
+        p50, p95, p99 = np.percentile(latencies, [50, 95, 99])
+        endpoints[endpoint] = {
+            'count': len(values),
+            'errors': sum(1 for _, ok in values if not ok),
+            'p50_ms': round(float(p50), 2),
+            'p95_ms': round(float(p95), 2),
+            'p99_ms': round(float(p99), 2),
+            'mean_ms': round(float(latencies.mean()), 2),
+            'max_ms': round(float(latencies.max()), 2),
+            'throughput_rps': round(len(values) / elapsed, 2) if elapsed > 0 else None
+        }
+    return endpoints
+
+def compare(baseline: Dict[str, Any], candidate: Dict[str, Any]) -> Dict[str, Any]:
+    """두 실행 결과의 엔드포인트별 변화율 (양수면 candidate가 느리거나 처리량이 많음)"""
+    result = {}
+    for endpoint, new in candidate.get('endpoints', {}).items():
+        old = baseline.get('endpoints', {}).get(endpoint)
+        if old is None:
+            continue
+        result[endpoint] = {
+            metric: {
+                'baseline': old[metric],
+                'candidate': new[metric],
+                'change_pct': round((new[metric] - old[metric]) / old[metric] * 100, 1) if old[metric] else None
+            }
+            for metric in ('p50_ms', 'p95_ms', 'p99_ms', 'throughput_rps')
+            if old.get(metric) is not None and new.get(metric) is not None
+        }
+    return result
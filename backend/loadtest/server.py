@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+"""부하 테스트용 서버 실행 스크립트
+
+LLM 호출을 고정 응답을 돌려주는 가짜 모델로 바꾼 뒤 app.main:app을 reload 없이 실행한다.
+분석 응답 캐시는 끄므로(이전 실행의 디스크 캐시 포함) 같은 질문도 매번 에이전트와 LLM 세마포어를 거친다.
+    python -m loadtest.server --port 8765 --llm-latency 0.2
+"""
+import argparse
+import os
+import sys
+
+import uvicorn
+
+# backend 폴더를 Python path에 추가
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+
+# 가짜 LLM이 돌려줄 ReAct 형식 최종 답변
+FAKE_LLM_RESPONSE = "Thought: 데이터를 확인했습니다.\nFinal Answer: 부하 테스트용 고정 응답입니다."
+
+def install_fake_llm(latency: float = 0.0) -> None:
+    """/api/analysis에서 사용하는 분석 에이전트의 LLM을 가짜 모델로 교체"""
+    from langchain_core.language_models.fake_chat_models import FakeListChatModel
+    from app.api import analysis
+
+    os.environ.setdefault("OPENAI_API_KEY", "loadtest-fake-key")
+    agent = analysis.get_analysis_agent()
+    agent.llm = FakeListChatModel(responses=[FAKE_LLM_RESPONSE], sleep=latency or None)
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="부하 테스트용 API 서버")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--llm-latency", type=float, default=0.0, help="가짜 LLM 응답 지연 (초)")
+    args = parser.parse_args()
+
+    # 응답 캐시가 켜져 있으면 반복 질문이 캐시에서 바로 반환되어 가짜 LLM/에이전트 경로를 측정하지 못함
+    os.environ["LLM_CACHE_TTL_SECONDS"] = "0"
+    from app.main import app
+    install_fake_llm(args.llm_latency)
+
+    uvicorn.run(app, host=args.host, port=args.port, log_level="warning", access_log=False)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""서버 시작 시간 벤치마크
+
+1) 새 인터프리터에서 app.main import 시간과 시작 시점에 로드된 무거운 모듈을 확인하고
+2) uvicorn 프로세스를 띄운 시점부터 /health가 처음 200을 돌려줄 때까지의 시간을 측정한다.
+3) 같은 방법으로 /health 하나만 있는 빈 FastAPI 앱(프레임워크 하한)도 측정한다.
+
+중앙값이 예산(기본 500ms)을 넘거나 무거운 의존성이 시작 시점에 로드되면 종료 코드 1을 반환한다.
+느린 머신에서 빈 FastAPI 앱조차 예산을 넘으면 절대 예산은 판정할 수 없으므로,
+대신 하한 대비 앱이 추가한 시간이 --overhead-budget-ms(기본 250ms) 이하인지로 판정한다.
+    python -m loadtest.startup --runs 5 --budget-ms 500
+"""
+import argparse
+import json
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.error
+import urllib.request
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# 서버 시작 시점에 로드되면 안 되는 모듈 (첫 사용 시 로드)
+HEAVY_MODULES = [
+    "pandas", "numpy", "pyarrow", "sklearn", "imblearn", "scipy",
+    "plotly", "seaborn", "matplotlib", "langchain", "langchain_openai", "langchain_experimental"
+]
+
+_IMPORT_PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import app.main
+elapsed = (time.perf_counter() - start) * 1000
+print(json.dumps({"import_ms": elapsed, "heavy_modules": [name for name in HEAVY if name in sys.modules]}))
+"""
+
+# 프레임워크 하한 측정용 앱 (Python + uvicorn + FastAPI import와 라우트 1개)
+_FLOOR_APP = """
+from fastapi import FastAPI
+
+app = FastAPI()
+
+@app.get("/health")
+async def health_check():
+    return {"status": "healthy"}
+"""
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+def measure_import() -> dict:
+    """새 인터프리터에서 app.main import 시간 측정"""
+    code = f"HEAVY = {HEAVY_MODULES!r}\n" + _IMPORT_PROBE
+    output = subprocess.check_output([sys.executable, "-c", code], cwd=BACKEND_DIR, stderr=subprocess.DEVNULL)
+    return json.loads(output.decode().strip().splitlines()[-1])
+
+def measure_health_ready(app: str = "app.main:app", app_dir: str = BACKEND_DIR, timeout: float = 30.0) -> float:
+    """uvicorn 프로세스 시작부터 /health 첫 응답까지 걸린 시간 (ms)"""
+    port = _free_port()
+    url = f"http://127.0.0.1:{port}/health"
+    start = time.perf_counter()
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", app, "--port", str(port), "--log-level", "warning"],
+        cwd=app_dir, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+    try:
+        while time.perf_counter() - start < timeout:
+            try:
+                with urllib.request.urlopen(url, timeout=1) as response:
+                    if response.status == 200:
+                        return (time.perf_counter() - start) * 1000
+            except (urllib.error.URLError, OSError):
+                time.sleep(0.005)
+        raise RuntimeError(f"/health was not ready within {timeout}s")
+    finally:
+        server.terminate()
+        server.wait(timeout=10)
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="서버 시작 시간 벤치마크")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--budget-ms", type=float, default=float(os.getenv("STARTUP_BUDGET_MS", "500")))
+    parser.add_argument(
+        "--overhead-budget-ms", type=float, default=float(os.getenv("STARTUP_OVERHEAD_BUDGET_MS", "250"))
+    )
+    args = parser.parse_args()
+
+    imports = [measure_import() for _ in range(args.runs)]
+    with tempfile.TemporaryDirectory() as floor_dir:
+        with open(os.path.join(floor_dir, "floor_app.py"), "w") as f:
+            f.write(_FLOOR_APP)
+        # 머신 부하 변화의 영향을 줄이기 위해 앱과 하한을 번갈아 측정
+        ready_runs, floor_runs = [], []
+        for _ in range(args.runs):
+            ready_runs.append(measure_health_ready())
+            floor_runs.append(measure_health_ready("floor_app:app", floor_dir))
+    ready_ms = statistics.median(ready_runs)
+    floor_ms = statistics.median(floor_runs)
+    overhead_ms = ready_ms - floor_ms
+    heavy_modules = sorted({name for run in imports for name in run["heavy_modules"]})
+
+    # 빈 FastAPI 앱도 예산을 넘는 머신에서는 앱이 추가한 시간으로 판정
+    floor_within_budget = floor_ms <= args.budget_ms
+    if floor_within_budget:
+        timing_ok = ready_ms <= args.budget_ms
+    else:
+        timing_ok = overhead_ms <= args.overhead_budget_ms
+
+    result = {
+        "runs": args.runs,
+        "import_ms": round(statistics.median(run["import_ms"] for run in imports), 1),
+        "health_ready_ms": round(ready_ms, 1),
+        "framework_floor_ms": round(floor_ms, 1),
+        "app_overhead_ms": round(overhead_ms, 1),
+        "budget_ms": args.budget_ms,
+        "overhead_budget_ms": args.overhead_budget_ms,
+        "budget_basis": "absolute" if floor_within_budget else "overhead",
+        "heavy_modules_at_startup": heavy_modules,
+        "within_budget": timing_ok and not heavy_modules
+    }
+    print(json.dumps(result, indent=2))
+    sys.exit(0 if result["within_budget"] else 1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,223 @@
+import gzip
+import io
+import json
+import random
+import threading
+import time
+import urllib.error
+import urllib.parse
+import urllib.request
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+# 기본 작업 비율 (작업 이름 -> 가중치)
+DEFAULT_MIX = {
+    'upload': 1,
+    'process': 2,
+    'paginate': 8,
+    'visualize': 4,
+    'download': 1,
+    'analysis': 1
+}
+
+def parse_mix(spec: Optional[str]) -> Dict[str, float]:
+    """'upload=1,paginate=5' 형식의 작업 비율 파싱"""
+    if not spec:
+        return dict(DEFAULT_MIX)
+    mix = {}
+    for item in spec.split(','):
+        name, _, weight = item.partition('=')
+        name = name.strip()
+        if name not in DEFAULT_MIX:
+            raise ValueError(f"Unknown operation '{name}' (choose from {', '.join(DEFAULT_MIX)})")
+        mix[name] = float(weight or 1)
+    return mix
+
+def generate_dataset(rows: int, numeric_columns: int = 8, categorical_columns: int = 2, seed: int = 42) -> bytes:
+    """재현 가능한 합성 CSV 생성 (수치형 + 범주형, 약 2% 결측)"""
+    rng = np.random.default_rng(seed)
+    data = {}
+    for i in range(numeric_columns):
+        values = rng.normal(loc=i * 10, scale=1 + i, size=rows)
+        values[rng.random(rows) < 0.02] = np.nan
+        data[f"num_{i}"] = values
+    for i in range(categorical_columns):
+        data[f"cat_{i}"] = rng.choice([f"group_{j}" for j in range(5 + i)], size=rows)
+    return pd.DataFrame(data).to_csv(index=False).encode('utf-8')
+
+def _multipart(field: str, filename: str, content: bytes) -> Tuple[bytes, str]:
+    boundary = uuid.uuid4().hex
+    body = io.BytesIO()
+    body.write(f"--{boundary}\r\n".encode())
+    body.write(f'Content-Disposition: form-data; name="{field}"; filename="{filename}"\r\n'.encode())
+    body.write(b"Content-Type: text/csv\r\n\r\n")
+    body.write(content)
+    body.write(f"\r\n--{boundary}--\r\n".encode())
+    return body.getvalue(), f"multipart/form-data; boundary={boundary}"
+
+class ApiClient:
+    """urllib 기반의 간단한 API 클라이언트 (요청마다 지연 시간을 기록)"""
+
+    def __init__(self, base_url: str, timeout: float = 120.0):
+        self.base_url = base_url.rstrip('/')
+        self.timeout = timeout
+        self.token: Optional[str] = None
+        self.samples: List[Tuple[str, float, bool]] = []
+        self._lock = threading.Lock()
+
+    def request(
+        self,
+        endpoint: str,
+        method: str,
+        path: str,
+        body: Optional[bytes] = None,
+        content_type: Optional[str] = None,
+        record: bool = True
+    ) -> Tuple[int, bytes]:
+        headers = {"Accept-Encoding": "gzip"}
+        if self.token:
+            headers["Authorization"] = f"Bearer {self.token}"
+        if content_type:
+            headers["Content-Type"] = content_type
+
+        request = urllib.request.Request(self.base_url + path, data=body, method=method, headers=headers)
+        start = time.perf_counter()
+        try:
+            with urllib.request.urlopen(request, timeout=self.timeout) as response:
+                status, payload = response.status, response.read()
+                if response.headers.get("Content-Encoding") == "gzip":
+                    payload = gzip.decompress(payload)
+        except urllib.error.HTTPError as e:
+            status, payload = e.code, e.read()
+        except (urllib.error.URLError, OSError) as e:
+            status, payload = 0, str(e).encode()
+        elapsed = time.perf_counter() - start
+
+        if record:
+            with self._lock:
+                self.samples.append((endpoint, elapsed, 200 <= status < 400))
+        return status, payload
+
+    def json(self, endpoint: str, method: str, path: str, payload: Dict[str, Any], record: bool = True):
+        return self.request(endpoint, method, path, json.dumps(payload).encode(), "application/json", record)
+
+    def login(self, username: str, password: str) -> None:
+        status, payload = self.json('login', 'POST', '/api/auth/login',
+                                    {'username': username, 'password': password}, record=False)
+        if status != 200:
+            raise RuntimeError(f"Login failed ({status}): {payload[:200]!r}")
+        self.token = json.loads(payload)['access_token']
+
+    def wait_until_ready(self, timeout: float = 60.0) -> float:
+        """/health가 응답할 때까지 대기하고 걸린 시간 반환"""
+        start = time.perf_counter()
+        while time.perf_counter() - start < timeout:
+            status, _ = self.request('health', 'GET', '/health', record=False)
+            if status == 200:
+                return time.perf_counter() - start
+            time.sleep(0.1)
+        raise RuntimeError(f"Server at {self.base_url} did not become ready in {timeout}s")
+
+class Workload:
+    """업로드/처리/페이징/시각화/다운로드/분석 요청을 섞어서 실행"""
+
+    def __init__(self, client: ApiClient, dataset: bytes, mix: Dict[str, float], page_size: int = 100, seed: int = 42):
+        self.client = client
+        self.dataset = dataset
+        self.mix = mix
+        self.page_size = page_size
+        self.seed = seed
+        self.columns = pd.read_csv(io.BytesIO(dataset), nrows=5).columns.tolist()
+        self.numeric_columns = [column for column in self.columns if column.startswith('num_')]
+        self.total_rows = 0
+        self.operations: Dict[str, Callable[[random.Random], None]] = {
+            'upload': self.upload,
+            'process': self.process,
+            'paginate': self.paginate,
+            'visualize': self.visualize,
+            'download': self.download,
+            'analysis': self.analysis
+        }
+
+    def setup(self) -> None:
+        """측정 전에 데이터 업로드, 처리, 분석 세션을 한 번씩 준비"""
+        rng = random.Random(self.seed)
+        for name in ('upload', 'process'):
+            self.operations[name](rng)
+        if 'analysis' in self.mix:
+            body, content_type = _multipart('file', 'loadtest.csv', self.dataset)
+            status, payload = self.client.request('analysis_upload', 'POST', '/api/analysis/upload', body, content_type, record=False)
+            if status != 200:
+                raise RuntimeError(f"Analysis upload failed ({status}): {payload[:200]!r}")
+        self.client.samples.clear()
+
+    def upload(self, rng: random.Random) -> None:
+        body, content_type = _multipart('file', 'loadtest.csv', self.dataset)
+        self.client.request('upload', 'POST', '/api/data/upload', body, content_type)
+
+    def process(self, rng: random.Random) -> None:
+        status, payload = self.client.json('process', 'POST', '/api/data/process', {
+            'preprocessing_config': {'missing_strategy': 'mean', 'outlier_strategy': 'none'},
+            'augmentation_config': {
+                'method': rng.choice(['gaussian_copula', 'bayesian_network']),
+                'augmentation_ratio': rng.choice([0.5, 1.0])
+            }
+        })
+        if status == 200:
+            self.total_rows = json.loads(payload).get('augmented_rows', self.total_rows)
+
+    def paginate(self, rng: random.Random) -> None:
+        pages = max(1, self.total_rows // self.page_size)
+        fmt = rng.choice(['records', 'columnar'])
+        self.client.request(
+            f'paginate_{fmt}', 'GET',
+            f'/api/data/processed?page={rng.randrange(pages)}&page_size={self.page_size}&format={fmt}'
+        )
+
+    def visualize(self, rng: random.Random) -> None:
+        chart_type = rng.choice(['distribution', 'correlation', 'scatter'])
+        params = {'column_name': rng.choice(self.numeric_columns), 'chart_type': chart_type}
+        if chart_type == 'scatter':
+            params['y_column'] = rng.choice(self.numeric_columns)
+        self.client.request(f'visualize_{chart_type}', 'GET', '/api/data/visualize?' + urllib.parse.urlencode(params))
+
+    def download(self, rng: random.Random) -> None:
+        self.client.request('download', 'GET', '/api/data/download')
+
+    def analysis(self, rng: random.Random) -> None:
+        # 결측값 질문은 LLM 없이 바로 답하는 경로, 나머지는 가짜 LLM 에이전트 경로
+        query = rng.choice([
+            "데이터의 전체적인 요약을 보여주세요",
+            "이 데이터에서 얻을 수 있는 인사이트를 설명해주세요",
+            "결측값이 있는 컬럼들을 알려주세요"
+        ])
+        body = urllib.parse.urlencode({'query': query}).encode()
+        self.client.request('analysis_query', 'POST', '/api/analysis/query', body, "application/x-www-form-urlencoded")
+
+    def run(self, concurrency: int, duration: Optional[float] = None, requests: Optional[int] = None) -> float:
+        """concurrency개 스레드로 duration초 동안(또는 requests개까지) 실행하고 경과 시간 반환"""
+        names = list(self.mix)
+        weights = [self.mix[name] for name in names]
+        counter = iter(range(requests)) if requests else None
+        counter_lock = threading.Lock()
+        deadline = time.perf_counter() + duration if duration else None
+
+        def worker(worker_id: int) -> None:
+            rng = random.Random(self.seed + worker_id)
+            while True:
+                if deadline is not None and time.perf_counter() >= deadline:
+                    return
+                if counter is not None:
+                    with counter_lock:
+                        if next(counter, None) is None:
+                            return
+                self.operations[rng.choices(names, weights)[0]](rng)
+
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            list(executor.map(worker, range(concurrency)))
+        return time.perf_counter() - start
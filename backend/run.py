@@ -1,5 +1,11 @@
 #!/usr/bin/env python3
+"""API 서버 실행
 
+    python run.py                      # 개발 모드 (자동 리로드, 단일 워커)
+    python run.py --workers 4          # 운영 모드 (리로드 없음, 워커 간 상태는 SQLite로 공유)
+"""
+
+import argparse
 import uvicorn
 import sys
 import os
@@ -8,11 +14,36 @@ import os
 current_dir = os.path.dirname(os.path.abspath(__file__))
 sys.path.insert(0, current_dir)
 
+def main():
+    parser = argparse.ArgumentParser(description="데이터 증강 엔진 API 서버")
+    parser.add_argument("--host", default=os.getenv("HOST", "0.0.0.0"))
+    parser.add_argument("--port", type=int, default=int(os.getenv("PORT", "8000")))
+    parser.add_argument("--workers", type=int, default=int(os.getenv("WEB_CONCURRENCY", "1")),
+                        help="워커 프로세스 수 (2 이상이면 리로드 없이 실행)")
+    parser.add_argument("--log-level", default="info")
+    args = parser.parse_args()
+
+    if args.workers > 1:
+        # 워커 프로세스는 환경 변수를 물려받으므로 여기서 공유 상태 저장소를 지정
+        os.environ.setdefault("STATE_BACKEND", "sqlite")
+        if os.environ["STATE_BACKEND"] == "memory":
+            parser.error("STATE_BACKEND=memory cannot be shared between workers (use sqlite)")
+        uvicorn.run(
+            "app.main:app",
+            host=args.host,
+            port=args.port,
+            workers=args.workers,
+            reload=False,
+            log_level=args.log_level
+        )
+    else:
+        uvicorn.run(
+            "app.main:app",
+            host=args.host,
+            port=args.port,
+            reload=True,
+            log_level=args.log_level
+        )
+
 if __name__ == "__main__":
-    uvicorn.run(
-        "app.main:app",
-        host="0.0.0.0",
-        port=8000,
-        reload=True,
-        log_level="info"
-    )
\ No newline at end of file
+    main()
@@ -0,0 +1,54 @@
+import sys
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional
+
+try:
+    import resource
+except ImportError:  # Windows에는 resource 모듈이 없음
+    resource = None
+
+def peak_rss_bytes() -> Optional[int]:
+    """프로세스 최대 RSS (바이트, 측정할 수 없으면 None)"""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux는 KB, macOS는 바이트 단위
+    return peak if sys.platform == 'darwin' else peak * 1024
+
+class StageTimer:
+    """
+    파이프라인 단계별 소요 시간, 처리 행 수, 최대 메모리 증가량을 기록하는 클래스
+    메모리 증가량은 단계 동안 프로세스 최대 RSS가 늘어난 양 (이전 최대치를 넘은 부분만 측정됨)
+    """
+
+    def __init__(self):
+        self.stages: List[Dict[str, Any]] = []
+
+    @contextmanager
+    def stage(self, name: str, rows: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+        """with 블록을 한 단계로 기록 (rows는 블록 안에서 record['rows']로 갱신 가능)"""
+        record = {'stage': name, 'rows': rows}
+        peak_before = peak_rss_bytes()
+        start = time.perf_counter()
+        try:
+            yield record
+        finally:
+            record['duration'] = time.perf_counter() - start
+            peak_after = peak_rss_bytes()
+            record['peak_memory_delta_bytes'] = (
+                peak_after - peak_before if peak_before is not None and peak_after is not None else None
+            )
+            self.stages.append(record)
+
+    def summary(self) -> List[Dict[str, Any]]:
+        """API 응답용 단계별 요약 (초 단위는 밀리초로 반올림)"""
+        return [
+            {
+                'stage': record['stage'],
+                'duration_ms': round(record['duration'] * 1000, 2),
+                'rows': record['rows'],
+                'peak_memory_delta_bytes': record['peak_memory_delta_bytes']
+            }
+            for record in self.stages
+        ]
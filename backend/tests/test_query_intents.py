@@ -0,0 +1,67 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.services.query_intents import match_intent, answer_intent
+
+@pytest.fixture
+def df():
+    return pd.DataFrame({
+        'age': [10, 20, 30, 40],
+        'price': [100.0, 200.0, np.nan, 400.0],
+        'segment': ['a', 'b', 'a', 'b'],
+        'num_1': [1, 2, 3, 4]
+    })
+
+@pytest.mark.parametrize("query", [
+    "30세 이상 고객 age 평균",
+    "age가 20보다 큰 고객의 price 평균",
+    "average price where age > 20",
+    "price mean for rows with age greater than 15",
+    "종합적으로 price를 분석해줘",
+    "price 통합 결과 알려줘",
+    "show me the price distribution with max bins",
+    "결측값이 있는 행을 제거하면 몇 행이 남나요?",
+    "결측값을 평균으로 채우면 price 평균은?",
+    "age와 price의 상관관계 평균",
+])
+def test_filtered_or_ambiguous_queries_go_to_agent(df, query):
+    assert match_intent(query, df) is None
+
+def test_filtered_mean_is_not_answered_with_whole_column_mean(df):
+    # 전체 평균(25)으로 답하지 않아야 함 (30 이상 필터 평균은 35)
+    assert df['age'].mean() == 25
+    assert match_intent("30세 이상 고객 age 평균", df) is None
+
+@pytest.mark.parametrize("query, aggregations", [
+    ("age 평균", ['mean']),
+    ("age의 평균과 최댓값을 알려주세요", ['mean', 'max']),
+    ("age 컬럼의 최솟값은?", ['min']),
+    ("average age", ['mean']),
+    ("mean and max of age", ['max', 'mean']),
+    ("num_1의 합계", ['sum']),
+])
+def test_adjacent_aggregation(df, query, aggregations):
+    intent = match_intent(query, df)
+    assert intent is not None and intent['intent'] == 'aggregate'
+    assert sorted(intent['aggregations']) == sorted(aggregations)
+
+def test_aggregate_answer_values(df):
+    answer = answer_intent(df, match_intent("price의 평균과 최댓값", df))
+    assert answer['values'] == {'mean': pytest.approx(700 / 3), 'max': 400.0}
+
+@pytest.mark.parametrize("query", [
+    "결측값이 있는 컬럼들을 알려주세요",
+    "결측값 개수는?",
+    "how many missing values are there",
+])
+def test_missing_count_and_column_questions(df, query):
+    intent = match_intent(query, df)
+    assert intent is not None and intent['intent'] == 'missing'
+
+def test_group_by_and_unique(df):
+    assert match_intent("segment별 price의 평균을 비교해주세요", df) == {
+        'intent': 'group_by', 'group_column': 'segment', 'column': 'price', 'aggregation': 'mean'
+    }
+    assert match_intent("max price by segment", df)['aggregation'] == 'max'
+    assert match_intent("segment의 고유값 개수를 알려주세요", df) == {'intent': 'unique', 'column': 'segment'}
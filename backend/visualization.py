@@ -1,14 +1,57 @@
 import pandas as pd
 import numpy as np
-import plotly.express as px
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
-import seaborn as sns
-import matplotlib.pyplot as plt
-from typing import Optional, List, Tuple
+from typing import Optional, List
 import warnings
 warnings.filterwarnings('ignore')
 
+from correlation import CorrelationEngine
+from downsampling import Downsampler
+
+def _finite_values(series: pd.Series) -> np.ndarray:
+    """결측/무한대를 제외한 수치 배열"""
+    values = series.to_numpy(dtype=np.float64, na_value=np.nan)
+    return values[np.isfinite(values)]
+
+def _shared_bin_edges(arrays: List[np.ndarray], bins: int) -> np.ndarray:
+    """여러 배열을 모두 포함하는 공통 히스토그램 구간 경계"""
+    non_empty = [values for values in arrays if len(values) > 0]
+    if not non_empty:
+        return np.linspace(0.0, 1.0, bins + 1)
+    
+    low = min(values.min() for values in non_empty)
+    high = max(values.max() for values in non_empty)
+    if low == high:
+        low, high = low - 0.5, high + 0.5
+    return np.linspace(low, high, bins + 1)
+
+def _histogram_bar(values: np.ndarray, edges: np.ndarray, name: str, color: str) -> go.Bar:
+    """미리 집계한 히스토그램을 막대 차트로 변환"""
+    counts, _ = np.histogram(values, bins=edges)
+    return go.Bar(
+        x=(edges[:-1] + edges[1:]) / 2,
+        y=counts,
+        width=np.diff(edges),
+        name=name,
+        opacity=0.7,
+        marker_color=color
+    )
+
+def _box_statistics(values: np.ndarray) -> dict:
+    """박스 플롯용 사분위수와 수염 (1.5 IQR 이내의 최소/최대값)"""
+    q1, median, q3 = np.percentile(values, [25, 50, 75])
+    iqr = q3 - q1
+    inside = values[(values >= q1 - 1.5 * iqr) & (values <= q3 + 1.5 * iqr)]
+    return {
+        'q1': [q1],
+        'median': [median],
+        'q3': [q3],
+        'lowerfence': [inside.min()],
+        'upperfence': [inside.max()],
+        'mean': [values.mean()]
+    }
+
 class DataVisualizer:
     """
     데이터 시각화를 담당하는 클래스
@@ -29,7 +72,16 @@ class DataVisualizer:
         column: str,
         bins: int = 50
     ) -> go.Figure:
-        """원본과 증강된 데이터의 분포 비교 플롯"""
+        """원본과 증강된 데이터의 분포 비교 플롯
+
+        히스토그램과 박스 플롯은 서버에서 미리 집계해서 전송하므로
+        응답 크기가 행 수와 무관하게 bins 수에 비례한다.
+        """
+        
+        # 수치형이 아니면 범주형 비교 차트로 대체
+        if not pd.api.types.is_numeric_dtype(original_data[column]) or \
+                pd.api.types.is_bool_dtype(original_data[column]):
+            return self.plot_categorical_comparison(original_data, augmented_data, column)
         
         fig = make_subplots(
             rows=2, cols=2,
@@ -39,56 +91,47 @@ class DataVisualizer:
                 '박스 플롯 비교',
                 '통계 요약'
             ],
-            specs=[[{"type": "histogram"}, {"type": "histogram"}],
-                   [{"type": "box"}, {"type": "table"}]]
+            specs=[[{"type": "xy"}, {"type": "xy"}],
+                   [{"type": "xy"}, {"type": "table"}]]
         )
         
-        # 원본 데이터 히스토그램
-        fig.add_trace(
-            go.Histogram(
-                x=original_data[column],
-                nbinsx=bins,
-                name='원본',
-                opacity=0.7,
-                marker_color='blue'
-            ),
-            row=1, col=1
-        )
-        
-        # 증강된 데이터 히스토그램 (새로 추가된 부분만)
+        # 증강된 데이터 (새로 추가된 부분만)
         original_len = len(original_data)
         new_data = augmented_data.iloc[original_len:][column]
         
-        fig.add_trace(
-            go.Histogram(
-                x=new_data,
-                nbinsx=bins,
-                name='증강된 부분',
-                opacity=0.7,
-                marker_color='red'
-            ),
-            row=1, col=2
-        )
+        original_values = _finite_values(original_data[column])
+        new_values = _finite_values(new_data)
+        
+        # 두 히스토그램이 같은 구간을 사용하도록 구간 경계 공유
+        edges = _shared_bin_edges([original_values, new_values], bins)
         
-        # 박스 플롯
+        # 원본 데이터 히스토그램
         fig.add_trace(
-            go.Box(
-                y=original_data[column],
-                name='원본',
-                marker_color='blue'
-            ),
-            row=2, col=1
+            _histogram_bar(original_values, edges, name='원본', color='blue'),
+            row=1, col=1
         )
         
+        # 증강된 데이터 히스토그램
         fig.add_trace(
-            go.Box(
-                y=new_data,
-                name='증강된 부분',
-                marker_color='red'
-            ),
-            row=2, col=1
+            _histogram_bar(new_values, edges, name='증강된 부분', color='red'),
+            row=1, col=2
         )
         
+        # 박스 플롯 (사분위수와 수염만 전송)
+        for values, name, color in [(original_values, '원본', 'blue'), (new_values, '증강된 부분', 'red')]:
+            if len(values) == 0:
+                continue
+            fig.add_trace(
+                go.Box(
+                    name=name,
+                    x=[name],
+                    marker_color=color,
+                    boxpoints=False,
+                    **_box_statistics(values)
+                ),
+                row=2, col=1
+            )
+        
         # 통계 요약 테이블
         original_stats = original_data[column].describe()
         augmented_stats = new_data.describe()
@@ -136,23 +179,47 @@ class DataVisualizer:
     def plot_correlation_heatmap(
         self, 
         data: pd.DataFrame, 
-        title: str = "상관관계 히트맵"
+        title: str = "상관관계 히트맵",
+        max_columns: int = 50
     ) -> go.Figure:
         """상관관계 히트맵"""
         
-        numeric_data = data.select_dtypes(include=[np.number])
-        corr_matrix = numeric_data.corr()
+        columns, corr_matrix = CorrelationEngine().compute(data)
+        return self.plot_correlation_matrix(columns, corr_matrix, title, max_columns)
+    
+    def plot_correlation_matrix(
+        self,
+        columns: List[str],
+        corr_matrix: np.ndarray,
+        title: str = "상관관계 히트맵",
+        max_columns: int = 50,
+        annotate_max_columns: int = 20
+    ) -> go.Figure:
+        """미리 계산된 상관계수 행렬로 히트맵 생성
+
+        컬럼이 max_columns보다 많으면 상관관계가 강한 컬럼만 군집 순서로 표시하고,
+        셀 텍스트는 annotate_max_columns 이하일 때만 표시한다.
+        """
+        
+        columns, corr_matrix = CorrelationEngine.truncate(columns, corr_matrix, max_columns)
+        z = np.round(corr_matrix.astype(np.float64), 3)
+        
+        heatmap_kwargs = {}
+        if len(columns) <= annotate_max_columns:
+            heatmap_kwargs = dict(
+                text=np.round(z, 2),
+                texttemplate="%{text}",
+                textfont={"size": 10}
+            )
         
         fig = go.Figure(data=go.Heatmap(
-            z=corr_matrix.values,
-            x=corr_matrix.columns,
-            y=corr_matrix.columns,
+            z=z,
+            x=columns,
+            y=columns,
             colorscale='RdBu',
             zmid=0,
-            text=corr_matrix.round(2).values,
-            texttemplate="%{text}",
-            textfont={"size": 10},
-            hoverongaps=False
+            hoverongaps=False,
+            **heatmap_kwargs
         ))
         
         fig.update_layout(
@@ -164,6 +231,34 @@ class DataVisualizer:
         
         return fig
     
+    def plot_top_correlations(
+        self,
+        pairs: List[dict],
+        title: str = "상관관계가 강한 컬럼 쌍"
+    ) -> go.Figure:
+        """상관관계가 강한 컬럼 쌍 막대 차트"""
+        
+        labels = [f"{pair['column_1']} - {pair['column_2']}" for pair in pairs]
+        values = [pair['correlation'] for pair in pairs]
+        
+        fig = go.Figure(data=go.Bar(
+            x=values[::-1],
+            y=labels[::-1],
+            orientation='h',
+            marker_color=['red' if value > 0 else 'blue' for value in values[::-1]],
+            text=[f"{value:.2f}" for value in values[::-1]],
+            textposition='auto'
+        ))
+        
+        fig.update_layout(
+            title=title,
+            template=self.theme,
+            height=max(400, 25 * len(pairs)),
+            xaxis=dict(range=[-1, 1])
+        )
+        
+        return fig
+    
     def plot_categorical_comparison(
         self,
         original_data: pd.DataFrame,
@@ -172,13 +267,10 @@ class DataVisualizer:
     ) -> go.Figure:
         """범주형 데이터의 분포 비교"""
         
-        # 원본 데이터 분포
-        original_counts = original_data[column].value_counts()
-        
-        # 증강된 부분의 분포
-        original_len = len(original_data)
-        new_data = augmented_data.iloc[original_len:]
-        new_counts = new_data[column].value_counts()
+        # 원본 / 증강된 부분의 분포
+        summary = self.summarize_categorical(original_data, augmented_data, column)
+        original_counts = pd.Series(summary['original_counts'], dtype='int64')
+        new_counts = pd.Series(summary['synthetic_counts'], dtype='int64')
         
         # 비교 차트
         fig = make_subplots(
@@ -222,9 +314,11 @@ class DataVisualizer:
     ) -> go.Figure:
         """데이터 품질 지표 비교"""
         
+        summary = self.summarize_data_quality(original_data, augmented_data)
+        
         # 결측값 비율
-        original_missing = (original_data.isnull().sum() / len(original_data) * 100)
-        augmented_missing = (augmented_data.isnull().sum() / len(augmented_data) * 100)
+        original_missing = pd.Series(summary['missing_ratio']['original'])
+        augmented_missing = pd.Series(summary['missing_ratio']['augmented'])
         
         fig = make_subplots(
             rows=2, cols=2,
@@ -259,7 +353,7 @@ class DataVisualizer:
         )
         
         # 데이터 타입 분포
-        original_types = original_data.dtypes.value_counts()
+        original_types = pd.Series(summary['dtype_counts'])
         fig.add_trace(
             go.Pie(
                 labels=original_types.index.astype(str),
@@ -271,7 +365,7 @@ class DataVisualizer:
         
         # 데이터 크기 비교
         sizes = ['원본', '증강 후']
-        counts = [len(original_data), len(augmented_data)]
+        counts = [summary['original_rows'], summary['augmented_rows']]
         
         fig.add_trace(
             go.Bar(
@@ -293,6 +387,210 @@ class DataVisualizer:
         
         return fig
     
+    def plot_scatter_comparison(
+        self,
+        original_data: pd.DataFrame,
+        augmented_data: pd.DataFrame,
+        x_column: str,
+        y_column: str,
+        max_points: int = 5000
+    ) -> go.Figure:
+        """원본과 증강된 부분의 산점도 (원본/증강 비율을 유지한 층화 샘플)"""
+        
+        original_len = len(original_data)
+        x_values = augmented_data[x_column].to_numpy()
+        y_values = augmented_data[y_column].to_numpy()
+        
+        # 결측이 없는 행만 대상으로 원본/증강 여부를 그룹으로 층화 샘플링
+        valid = np.flatnonzero(pd.notna(x_values) & pd.notna(y_values))
+        sampled = valid[Downsampler(max_points).stratified_indices(valid >= original_len)]
+        is_synthetic = sampled >= original_len
+        
+        fig = go.Figure()
+        for rows, name, color in [(sampled[~is_synthetic], '원본', 'blue'), (sampled[is_synthetic], '증강된 부분', 'red')]:
+            fig.add_trace(go.Scattergl(
+                x=x_values[rows],
+                y=y_values[rows],
+                mode='markers',
+                name=name,
+                marker=dict(color=color, size=4, opacity=0.5)
+            ))
+        
+        fig.update_layout(
+            title=f"{x_column} - {y_column} 산점도 비교",
+            template=self.theme,
+            xaxis_title=x_column,
+            yaxis_title=y_column,
+            height=600
+        )
+        
+        return fig
+    
+    def plot_line(
+        self,
+        data: pd.DataFrame,
+        column: str,
+        max_points: int = 5000
+    ) -> go.Figure:
+        """행 순서에 따른 값 변화 선 그래프 (LTTB로 점 개수 제한)"""
+        
+        values = data[column].to_numpy(dtype=np.float64, na_value=np.nan)
+        x = np.flatnonzero(np.isfinite(values))
+        y = values[x]
+        
+        selected = Downsampler(max_points).lttb_indices(x, y)
+        
+        fig = go.Figure(data=go.Scattergl(
+            x=x[selected],
+            y=y[selected],
+            mode='lines',
+            name=column
+        ))
+        
+        fig.update_layout(
+            title=f"{column} 추세",
+            template=self.theme,
+            xaxis_title='행 번호',
+            yaxis_title=column,
+            height=500
+        )
+        
+        return fig
+    
+    def summarize_categorical(
+        self,
+        original_data: pd.DataFrame,
+        augmented_data: pd.DataFrame,
+        column: str,
+        top_n: Optional[int] = None
+    ) -> dict:
+        """원본과 증강된 부분의 범주별 빈도 (top_n 지정 시 원본 기준 상위 범주만)"""
+        
+        original_counts = original_data[column].value_counts()
+        new_counts = augmented_data.iloc[len(original_data):][column].value_counts()
+        
+        other = {}
+        if top_n is not None and len(original_counts) > top_n:
+            categories = original_counts.index[:top_n]
+            other = {
+                'original': int(original_counts.iloc[top_n:].sum()),
+                'synthetic': int(new_counts[~new_counts.index.isin(categories)].sum())
+            }
+            original_counts = original_counts.iloc[:top_n]
+            new_counts = new_counts[new_counts.index.isin(categories)]
+        
+        return {
+            'kind': 'categorical',
+            'original_counts': {str(k): int(v) for k, v in original_counts.items()},
+            'synthetic_counts': {str(k): int(v) for k, v in new_counts.items()},
+            'other_counts': other
+        }
+    
+    def summarize_numeric(
+        self,
+        original_values: np.ndarray,
+        new_values: np.ndarray,
+        bins: int = 30
+    ) -> dict:
+        """원본과 증강된 부분의 공통 구간 히스토그램"""
+        
+        original_values = original_values[np.isfinite(original_values)]
+        new_values = new_values[np.isfinite(new_values)]
+        edges = _shared_bin_edges([original_values, new_values], bins)
+        
+        return {
+            'kind': 'numeric',
+            'bin_edges': edges,
+            'original_counts': np.histogram(original_values, bins=edges)[0],
+            'synthetic_counts': np.histogram(new_values, bins=edges)[0]
+        }
+    
+    def summarize_data_quality(
+        self,
+        original_data: pd.DataFrame,
+        augmented_data: pd.DataFrame
+    ) -> dict:
+        """결측값 비율, 데이터 타입 분포, 데이터 크기 요약"""
+        
+        original_missing = (original_data.isnull().sum() / len(original_data) * 100)
+        augmented_missing = (augmented_data.isnull().sum() / len(augmented_data) * 100)
+        original_types = original_data.dtypes.astype(str).value_counts()
+        
+        return {
+            'missing_ratio': {
+                'original': original_missing.to_dict(),
+                'augmented': augmented_missing.to_dict()
+            },
+            'dtype_counts': {str(k): int(v) for k, v in original_types.items()},
+            'original_rows': len(original_data),
+            'augmented_rows': len(augmented_data)
+        }
+    
+    def summarize_all_columns(
+        self,
+        original_data: pd.DataFrame,
+        augmented_data: pd.DataFrame,
+        bins: int = 30,
+        top_n: int = 20,
+        block_size: int = 16,
+        max_workers: Optional[int] = None
+    ) -> dict:
+        """모든 컬럼의 분포 요약을 컬럼 블록 단위로 병렬 계산
+
+        수치형 컬럼은 블록마다 한 번에 numpy 배열로 변환해서 히스토그램을 계산하고,
+        범주형 컬럼은 범주별 빈도를 계산한다.
+        """
+        
+        from concurrent.futures import ThreadPoolExecutor
+        
+        original_len = len(original_data)
+        new_data = augmented_data.iloc[original_len:]
+        
+        numeric_columns = [
+            column for column in augmented_data.columns
+            if pd.api.types.is_numeric_dtype(augmented_data[column])
+            and not pd.api.types.is_bool_dtype(augmented_data[column])
+            and column in original_data.columns
+            and pd.api.types.is_numeric_dtype(original_data[column])
+        ]
+        categorical_columns = [
+            column for column in augmented_data.columns
+            if column not in numeric_columns and column in original_data.columns
+        ]
+        
+        def summarize_numeric_block(columns: List[str]) -> dict:
+            original_block = original_data[columns].to_numpy(dtype=np.float64, na_value=np.nan)
+            new_block = new_data[columns].to_numpy(dtype=np.float64, na_value=np.nan)
+            return {
+                column: self.summarize_numeric(original_block[:, i], new_block[:, i], bins)
+                for i, column in enumerate(columns)
+            }
+        
+        def summarize_categorical_block(columns: List[str]) -> dict:
+            return {
+                column: self.summarize_categorical(original_data, augmented_data, column, top_n)
+                for column in columns
+            }
+        
+        tasks = []
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for start in range(0, len(numeric_columns), block_size):
+                tasks.append(executor.submit(summarize_numeric_block, numeric_columns[start:start + block_size]))
+            for start in range(0, len(categorical_columns), block_size):
+                tasks.append(executor.submit(summarize_categorical_block, categorical_columns[start:start + block_size]))
+            tasks.append(executor.submit(self.summarize_data_quality, original_data, augmented_data))
+            
+            results = [task.result() for task in tasks]
+        
+        summaries = {}
+        for result in results[:-1]:
+            summaries.update(result)
+        
+        return {
+            'columns': {column: summaries[column] for column in augmented_data.columns if column in summaries},
+            'quality': results[-1]
+        }
+    
     def create_summary_dashboard(
         self,
         original_data: pd.DataFrame,